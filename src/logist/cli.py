@@ -16,7 +16,7 @@ import click
 from logist import workspace_utils  # Import the new module
 from logist.core_engine import LogistEngine
 from logist.services import JobManagerService
-from logist.job_state import JobStateError, load_job_manifest, get_current_state, update_job_manifest, transition_state, JobStates
+from logist.job_state import JobStateError, load_job_manifest, save_job_manifest, get_current_state, update_job_manifest, transition_state, JobStates
 from logist.job_processor import (
     execute_llm_with_cline, handle_execution_error, validate_evidence_files, JobProcessorError,
     save_latest_outcome, prepare_outcome_for_attachments, enhance_context_with_previous_outcome
@@ -175,12 +175,19 @@ def get_job_dir(ctx, job_id: str) -> str | None:
     is_flag=True,
     help="Enable debug output for detailed operation logging.",
 )
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Only show warnings and errors while executing jobs (the default when output is not a terminal).",
+)
 @click.pass_context
-def main(ctx, enhance, jobs_dir, debug):
+def main(ctx, enhance, jobs_dir, debug, quiet):
     """Logist - Sophisticated Agent Orchestration."""
     ctx.ensure_object(dict)
     ctx.obj["JOBS_DIR"] = jobs_dir
     ctx.obj["DEBUG"] = debug
+    ctx.obj["QUIET"] = quiet
     ctx.obj["ENHANCE"] = enhance
     ctx.obj["ENGINE"] = engine # Add the LogistEngine instance to context
     click.echo(f"⚓ Welcome to Logist - Using jobs directory: {jobs_dir}")
@@ -496,13 +503,15 @@ def config_job(ctx, job_id: str | None, objective: str, details: str, acceptance
 @click.option("--resume", is_flag=True, help="Resume from last checkpoint")
 @click.option("--runner", help="Override runner for this execution (podman, docker, kubernetes, direct)")
 @click.option("--agent", help="Override agent provider for this execution (cline-cli, aider-chat, claude-code, etc.)")
+@click.option("--no-pause", is_flag=True, help="Do not pause between steps (pauses only happen on a terminal)")
 @click.pass_context
-def run(ctx, job_id: str | None, model: str, resume: bool, runner: str, agent: str):
+def run(ctx, job_id: str | None, model: str, resume: bool, runner: str, agent: str, no_pause: bool):
     """Execute a job continuously until completion.
 
     Runner and agent can be overridden for this execution without modifying the job manifest.
     """
     click.echo("🎯 Executing 'logist job run'")
+    ctx.obj["NO_PAUSE"] = no_pause
 
     # Store runtime overrides in context for engine access
     if runner:
@@ -2266,9 +2275,7 @@ def activate_job(ctx, job_id: str | None, rank: int):
             click.echo(f"   📍 Initialized job with default single phase")
 
             # Save the updated manifest with phases before updating status/phase
-            manifest_path = os.path.join(job_dir, "job_manifest.json")
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            save_job_manifest(job_dir, manifest)
 
         # Set current_phase to first phase if not already set
         if manifest.get("current_phase") is None:
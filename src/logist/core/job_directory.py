@@ -12,10 +12,10 @@ import os
 import json
 import shutil
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterator
 from pathlib import Path
 
-from ..job_state import JobStateError
+from ..job_state import JobStateError, save_job_manifest
 from .locking import JobLockManager
 
 
@@ -89,11 +89,8 @@ class JobDirectoryManager:
             job_dir.mkdir(parents=True)
 
             # Create initial job manifest
-            manifest_path = job_dir / "job_manifest.json"
             manifest = self._create_initial_manifest(job_id, job_config)
-
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            save_job_manifest(job_dir_str, manifest)
 
             # Update jobs index (thread-safe)
             self._add_job_to_index(job_id, manifest)
@@ -175,8 +172,22 @@ class JobDirectoryManager:
         Returns:
             List of job information dictionaries
         """
+        return list(self.iter_jobs(status_filter))
+
+    def iter_jobs(self, status_filter: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield jobs with optional status filtering.
+
+        Manifests are only read as the caller advances, so consumers that stop
+        early avoid touching the remaining jobs.
+
+        Args:
+            status_filter: Optional status to filter by
+
+        Yields:
+            Job information dictionaries
+        """
         index_data = self._load_jobs_index()
-        jobs = []
 
         for job_id, job_dir_path in index_data["jobs"].items():
             # Load manifest to get status
@@ -197,13 +208,35 @@ class JobDirectoryManager:
             # Verify directory still exists
             job_dir = Path(job_dir_path)
             if job_dir.exists():
-                jobs.append({
+                yield {
                     "job_id": job_id,
                     "directory": job_dir_path,
                     "status": status
-                })
+                }
 
-        return jobs
+    def iter_job_directories(self) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the job directories registered in the jobs index.
+
+        Unlike iter_jobs(), no manifests are read; callers decide which ones
+        they need to inspect.
+
+        Yields:
+            (job_id, job_directory) tuples
+        """
+        yield from self._load_jobs_index()["jobs"].items()
+
+    def count_indexed_jobs(self) -> int:
+        """
+        Count the jobs registered in the jobs index.
+
+        This is an upper bound on what list_jobs() returns, since jobs whose
+        directories have disappeared are skipped there.
+
+        Returns:
+            Number of jobs in the index
+        """
+        return len(self._load_jobs_index()["jobs"])
 
     def validate_job_directory(self, job_id: str) -> Dict[str, Any]:
         """
@@ -152,13 +152,14 @@ class JobLockManager:
         self.base_jobs_dir = Path(base_jobs_dir)
         self._active_locks: Dict[str, FileLock] = {}
 
-    def lock_job_directory(self, job_id: str, timeout: float = 30.0) -> FileLock:
+    def lock_job_directory(self, job_id: str, timeout: float = 30.0, blocking: bool = True) -> FileLock:
         """
         Acquire a lock for a job directory.
 
         Args:
             job_id: Job identifier
             timeout: Lock acquisition timeout
+            blocking: If False, fail at once instead of waiting for a held lock
 
         Returns:
             FileLock instance (already acquired)
@@ -169,7 +170,7 @@ class JobLockManager:
         lock_file = self.base_jobs_dir / job_id / ".lock"
         lock = FileLock(str(lock_file), timeout)
 
-        if not lock.acquire(blocking=True):
+        if not lock.acquire(blocking=blocking):
             raise LockError(f"Failed to acquire lock for job {job_id}")
 
         self._active_locks[job_id] = lock
@@ -9,18 +9,32 @@ This module provides comprehensive job recovery capabilities including:
 """
 
 import os
-import json
 import time
 import psutil
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple, Set
 from pathlib import Path
 
 from .job_directory import JobDirectoryManager
 from .locking import JobLockManager, LockError
-from ..job_state import JobStateError, load_job_manifest, JobStates
+from ..job_state import JobStateError, JobStates, load_job_manifest
 from ..recovery import RecoveryError, detect_hung_process, perform_automatic_recovery
 
+# Jobs in these states cannot need recovery, so consistency checks are skipped
+_TERMINAL_STATES = frozenset(JobStates.TERMINAL_STATES | {JobStates.FAILED})
+
+# Upper bound on concurrent lock probes during crash detection
+_CRASH_CHECK_WORKERS = 8
+
+# Consistency issues are reported as "kind: detail"; map each kind to its recommendation
+_RULE_TO_REC = {
+    "missing_required_field": "run_job_validation_and_repair",
+    "invalid_status": "reset_job_to_safe_state",
+    "old_temp_files": "cleanup_temporary_files",
+    "orphaned_resources": "check_for_data_integrity_issues",
+}
+
 
 class JobRecoveryManager:
     """
@@ -39,6 +53,13 @@ class JobRecoveryManager:
         self.dir_manager = JobDirectoryManager(str(base_jobs_dir))
         self.lock_manager = JobLockManager(str(base_jobs_dir))
 
+        # psutil.Process handles reused across liveness checks
+        self._process_cache: Dict[int, psutil.Process] = {}
+
+        # _should_job_be_locked results keyed by (job_id, manifest st_mtime_ns);
+        # cleared at the end of each report or bulk recovery to bound memory
+        self._lock_state_cache: Dict[Tuple[str, int], bool] = {}
+
     def detect_crashed_jobs(self) -> List[Dict[str, Any]]:
         """
         Detect jobs that appear to have crashed or been interrupted.
@@ -48,49 +69,69 @@ class JobRecoveryManager:
         """
         crashed_jobs = []
 
+        # Only check jobs in execution states
+        execution_states = {JobStates.RUNNING, JobStates.REVIEWING, JobStates.PENDING}
+
         try:
-            jobs = self.dir_manager.list_jobs()
+            candidates = [
+                job_info for job_info in self.dir_manager.iter_jobs()
+                if job_info["status"] in execution_states
+            ]
+
+            if candidates:
+                workers = min(len(candidates), _CRASH_CHECK_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for crashed in executor.map(self._check_job_crashed, candidates):
+                        if crashed:
+                            crashed_jobs.append(crashed)
 
-            for job_info in jobs:
-                job_id = job_info["job_id"]
-                status = job_info["status"]
+        except Exception as e:
+            # Log error but don't fail completely
+            print(f"Warning: Error detecting crashed jobs: {e}")
 
-                # Only check jobs in execution states
-                execution_states = {JobStates.RUNNING, JobStates.REVIEWING, JobStates.PENDING}
-                if status not in execution_states:
-                    continue
+        return crashed_jobs
 
-                try:
-                    # Try to acquire lock - if we can get it, job might be crashed
-                    lock = self.lock_manager.lock_job_directory(job_id, timeout=5.0)
-
-                    # If we got the lock, check if the job should still be locked
-                    if self._should_job_be_locked(job_id):
-                        crashed_jobs.append({
-                            "job_id": job_id,
-                            "status": status,
-                            "reason": "lock_available_but_should_be_locked",
-                            "directory": job_info["directory"]
-                        })
+    def _check_job_crashed(self, job_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Check a single execution-state job for signs of a crash.
 
-                    self.lock_manager.unlock_job_directory(job_id)
+        Args:
+            job_info: Job information dictionary from list_jobs()
 
-                except LockError:
-                    # Lock is held by another process - job is likely still running
-                    continue
-                except Exception as e:
-                    crashed_jobs.append({
+        Returns:
+            Crashed job information dictionary, or None if the job looks alive
+        """
+        job_id = job_info["job_id"]
+        status = job_info["status"]
+
+        try:
+            # Try to acquire lock without waiting - if we can get it, job might be crashed
+            self.lock_manager.lock_job_directory(job_id, blocking=False)
+
+            try:
+                # If we got the lock, check if the job should still be locked
+                if self._should_job_be_locked(job_id):
+                    return {
                         "job_id": job_id,
                         "status": status,
-                        "reason": f"error_checking_lock: {e}",
+                        "reason": "lock_available_but_should_be_locked",
                         "directory": job_info["directory"]
-                    })
+                    }
+            finally:
+                self.lock_manager.unlock_job_directory(job_id)
 
+        except LockError:
+            # Lock is held by another process - job is likely still running
+            return None
         except Exception as e:
-            # Log error but don't fail completely
-            print(f"Warning: Error detecting crashed jobs: {e}")
+            return {
+                "job_id": job_id,
+                "status": status,
+                "reason": f"error_checking_lock: {e}",
+                "directory": job_info["directory"]
+            }
 
-        return crashed_jobs
+        return None
 
     def _should_job_be_locked(self, job_id: str) -> bool:
         """
@@ -104,20 +145,55 @@ class JobRecoveryManager:
         """
         try:
             job_dir = self.dir_manager.get_job_directory(job_id)
+            key = (job_id, os.stat(os.path.join(job_dir, "job_manifest.json")).st_mtime_ns)
+        except (JobStateError, OSError):
+            return False
+
+        cached = self._lock_state_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
             manifest = load_job_manifest(job_dir)
             status = manifest.get("status", "")
 
             # Jobs in these states should be locked by active processes
             active_states = {JobStates.RUNNING, JobStates.REVIEWING}
-            return status in active_states
+            should_lock = status in active_states
 
         except (JobStateError, KeyError):
             return False
 
+        self._lock_state_cache[key] = should_lock
+        return should_lock
+
     def recover_crashed_job(self, job_id: str, force: bool = False) -> Dict[str, Any]:
         """
         Attempt to recover a crashed job.
 
+        Args:
+            job_id: Job identifier
+            force: Force recovery even if job appears to be running
+
+        Returns:
+            Recovery result dictionary
+
+        Raises:
+            RecoveryError: If recovery fails
+        """
+        result = self._recover_crashed_job_nocleanup(job_id, force)
+
+        # Clean up any stale lock files
+        self.lock_manager.cleanup_stale_locks(max_age_seconds=300)  # 5 minutes
+
+        return result
+
+    def _recover_crashed_job_nocleanup(self, job_id: str, force: bool = False) -> Dict[str, Any]:
+        """
+        Recover a crashed job without sweeping stale lock files afterwards.
+
+        Bulk operations use this and run cleanup_stale_locks once at the end.
+
         Args:
             job_id: Job identifier
             force: Force recovery even if job appears to be running
@@ -147,7 +223,7 @@ class JobRecoveryManager:
 
             # Try to acquire lock
             try:
-                lock = self.lock_manager.lock_job_directory(job_id, timeout=10.0)
+                self.lock_manager.lock_job_directory(job_id, timeout=10.0)
                 result["actions_taken"].append("acquired_lock")
             except LockError:
                 if not force:
@@ -189,9 +265,6 @@ class JobRecoveryManager:
                         result["actions_taken"].append(f"reset_status_{original_status}_to_{safe_status}")
                         result["recovered"] = True
 
-                # Clean up any stale lock files
-                self.lock_manager.cleanup_stale_locks(max_age_seconds=300)  # 5 minutes
-
             finally:
                 # Always release lock
                 try:
@@ -235,7 +308,7 @@ class JobRecoveryManager:
 
             # Try non-blocking lock acquisition
             try:
-                lock = self.lock_manager.lock_job_directory(job_id, timeout=1.0)
+                self.lock_manager.lock_job_directory(job_id, timeout=1.0)
                 # If we got the lock, no active process is holding it
                 self.lock_manager.unlock_job_directory(job_id)
 
@@ -258,6 +331,25 @@ class JobRecoveryManager:
 
         return result
 
+    def _get_proc(self, pid: int) -> psutil.Process:
+        """
+        Get a cached psutil.Process handle for a PID.
+
+        Args:
+            pid: Process identifier
+
+        Returns:
+            psutil.Process instance
+
+        Raises:
+            psutil.NoSuchProcess: If the process does not exist
+        """
+        proc = self._process_cache.get(pid)
+        if proc is None:
+            proc = psutil.Process(pid)
+            self._process_cache[pid] = proc
+        return proc
+
     def _check_job_process_running(self, job_id: str, manifest: Dict[str, Any]) -> bool:
         """
         Check if there's a running process associated with the job.
@@ -274,29 +366,30 @@ class JobRecoveryManager:
             pid = manifest.get("process_id") or manifest.get("metadata", {}).get("pid")
 
             if pid:
-                return psutil.pid_exists(pid)
+                try:
+                    proc = self._get_proc(pid)
+                    with proc.oneshot():
+                        # is_running() also guards against PID reuse for cached handles
+                        if proc.is_running():
+                            return proc.status() not in (psutil.STATUS_ZOMBIE, psutil.STATUS_DEAD)
+                    self._process_cache.pop(pid, None)
+                    return False
+                except psutil.NoSuchProcess:
+                    self._process_cache.pop(pid, None)
+                    return False
 
             # Alternative: check for recent activity in log files
-            job_dir = self.dir_manager.get_job_directory(job_id)
-            logs_dir = Path(job_dir) / "logs"
-
-            if logs_dir.exists():
-                # Check if any log file has been modified recently (last 5 minutes)
-                recent_activity = False
-                for log_file in logs_dir.glob("*.log"):
-                    try:
-                        mtime = log_file.stat().st_mtime
-                        if time.time() - mtime < 300:  # 5 minutes
-                            recent_activity = True
-                            break
-                    except OSError:
-                        continue
-
-                if recent_activity:
-                    return True
-
-        except Exception:
-            pass  # Don't fail on process checking
+            logs_dir = os.path.join(self.dir_manager.get_job_directory(job_id), "logs")
+
+            # Check if any log file has been modified recently (last 5 minutes)
+            cutoff = time.time() - 300.0
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log") and entry.stat().st_mtime > cutoff:
+                        return True
+
+        except (OSError, psutil.Error, JobStateError):
+            pass  # Don't fail on process checking; missing logs mean no activity
 
         return False
 
@@ -375,46 +468,39 @@ class JobRecoveryManager:
     def _check_orphaned_resources(self, job_id: str, manifest: Dict[str, Any]) -> List[str]:
         """Check for orphaned or inconsistent resources."""
         issues = []
-        job_dir = Path(self.dir_manager.get_job_directory(job_id))
+        temp_dir = os.path.join(self.dir_manager.get_job_directory(job_id), "temp")
 
         # Check for temp files that should have been cleaned up
-        temp_dir = job_dir / "temp"
-        if temp_dir.exists():
-            try:
-                temp_files = list(temp_dir.glob("*"))
-                if temp_files:
-                    # Check if any temp files are older than expected
-                    max_temp_age = timedelta(hours=1)
-                    old_temp_files = []
-
-                    for temp_file in temp_files:
-                        try:
-                            mtime = datetime.fromtimestamp(temp_file.stat().st_mtime)
-                            if datetime.now() - mtime > max_temp_age:
-                                old_temp_files.append(str(temp_file.name))
-                        except OSError:
-                            continue
-
-                    if old_temp_files:
-                        issues.append(f"old_temp_files: {len(old_temp_files)} files older than 1 hour")
-            except OSError:
-                issues.append("cannot_check_temp_files")
+        try:
+            with os.scandir(temp_dir) as entries:
+                # Check if any temp files are older than expected (1 hour)
+                cutoff = time.time() - 3600.0
+                old_temp_files = []
+
+                for entry in entries:
+                    if entry.stat().st_mtime < cutoff:
+                        old_temp_files.append(entry.name)
+
+            if old_temp_files:
+                issues.append(f"old_temp_files: {len(old_temp_files)} files older than 1 hour")
+        except FileNotFoundError:
+            pass  # No temp directory, nothing to clean up
+        except OSError:
+            issues.append("cannot_check_temp_files")
 
         return issues
 
     def _generate_consistency_recommendations(self, issues: List[str]) -> List[str]:
         """Generate recommendations based on consistency issues."""
         recommendations = []
+        seen: Set[str] = set()
 
         for issue in issues:
-            if "missing_required_field" in issue:
-                recommendations.append("run_job_validation_and_repair")
-            elif "invalid_status" in issue:
-                recommendations.append("reset_job_to_safe_state")
-            elif "old_temp_files" in issue:
-                recommendations.append("cleanup_temporary_files")
-            elif "orphaned" in issue:
-                recommendations.append("check_for_data_integrity_issues")
+            kind = issue.split(":", 1)[0]
+            rec = _RULE_TO_REC.get(kind)
+            if rec and rec not in seen:
+                seen.add(rec)
+                recommendations.append(rec)
 
         if not recommendations:
             recommendations.append("run_full_job_recovery")
@@ -447,7 +533,7 @@ class JobRecoveryManager:
 
         for job_id in job_ids:
             try:
-                recovery_result = self.recover_crashed_job(job_id, force)
+                recovery_result = self._recover_crashed_job_nocleanup(job_id, force)
                 result["job_results"].append(recovery_result)
 
                 if recovery_result["recovered"]:
@@ -465,6 +551,11 @@ class JobRecoveryManager:
 
             result["total_jobs_processed"] += 1
 
+        # Clean up stale lock files once for the whole batch
+        if job_ids:
+            self.lock_manager.cleanup_stale_locks(max_age_seconds=300)  # 5 minutes
+
+        self._lock_state_cache.clear()
         return result
 
     def get_recovery_status_report(self) -> Dict[str, Any]:
@@ -479,18 +570,28 @@ class JobRecoveryManager:
             "crashed_jobs": [],
             "inconsistent_jobs": [],
             "recovery_needed": [],
-            "system_health": "healthy"
+            "system_health": "healthy",
+            "scan_truncated": False
         }
 
         try:
             # Check for crashed jobs
             crashed = self.detect_crashed_jobs()
             report["crashed_jobs"] = crashed
+            crashed_ids = {c["job_id"] for c in crashed}
+
+            # More than half of this upper bound needing recovery is critical
+            # no matter what the remaining jobs look like, so stop scanning there
+            critical_threshold = self.dir_manager.count_indexed_jobs() * 0.5
+            total_jobs = 0
 
             # Check all jobs for consistency
-            all_jobs = self.dir_manager.list_jobs()
-            for job_info in all_jobs:
+            for job_info in self.dir_manager.iter_jobs():
+                total_jobs += 1
                 job_id = job_info["job_id"]
+                if job_info["status"] in _TERMINAL_STATES:
+                    continue
+
                 consistency = self.validate_job_consistency(job_id)
 
                 if not consistency["consistent"]:
@@ -499,19 +600,23 @@ class JobRecoveryManager:
                         "issues": consistency["issues"]
                     })
 
-                if consistency["issues"] or job_id in [c["job_id"] for c in crashed]:
+                if consistency["issues"] or job_id in crashed_ids:
                     report["recovery_needed"].append(job_id)
+                    if len(report["recovery_needed"]) > critical_threshold:
+                        report["scan_truncated"] = True
+                        break
 
             # Determine overall system health
             if report["crashed_jobs"] or report["inconsistent_jobs"]:
                 report["system_health"] = "needs_attention"
-            if len(report["recovery_needed"]) > len(all_jobs) * 0.5:
+            if report["scan_truncated"] or len(report["recovery_needed"]) > total_jobs * 0.5:
                 report["system_health"] = "critical"
 
         except Exception as e:
             report["system_health"] = "error"
             report["error"] = str(e)
 
+        self._lock_state_cache.clear()
         return report
 
 
@@ -7,18 +7,34 @@ and automatic cleanup of unresponsive processes.
 """
 
 import os
+import mmap
+import fcntl
 import time
+import struct
+import hashlib
+import logging
+import heapq
 import signal
+import select
 import psutil
 import threading
+import itertools
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable, Set
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 
 from .job_directory import JobDirectoryManager
 from .locking import JobLockManager, LockError
-from ..job_state import JobStateError, load_job_manifest, JobStates
+from .recovery import JobRecoveryManager
+from ..job_state import JobStateError, load_job_manifest, update_job_manifest, JobStates
+
+logger = logging.getLogger(__name__)
+
+# Job states the sentinel watches for hangs
+_MONITORED_STATES = frozenset({JobStates.RUNNING, JobStates.REVIEWING, JobStates.PENDING})
 
 
 class SentinelState(Enum):
@@ -38,6 +54,11 @@ class HangSeverity(Enum):
     CRITICAL = "critical"  # Severe hang, immediate action needed
 
 
+# Timeout/threshold ratio cutoffs separating consecutive severities
+_SEVERITY_CUTOFFS = (1.5, 2.0, 3.0)
+_SEVERITIES = (HangSeverity.LOW, HangSeverity.MEDIUM, HangSeverity.HIGH, HangSeverity.CRITICAL)
+
+
 @dataclass
 class HangDetection:
     """Represents a detected hang condition."""
@@ -66,6 +87,9 @@ class SentinelConfig:
     auto_intervene: bool = True
     max_interventions_per_hour: int = 5
 
+    # Number of recent hang detections kept in memory
+    max_hang_history: int = 1024
+
     # Resource monitoring
     enable_resource_monitoring: bool = True
     memory_threshold_mb: int = 1024  # 1GB
@@ -75,6 +99,159 @@ class SentinelConfig:
     enable_notifications: bool = False
     notification_callback: Optional[Callable] = None
 
+    # Persistent event log (sentinel.events under the jobs directory)
+    event_log_records: int = 4096  # Ring capacity; 0 disables the log
+    event_log_flush_interval: float = 30.0  # Seconds between msync calls
+
+
+# Event log file layout: a header of (magic, capacity, events written) followed
+# by a ring of fixed-width records of (job_id hash, kind, severity index,
+# wall-clock timestamp, hang duration)
+EVENT_LOG_FILENAME = "sentinel.events"
+_EVENT_LOG_MAGIC = b"LGSTEVT1"
+_EVENT_HEADER = struct.Struct("<8sQQ8x")
+_EVENT_RECORD = struct.Struct("<QBB6xdd")
+
+EVENT_HANG = 0
+EVENT_INTERVENTION = 1
+
+
+def job_id_hash(job_id: str) -> int:
+    """Return the 64-bit hash identifying a job in the sentinel event log."""
+    return int.from_bytes(hashlib.blake2b(job_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SentinelEventLog:
+    """
+    Append-only ring of hang and intervention events in a memory-mapped file.
+
+    Appends only write into the mapping; the kernel writes dirty pages back
+    on its own and flush() forces them out with msync. Events survive sentinel
+    restarts, and the oldest records are overwritten once the ring is full.
+
+    The count of events written lives in the mapped header and is read and
+    advanced under an flock on the file, so sentinels in several processes
+    can share one log without overwriting each other's records.
+    """
+
+    def __init__(self, path: str, capacity: int):
+        """
+        Open or create an event log.
+
+        An existing file is reused if its header matches the requested
+        capacity; otherwise it is reinitialized.
+
+        Args:
+            path: Path of the event log file
+            capacity: Number of records in the ring
+
+        Raises:
+            OSError: If the file cannot be created or mapped
+        """
+        self.path = path
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        size = _EVENT_HEADER.size + capacity * _EVENT_RECORD.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                reuse = os.fstat(self._fd).st_size == size
+                if not reuse:
+                    os.ftruncate(self._fd, size)
+                self._map = mmap.mmap(self._fd, size)
+
+                magic, stored_capacity, _ = _EVENT_HEADER.unpack_from(self._map, 0)
+                if not (reuse and magic == _EVENT_LOG_MAGIC and stored_capacity == capacity):
+                    _EVENT_HEADER.pack_into(self._map, 0, _EVENT_LOG_MAGIC, capacity, 0)
+                    self._dirty = True
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _header_count(self) -> Optional[int]:
+        """Events written so far per the header, or None if another log has since reinitialized the file."""
+        magic, stored_capacity, count = _EVENT_HEADER.unpack_from(self._map, 0)
+        if magic != _EVENT_LOG_MAGIC or stored_capacity != self.capacity:
+            return None
+        return count
+
+    def append(self, kind: int, job_id: str, severity: HangSeverity, duration: float) -> None:
+        """
+        Record an event.
+
+        The event is dropped if another process has reinitialized the file
+        with a different capacity.
+
+        Args:
+            kind: EVENT_HANG or EVENT_INTERVENTION
+            job_id: Job identifier
+            severity: Severity of the hang
+            duration: Seconds since the job's last activity
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                count = self._header_count()
+                if count is None:
+                    return
+                offset = _EVENT_HEADER.size + (count % self.capacity) * _EVENT_RECORD.size
+                _EVENT_RECORD.pack_into(self._map, offset, job_id_hash(job_id), kind,
+                                        _SEVERITIES.index(severity), time.time(), duration)
+                _EVENT_HEADER.pack_into(self._map, 0, _EVENT_LOG_MAGIC, self.capacity, count + 1)
+                self._dirty = True
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def flush(self) -> None:
+        """Write appended events through to disk if there are any."""
+        with self._lock:
+            if self._dirty:
+                self._map.flush()
+                self._dirty = False
+
+    def close(self) -> None:
+        """Flush and unmap the log."""
+        if not self._map.closed:
+            self.flush()
+            self._map.close()
+            os.close(self._fd)
+
+    def read(self) -> List[Dict[str, Any]]:
+        """
+        Read the events still held in the ring, oldest first.
+
+        Returns:
+            List of event dictionaries with job_hash, kind, severity,
+            timestamp and duration keys
+        """
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            try:
+                count = self._header_count() or 0
+                first = max(0, count - self.capacity)
+                records = []
+                for index in range(first, count):
+                    offset = _EVENT_HEADER.size + (index % self.capacity) * _EVENT_RECORD.size
+                    records.append(_EVENT_RECORD.unpack_from(self._map, offset))
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        return [
+            {
+                "job_hash": job_hash,
+                "kind": kind,
+                "severity": _SEVERITIES[severity].value,
+                "timestamp": timestamp,
+                "duration": duration
+            }
+            for job_hash, kind, severity, timestamp, duration in records
+        ]
+
 
 class ExecutionSentinel:
     """
@@ -100,22 +277,54 @@ class ExecutionSentinel:
 
         self.dir_manager = JobDirectoryManager(base_jobs_dir)
         self.lock_manager = JobLockManager(base_jobs_dir)
+        self.recovery_manager = JobRecoveryManager(base_jobs_dir)
+
+        # Persistent event log, open only while monitoring
+        self.event_log: Optional[SentinelEventLog] = None
+        self._event_log_flushed = time.monotonic()
 
         # Monitoring state
         self.state = SentinelState.INACTIVE
         self.monitoring_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
 
+        # Set when there is new work (or on stop) to end an idle back-off early
+        self._wake = threading.Event()
+
         # Tracking
         self.active_jobs: Set[str] = set()
-        self.last_activity: Dict[str, datetime] = {}
-        self.hang_detections: List[HangDetection] = []
+
+        # Tuple view of active_jobs, rebuilt only after add_job/remove_job change it
+        self._active_snapshot: Tuple[str, ...] = ()
+        self._active_dirty = False
+        # time.monotonic() of each job's last activity
+        self.last_activity: Dict[str, float] = {}
+        self.hang_detections: Deque[HangDetection] = deque(maxlen=self.config.max_hang_history)
+        self.total_hangs_detected = 0
         self.intervention_count = 0
         self.last_intervention_time = datetime.min
 
+        # Monotonic times of interventions within the last hour
+        self._intervention_times: Deque[float] = deque()
+
         # Resource monitoring
         self.process_cache: Dict[str, psutil.Process] = {}
 
+        # Parsed manifests keyed by job_id, valid while (st_mtime_ns, st_size) match
+        self._manifest_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+        # Status of every indexed job keyed by job_id, valid while
+        # (st_mtime_ns, st_size) of its manifest match
+        self._status_cache: Dict[str, Tuple[int, int, str]] = {}
+
+        # Min-heap of (monotonic deadline, last_activity stamp, job_id); entries whose
+        # stamp no longer matches last_activity are stale and skipped lazily
+        self._deadline_heap: List[Tuple[float, float, str]] = []
+        self._deadline_lock = threading.Lock()
+
+        # Last CPU sample per job as (pid, monotonic timestamp, user+system seconds)
+        self._cpu_snap: Dict[str, Tuple[int, float, float]] = {}
+
     def start_monitoring(self) -> None:
         """Start the monitoring thread."""
         if self.state != SentinelState.INACTIVE:
@@ -123,6 +332,9 @@ class ExecutionSentinel:
 
         self.state = SentinelState.MONITORING
         self.stop_event.clear()
+        if self.event_log is None:
+            self.event_log = self._open_event_log()
+            self._event_log_flushed = time.monotonic()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
 
@@ -133,10 +345,30 @@ class ExecutionSentinel:
 
         self.state = SentinelState.INACTIVE
         self.stop_event.set()
+        self._wake.set()
 
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.monitoring_thread.join(timeout=5.0)
 
+        if self.event_log:
+            if self.monitoring_thread and self.monitoring_thread.is_alive():
+                self.event_log.flush()  # Still appending; leave it open
+            else:
+                self.event_log.close()
+                self.event_log = None
+
+    def _open_event_log(self) -> Optional[SentinelEventLog]:
+        """Open the persistent event log in the jobs directory, if enabled."""
+        if self.config.event_log_records <= 0 or not os.path.isdir(self.base_jobs_dir):
+            return None
+
+        try:
+            return SentinelEventLog(os.path.join(self.base_jobs_dir, EVENT_LOG_FILENAME),
+                                    self.config.event_log_records)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not open sentinel event log: %s", e)
+            return None
+
     def add_job(self, job_id: str) -> None:
         """
         Add a job to monitoring.
@@ -144,8 +376,13 @@ class ExecutionSentinel:
         Args:
             job_id: Job identifier
         """
-        self.active_jobs.add(job_id)
-        self.last_activity[job_id] = datetime.now()
+        if job_id not in self.active_jobs:
+            self.active_jobs.add(job_id)
+            self._active_dirty = True
+        self.last_activity[job_id] = time.monotonic()
+        self._push_deadline(job_id)
+        self._prime_cpu_sample(job_id)
+        self._wake.set()
 
     def remove_job(self, job_id: str) -> None:
         """
@@ -154,9 +391,28 @@ class ExecutionSentinel:
         Args:
             job_id: Job identifier
         """
-        self.active_jobs.discard(job_id)
+        if job_id in self.active_jobs:
+            self.active_jobs.discard(job_id)
+            self._active_dirty = True
         self.last_activity.pop(job_id, None)
         self.process_cache.pop(job_id, None)
+        self._manifest_cache.pop(job_id, None)
+        self._cpu_snap.pop(job_id, None)
+
+    def _active_job_snapshot(self) -> Tuple[str, ...]:
+        """
+        Get an immutable snapshot of the monitored jobs.
+
+        The tuple is reused across cycles until the set of active jobs changes,
+        and can be iterated safely while jobs are added or removed.
+
+        Returns:
+            Tuple of active job identifiers
+        """
+        if self._active_dirty:
+            self._active_dirty = False
+            self._active_snapshot = tuple(self.active_jobs)
+        return self._active_snapshot
 
     def update_activity(self, job_id: str) -> None:
         """
@@ -166,14 +422,94 @@ class ExecutionSentinel:
             job_id: Job identifier
         """
         if job_id in self.active_jobs:
-            self.last_activity[job_id] = datetime.now()
+            self.last_activity[job_id] = time.monotonic()
+            self._push_deadline(job_id)
+
+    def _push_deadline(self, job_id: str) -> None:
+        """
+        Schedule the next timeout check for a job from its last activity.
+
+        Uses the threshold of the job's last known status, or the smallest
+        threshold of any monitored state when the status is not known yet.
+
+        Args:
+            job_id: Job identifier
+        """
+        stamp = self.last_activity[job_id]
+        cached = self._status_cache.get(job_id)
+        threshold = self._get_timeout_threshold(cached[2]) if cached else None
+        if threshold is None:
+            threshold = min(self._get_timeout_threshold(status) for status in _MONITORED_STATES)
+
+        self._schedule_check(job_id, stamp, stamp + threshold)
+
+    def _schedule_check(self, job_id: str, stamp: float, deadline: float) -> None:
+        """Push a timeout deadline for a job onto the heap."""
+        with self._deadline_lock:
+            heapq.heappush(self._deadline_heap, (deadline, stamp, job_id))
+
+            # Drop stale entries once they clearly outnumber the live ones
+            if len(self._deadline_heap) > 2 * len(self.active_jobs) + 64:
+                self._deadline_heap = [
+                    entry for entry in self._deadline_heap
+                    if self.last_activity.get(entry[2]) == entry[1]
+                ]
+                heapq.heapify(self._deadline_heap)
+
+    def _pop_due_jobs(self) -> List[str]:
+        """
+        Pop the jobs whose timeout deadline has passed.
+
+        Returns:
+            Job identifiers that need a full timeout check, in deadline order
+        """
+        now = time.monotonic()
+        due: Dict[str, None] = {}
+
+        with self._deadline_lock:
+            while self._deadline_heap and self._deadline_heap[0][0] <= now:
+                _, stamp, job_id = heapq.heappop(self._deadline_heap)
+                if job_id in self.active_jobs and self.last_activity.get(job_id) == stamp:
+                    due[job_id] = None
+
+        return list(due)
+
+    def _cached_manifest(self, job_id: str) -> Dict[str, Any]:
+        """
+        Load a job manifest, reusing the parsed copy while the file is unchanged.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job manifest dictionary (shared; callers must not mutate it)
 
-    def check_job_timeout(self, job_id: str) -> Optional[HangDetection]:
+        Raises:
+            JobStateError: If the job directory or manifest is missing or invalid
+        """
+        job_dir = self.dir_manager.get_job_directory(job_id)
+        manifest_path = os.path.join(job_dir, "job_manifest.json")
+        try:
+            st = os.stat(manifest_path)
+        except FileNotFoundError:
+            self._manifest_cache.pop(job_id, None)
+            raise JobStateError(f"Job manifest not found at: {manifest_path}")
+
+        cached = self._manifest_cache.get(job_id)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        manifest = load_job_manifest(job_dir)
+        self._manifest_cache[job_id] = (st.st_mtime_ns, st.st_size, manifest)
+        return manifest
+
+    def check_job_timeout(self, job_id: str, manifest: Optional[Dict[str, Any]] = None) -> Optional[HangDetection]:
         """
         Check if a job has exceeded its timeout threshold.
 
         Args:
             job_id: Job identifier
+            manifest: Already loaded job manifest (loaded on demand if None)
 
         Returns:
             HangDetection if job is hung, None otherwise
@@ -182,50 +518,54 @@ class ExecutionSentinel:
             return None
 
         try:
-            job_dir = self.dir_manager.get_job_directory(job_id)
-            manifest = load_job_manifest(job_dir)
+            if manifest is None:
+                manifest = self._cached_manifest(job_id)
             status = manifest.get("status", "UNKNOWN")
-            last_activity = self.last_activity.get(job_id, datetime.min)
+            # Jobs without recorded activity start their clock now
+            last_activity = self.last_activity.setdefault(job_id, time.monotonic())
 
             # Determine timeout threshold based on job state
             timeout_threshold = self._get_timeout_threshold(status)
             if timeout_threshold is None:
                 return None  # No timeout for this state
 
-            time_since_activity = datetime.now() - last_activity
+            time_since_activity = time.monotonic() - last_activity
 
-            if time_since_activity.total_seconds() > timeout_threshold:
-                severity = self._calculate_hang_severity(time_since_activity.total_seconds(), timeout_threshold)
+            if time_since_activity > timeout_threshold:
+                severity = self._calculate_hang_severity(time_since_activity, timeout_threshold)
+
+                # Wall-clock times are only needed for the user-facing report
+                detected_at = datetime.now()
+                last_activity_at = detected_at - timedelta(seconds=time_since_activity)
 
                 evidence = [
-                    f"Last activity: {last_activity.isoformat()}",
-                    f"Time since activity: {time_since_activity.total_seconds():.1f}s",
+                    f"Last activity: {last_activity_at.isoformat()}",
+                    f"Time since activity: {time_since_activity:.1f}s",
                     f"Timeout threshold: {timeout_threshold}s",
                     f"Job status: {status}"
                 ]
 
                 # Check resource usage if enabled
                 if self.config.enable_resource_monitoring:
-                    resource_evidence = self._check_resource_usage(job_id)
+                    resource_evidence = self._check_resource_usage(job_id, manifest)
                     evidence.extend(resource_evidence)
 
                 return HangDetection(
                     job_id=job_id,
                     severity=severity,
-                    detected_at=datetime.now(),
-                    timeout_duration=time_since_activity.total_seconds(),
-                    last_activity=last_activity,
+                    detected_at=detected_at,
+                    timeout_duration=time_since_activity,
+                    last_activity=last_activity_at,
                     evidence=evidence,
                     metadata={
                         "job_status": status,
-                        "timeout_threshold": timeout_threshold,
-                        "manifest": manifest
+                        "timeout_threshold": timeout_threshold
                     }
                 )
 
         except (JobStateError, OSError) as e:
             # Log error but don't fail - job might be in inconsistent state
-            print(f"Warning: Error checking timeout for job {job_id}: {e}")
+            logger.warning("Error checking timeout for job %s: %s", job_id, e)
 
         return None
 
@@ -244,23 +584,16 @@ class ExecutionSentinel:
 
     def _calculate_hang_severity(self, actual_timeout: float, threshold: float) -> HangSeverity:
         """Calculate the severity of a hang based on timeout duration."""
-        ratio = actual_timeout / threshold
-
-        if ratio < 1.5:
-            return HangSeverity.LOW
-        elif ratio < 2.0:
-            return HangSeverity.MEDIUM
-        elif ratio < 3.0:
-            return HangSeverity.HIGH
-        else:
-            return HangSeverity.CRITICAL
+        return _SEVERITIES[bisect_right(_SEVERITY_CUTOFFS, actual_timeout / threshold)]
 
-    def intervene_in_hung_job(self, hang_detection: HangDetection) -> Dict[str, Any]:
+    def intervene_in_hung_job(self, hang_detection: HangDetection,
+                              manifest: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Intervene in a hung job based on detection severity.
 
         Args:
             hang_detection: The hang detection information
+            manifest: Job manifest the hang was detected from (loaded on demand if None)
 
         Returns:
             Intervention result
@@ -282,13 +615,14 @@ class ExecutionSentinel:
             lock = self.lock_manager.lock_job_directory(hang_detection.job_id, timeout=30.0)
 
             try:
-                intervention_actions = self._perform_intervention(hang_detection)
+                intervention_actions = self._perform_intervention(hang_detection, manifest)
                 result["actions_taken"].extend(intervention_actions)
                 result["intervention_performed"] = True
 
                 # Update intervention tracking
                 self.intervention_count += 1
                 self.last_intervention_time = datetime.now()
+                self._intervention_times.append(time.monotonic())
 
             finally:
                 self.lock_manager.unlock_job_directory(hang_detection.job_id)
@@ -305,17 +639,22 @@ class ExecutionSentinel:
         if not self.config.auto_intervene:
             return False
 
-        # Check hourly limit
-        hour_ago = datetime.now() - timedelta(hours=1)
-        if self.last_intervention_time > hour_ago and self.intervention_count >= self.config.max_interventions_per_hour:
-            return False
+        # Check hourly limit over a sliding window
+        hour_ago = time.monotonic() - 3600.0
+        while self._intervention_times and self._intervention_times[0] <= hour_ago:
+            self._intervention_times.popleft()
 
-        return True
+        return len(self._intervention_times) < self.config.max_interventions_per_hour
 
-    def _perform_intervention(self, hang_detection: HangDetection) -> List[str]:
+    def _perform_intervention(self, hang_detection: HangDetection,
+                              manifest: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Perform the actual intervention based on hang severity.
 
+        Args:
+            hang_detection: The hang detection information
+            manifest: Already loaded job manifest, reused for process termination
+
         Returns:
             List of actions taken
         """
@@ -324,32 +663,25 @@ class ExecutionSentinel:
 
         if hang_detection.severity == HangSeverity.CRITICAL:
             # For critical hangs, force recovery
-            from .recovery import JobRecoveryManager
-            recovery_manager = JobRecoveryManager(self.base_jobs_dir)
-
-            recovery_result = recovery_manager.recover_crashed_job(job_id, force=True)
+            recovery_result = self.recovery_manager.recover_crashed_job(job_id, force=True)
             if recovery_result["recovered"]:
                 actions.append("forced_job_recovery")
                 actions.append(f"recovery_actions: {', '.join(recovery_result['actions_taken'])}")
 
         elif hang_detection.severity in {HangSeverity.HIGH, HangSeverity.MEDIUM}:
             # For high/medium hangs, attempt graceful recovery first
-            from .recovery import JobRecoveryManager
-            recovery_manager = JobRecoveryManager(self.base_jobs_dir)
-
-            recovery_result = recovery_manager.recover_crashed_job(job_id, force=False)
+            recovery_result = self.recovery_manager.recover_crashed_job(job_id, force=False)
             if recovery_result["recovered"]:
                 actions.append("graceful_job_recovery")
                 actions.append(f"recovery_actions: {', '.join(recovery_result['actions_taken'])}")
             else:
                 # If graceful recovery fails, try process termination
-                terminated = self._terminate_job_process(job_id)
+                terminated = self._terminate_job_process(job_id, manifest)
                 if terminated:
                     actions.append("process_terminated")
 
         # Update job status to indicate intervention
         try:
-            from ..job_state import update_job_manifest
             update_job_manifest(
                 job_dir=self.dir_manager.get_job_directory(job_id),
                 new_status=JobStates.INTERVENTION_REQUIRED,
@@ -366,58 +698,113 @@ class ExecutionSentinel:
 
         return actions
 
-    def _terminate_job_process(self, job_id: str) -> bool:
-        """Terminate the process associated with a job."""
+    def _terminate_job_process(self, job_id: str, manifest: Optional[Dict[str, Any]] = None) -> bool:
+        """Terminate the process associated with a job, reusing an already loaded manifest if given."""
         try:
             # Get process ID from manifest if available
-            job_dir = self.dir_manager.get_job_directory(job_id)
-            manifest = load_job_manifest(job_dir)
+            if manifest is None:
+                manifest = self._cached_manifest(job_id)
             pid = manifest.get("process_id")
 
-            if pid and psutil.pid_exists(pid):
-                process = psutil.Process(pid)
+            if pid:
+                try:
+                    process = self._job_process(job_id, pid)
+                except psutil.NoSuchProcess:
+                    self.process_cache.pop(job_id, None)
+                    return False
+
                 process.terminate()
 
-                # Wait for termination
-                try:
-                    process.wait(timeout=10.0)
-                    return True
-                except psutil.TimeoutExpired:
-                    # Force kill if terminate doesn't work
-                    process.kill()
-                    process.wait(timeout=5.0)
+                # Wait for termination, force kill if terminate doesn't work
+                if self._wait_for_exit(process, timeout=10.0):
                     return True
+                process.kill()
+                return self._wait_for_exit(process, timeout=5.0)
 
         except Exception as e:
-            print(f"Warning: Process termination failed for job {job_id}: {e}")
+            logger.warning("Process termination failed for job %s: %s", job_id, e)
 
         return False
 
-    def _check_resource_usage(self, job_id: str) -> List[str]:
-        """Check resource usage for a job."""
+    def _wait_for_exit(self, process: psutil.Process, timeout: float) -> bool:
+        """
+        Wait for a process to exit.
+
+        On Linux a pidfd becomes readable exactly when the process exits, so the
+        wait blocks in select() instead of polling. Elsewhere psutil's wait()
+        is used.
+
+        Args:
+            process: Process to wait for
+            timeout: Maximum time to wait (seconds)
+
+        Returns:
+            True if the process exited within the timeout
+        """
+        pidfd = None
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is not None:
+            try:
+                pidfd = pidfd_open(process.pid)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                pidfd = None  # Kernel without pidfd support
+
+        if pidfd is None:
+            try:
+                process.wait(timeout=timeout)
+                return True
+            except psutil.TimeoutExpired:
+                return False
+
+        try:
+            readable, _, _ = select.select([pidfd], [], [], timeout)
+        finally:
+            os.close(pidfd)
+
+        if not readable:
+            return False
+
+        # Reap the exit status if the process is our child
+        try:
+            process.wait(timeout=0)
+        except (psutil.TimeoutExpired, psutil.Error, ChildProcessError):
+            pass
+        return True
+
+    def _check_resource_usage(self, job_id: str, manifest: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Check resource usage for a job, reusing an already loaded manifest if given."""
         evidence = []
 
         try:
             # Try to get process information
-            job_dir = self.dir_manager.get_job_directory(job_id)
-            manifest = load_job_manifest(job_dir)
+            if manifest is None:
+                manifest = self._cached_manifest(job_id)
             pid = manifest.get("process_id")
 
-            if pid and psutil.pid_exists(pid):
-                process = psutil.Process(pid)
+            if pid:
+                try:
+                    process = self._job_process(job_id, pid)
+
+                    # Read memory, CPU times and status from one batch of /proc reads
+                    with process.oneshot():
+                        memory_mb = process.memory_info().rss / 1024 / 1024
+                        cpu_percent = self._sample_cpu_percent(job_id, process)
+                        status = process.status()
+                except psutil.NoSuchProcess:
+                    self.process_cache.pop(job_id, None)
+                    return evidence
 
                 # Memory usage
-                memory_mb = process.memory_info().rss / 1024 / 1024
                 if memory_mb > self.config.memory_threshold_mb:
                     evidence.append(f"High memory usage: {memory_mb:.1f}MB (threshold: {self.config.memory_threshold_mb}MB)")
 
-                # CPU usage (over last interval)
-                cpu_percent = process.cpu_percent(interval=1.0)
-                if cpu_percent > self.config.cpu_threshold_percent:
+                # CPU usage (since the previous sample for this job)
+                if cpu_percent is not None and cpu_percent > self.config.cpu_threshold_percent:
                     evidence.append(f"High CPU usage: {cpu_percent:.1f}% (threshold: {self.config.cpu_threshold_percent}%)")
 
                 # Process status
-                status = process.status()
                 if status in {psutil.STATUS_ZOMBIE, psutil.STATUS_DEAD}:
                     evidence.append(f"Process in bad state: {status}")
 
@@ -426,72 +813,224 @@ class ExecutionSentinel:
 
         return evidence
 
+    def _job_process(self, job_id: str, pid: int) -> psutil.Process:
+        """
+        Get the cached psutil.Process for a job, replacing it if the PID changed.
+
+        Args:
+            job_id: Job identifier
+            pid: Process ID currently recorded in the job manifest
+
+        Returns:
+            psutil.Process instance
+
+        Raises:
+            psutil.NoSuchProcess: If the process does not exist
+        """
+        process = self.process_cache.get(job_id)
+        if process is None or process.pid != pid:
+            process = psutil.Process(pid)
+            self.process_cache[job_id] = process
+        return process
+
+    def _sample_cpu_percent(self, job_id: str, process: psutil.Process) -> Optional[float]:
+        """
+        Compute CPU usage since the previous sample without blocking.
+
+        Args:
+            job_id: Job identifier
+            process: Process associated with the job
+
+        Returns:
+            CPU percent since the last sample, or None if there is no prior
+            sample for this process yet
+        """
+        cpu_times = process.cpu_times()
+        now = time.monotonic()
+        total = cpu_times.user + cpu_times.system
+
+        previous = self._cpu_snap.get(job_id)
+        self._cpu_snap[job_id] = (process.pid, now, total)
+
+        if previous is None or previous[0] != process.pid or now <= previous[1]:
+            return None
+
+        return (total - previous[2]) / (now - previous[1]) * 100.0
+
+    def _prime_cpu_sample(self, job_id: str) -> None:
+        """Take an initial CPU sample so the first resource check has a baseline."""
+        if not self.config.enable_resource_monitoring:
+            return
+
+        try:
+            pid = self._cached_manifest(job_id).get("process_id")
+            if pid:
+                self._sample_cpu_percent(job_id, self._job_process(job_id, pid))
+        except (JobStateError, OSError, psutil.Error):
+            pass  # Sampling starts on the first resource check instead
+
     def _monitoring_loop(self) -> None:
         """Main monitoring loop."""
         while not self.stop_event.is_set():
             try:
                 self._perform_monitoring_cycle()
             except Exception as e:
-                print(f"Warning: Monitoring cycle error: {e}")
+                logger.warning("Monitoring cycle error: %s", e, exc_info=True)
 
             # Wait for next check interval
-            self.stop_event.wait(self.config.check_interval)
+            # Periodically push logged events through to disk
+            if self.event_log and time.monotonic() - self._event_log_flushed >= self.config.event_log_flush_interval:
+                self.event_log.flush()
+                self._event_log_flushed = time.monotonic()
+
+            if self.active_jobs:
+                self.stop_event.wait(self.config.check_interval)
+            else:
+                # Nothing to monitor: back off until a job is added or we stop
+                self._wake.wait(self.config.check_interval * 5)
+                self._wake.clear()
 
     def _perform_monitoring_cycle(self) -> None:
         """Perform one complete monitoring cycle."""
         # Update active jobs list
         self._refresh_active_jobs()
 
-        # Check for hangs
-        hangs_detected = []
-        for job_id in list(self.active_jobs):
-            hang = self.check_job_timeout(job_id)
+        # Check for hangs, only for jobs whose earliest possible timeout has passed;
+        # each hang is kept with the manifest it was detected from
+        hangs_detected: List[Tuple[HangDetection, Dict[str, Any]]] = []
+        for job_id in self._pop_due_jobs():
+            if job_id not in self.active_jobs:
+                continue
+
+            # Load the manifest once; the timeout, resource and intervention
+            # steps all work from this copy
+            try:
+                manifest = self._cached_manifest(job_id)
+            except JobStateError as e:
+                logger.warning("Error checking timeout for job %s: %s", job_id, e)
+                self._push_deadline(job_id)
+                continue
+
+            hang = self.check_job_timeout(job_id, manifest)
             if hang:
-                hangs_detected.append(hang)
+                hangs_detected.append((hang, manifest))
                 self.hang_detections.append(hang)
+                self.total_hangs_detected += 1
+                if self.event_log:
+                    self.event_log.append(EVENT_HANG, job_id, hang.severity, hang.timeout_duration)
+
+                # Keep checking a hung job every cycle until it recovers
+                stamp = self.last_activity[job_id]
+                self._schedule_check(job_id, stamp, stamp)
+            else:
+                self._push_deadline(job_id)
 
         # Process detected hangs
-        for hang in hangs_detected:
+        for hang, manifest in hangs_detected:
             if self.config.enable_notifications and self.config.notification_callback:
                 self.config.notification_callback(hang)
 
             if self.config.auto_intervene:
-                intervention_result = self.intervene_in_hung_job(hang)
+                intervention_result = self.intervene_in_hung_job(hang, manifest)
                 if intervention_result["intervention_performed"]:
-                    print(f"Sentinel intervened in hung job {hang.job_id}: {intervention_result['actions_taken']}")
+                    if self.event_log:
+                        self.event_log.append(EVENT_INTERVENTION, hang.job_id, hang.severity, hang.timeout_duration)
+                    logger.warning("Sentinel intervened in hung job %s: %s", hang.job_id, intervention_result["actions_taken"])
 
     def _refresh_active_jobs(self) -> None:
-        """Refresh the list of active jobs being monitored."""
+        """
+        Refresh the list of active jobs being monitored.
+
+        Only manifests whose mtime or size changed since the previous refresh
+        are parsed again; a rewritten manifest of a monitored job counts as
+        activity for that job.
+        """
         try:
-            all_jobs = self.dir_manager.list_jobs()
             current_active = set()
+            indexed = set()
 
-            for job_info in all_jobs:
-                job_id = job_info["job_id"]
-                status = job_info["status"]
+            for job_id, job_dir in self.dir_manager.iter_job_directories():
+                indexed.add(job_id)
+                status = self._read_job_status(job_id, job_dir)
 
                 # Monitor jobs in executing states
-                if status in {JobStates.RUNNING, JobStates.REVIEWING, JobStates.PENDING}:
+                if status in _MONITORED_STATES:
                     current_active.add(job_id)
 
                     # Add to monitoring if not already there
                     if job_id not in self.active_jobs:
                         self.add_job(job_id)
 
+            # Forget jobs that have left the index
+            for job_id in self._status_cache.keys() - indexed:
+                del self._status_cache[job_id]
+
             # Remove jobs that are no longer active
-            inactive_jobs = self.active_jobs - current_active
-            for job_id in inactive_jobs:
-                self.remove_job(job_id)
+            for job_id in self._active_job_snapshot():
+                if job_id not in current_active:
+                    self.remove_job(job_id)
 
         except Exception as e:
-            print(f"Warning: Error refreshing active jobs: {e}")
+            logger.warning("Error refreshing active jobs: %s", e)
+
+    def _read_job_status(self, job_id: str, job_dir: str) -> Optional[str]:
+        """
+        Get a job's status, re-reading its manifest only when it changed on disk.
+
+        Args:
+            job_id: Job identifier
+            job_dir: Job directory path
+
+        Returns:
+            Job status, "CORRUPTED" for unreadable manifests, or None if the
+            manifest does not exist
+        """
+        try:
+            st = os.stat(os.path.join(job_dir, "job_manifest.json"))
+        except OSError:
+            self._status_cache.pop(job_id, None)
+            return None
+
+        cached = self._status_cache.get(job_id)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        try:
+            manifest = load_job_manifest(job_dir)
+            status = manifest.get("status", "UNKNOWN")
+            if status in _MONITORED_STATES:
+                # Hand the parsed manifest to the per-job cache used by the checks
+                self._manifest_cache[job_id] = (st.st_mtime_ns, st.st_size, manifest)
+        except JobStateError:
+            status = "CORRUPTED"
+
+        # Record the new status first so the deadline pushed below uses its timeout
+        self._status_cache[job_id] = (st.st_mtime_ns, st.st_size, status)
+
+        # The worker rewrote its manifest since the last refresh
+        if cached is not None:
+            self.update_activity(job_id)
+
+        return status
+
+    def get_recent_hangs(self, n: int = 10) -> List[HangDetection]:
+        """
+        Get the most recent hang detections, newest first.
+
+        Args:
+            n: Maximum number of detections to return
+
+        Returns:
+            List of recent HangDetection objects
+        """
+        return list(itertools.islice(reversed(self.hang_detections), n))
 
     def get_status_report(self) -> Dict[str, Any]:
         """Get a comprehensive status report."""
         return {
             "state": self.state.value,
             "active_jobs": len(self.active_jobs),
-            "hangs_detected": len(self.hang_detections),
+            "hangs_detected": self.total_hangs_detected,
             "interventions_performed": self.intervention_count,
             "last_intervention": self.last_intervention_time.isoformat() if self.last_intervention_time != datetime.min else None,
             "recent_hangs": [
@@ -501,7 +1040,7 @@ class ExecutionSentinel:
                     "detected_at": h.detected_at.isoformat(),
                     "timeout_duration": h.timeout_duration
                 }
-                for h in self.hang_detections[-10:]  # Last 10 hangs
+                for h in reversed(self.get_recent_hangs(10))  # Last 10 hangs, oldest first
             ]
         }
 
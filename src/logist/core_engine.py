@@ -4,18 +4,26 @@ Core Engine for Logist Job Execution
 Contains the LogistEngine class which handles the core job execution logic.
 """
 
-import json
+import logging
 import os
+import sys
+import time
 import subprocess
-from typing import Dict, Any, List, Optional
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 
 from logist import workspace_utils
-from logist.job_state import JobStateError, load_job_manifest, get_current_state, update_job_manifest, transition_state, JobStates
+from logist.job_state import (
+    JobStateError, load_job_manifest, save_job_manifest, get_current_state, update_job_manifest,
+    apply_manifest_update, transition_state, JobStates
+)
 from logist.job_processor import (
     execute_llm_with_cline, handle_execution_error, validate_evidence_files, JobProcessorError,
     save_latest_outcome, prepare_outcome_for_attachments, enhance_context_with_previous_outcome
 )
 from logist.job_context import assemble_job_context, JobContextError
+from logist.recovery import create_job_manifest_backup
+from logist.job_history import JobHistoryError, append_history_entry, compact_history_journal, get_job_history
 from logist.services import JobManagerService
 
 # Optional observer integration for intelligent state detection
@@ -37,6 +45,44 @@ except ImportError:
     SENTINEL_AVAILABLE = False
 
 
+# States where run_job stops executing steps
+RUN_STOP_STATES = frozenset({
+    JobStates.SUCCESS, JobStates.CANCELED, JobStates.INTERVENTION_REQUIRED, JobStates.APPROVAL_REQUIRED
+})
+
+# Status output of step_job, run_job and restep_single_step; see _configure_status_log
+log = logging.getLogger("logist.engine")
+
+
+class _StdoutHandler(logging.Handler):
+    """Writes bare status messages to whatever sys.stdout currently is."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+def _configure_status_log(obj: Dict[str, Any]) -> None:
+    """
+    Set the engine status log level for one CLI command.
+
+    Progress messages are shown on a terminal; with --quiet or when stdout
+    is not a terminal only warnings and errors are, and filtered messages
+    are never formatted. --debug always shows progress.
+
+    Args:
+        obj: The click context object holding the CLI options.
+    """
+    if not log.handlers:
+        log.addHandler(_StdoutHandler())
+        log.propagate = False
+
+    quiet = obj.get("QUIET", False) or not sys.stdout.isatty()
+    log.setLevel(logging.WARNING if quiet and not obj.get("DEBUG", False) else logging.INFO)
+
+
 class LogistEngine:
     """Orchestration engine for Logist jobs."""
 
@@ -49,6 +95,12 @@ class LogistEngine:
             agent: Agent instance for command generation (optional, for future use)
         """
         self._job_workspace_setup_cache = {}  # Cache to track workspace setup per job
+        self._job_manager: Optional[JobManagerService] = None  # Created on first workspace setup
+        # Parsed manifests keyed by job_dir, valid while (st_mtime_ns, st_size) match
+        self._manifest_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._in_run_loop = False  # Set while run_job records steps through the cached manifest
+        # Per-job file paths keyed by job_dir, see _job_paths
+        self._path_cache: Dict[str, Dict[str, str]] = {}
         self.runner = runner
         self.agent = agent
 
@@ -95,10 +147,9 @@ class LogistEngine:
             print(f"[DEBUG] Coordinating workspace setup for job: {job_id}")
 
         try:
-            # Import services dynamically to avoid circular imports
-            from logist.services import JobManagerService
-            manager = JobManagerService()
-            manager.ensure_workspace_ready(job_dir, debug=debug)
+            if self._job_manager is None:
+                self._job_manager = JobManagerService()
+            self._job_manager.ensure_workspace_ready(job_dir, debug=debug)
 
             # Mark as coordinated for this engine instance
             self._job_workspace_setup_cache[job_id] = True
@@ -108,6 +159,100 @@ class LogistEngine:
                 print(f"[DEBUG] Workspace setup coordination failed for job {job_id}: {e}")
             raise e
 
+    def _job_paths(self, job_dir: str) -> Dict[str, str]:
+        """
+        Get the paths the engine uses inside a job directory, computed once per job.
+
+        Args:
+            job_dir: Job directory path
+
+        Returns:
+            Dictionary with "manifest" and "workspace" paths
+        """
+        paths = self._path_cache.get(job_dir)
+        if paths is None:
+            paths = {
+                "manifest": os.path.join(job_dir, "job_manifest.json"),
+                "workspace": os.path.join(job_dir, "workspace"),
+            }
+            self._path_cache[job_dir] = paths
+        return paths
+
+    def _cached_load_manifest(self, job_dir: str) -> Dict[str, Any]:
+        """
+        Load a job manifest, reusing the parsed copy while the file is unchanged.
+
+        Args:
+            job_dir: Job directory path
+
+        Returns:
+            Job manifest dictionary
+
+        Raises:
+            JobStateError: If the manifest is missing or invalid
+        """
+        try:
+            st = os.stat(self._job_paths(job_dir)["manifest"])
+        except OSError:
+            self._manifest_cache.pop(job_dir, None)
+            return load_job_manifest(job_dir)
+
+        cached = self._manifest_cache.get(job_dir)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        manifest = load_job_manifest(job_dir)
+        self._manifest_cache[job_dir] = (st.st_mtime_ns, st.st_size, manifest)
+        return manifest
+
+    def _remember_manifest(self, job_dir: str, manifest: Dict[str, Any]) -> None:
+        """Cache a manifest this engine just wrote so the next load skips the parse."""
+        try:
+            st = os.stat(self._job_paths(job_dir)["manifest"])
+        except OSError:
+            self._manifest_cache.pop(job_dir, None)
+            return
+        self._manifest_cache[job_dir] = (st.st_mtime_ns, st.st_size, manifest)
+
+    def _update_manifest(self, job_dir: str, new_status: str, cost_increment: float,
+                         time_increment: float, history_entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record a step's result in the job manifest.
+
+        Inside run_job's loop the update is applied to the cached manifest,
+        which is re-read first if anyone else rewrote the file, and saved
+        right away, so the step skips a parse but never a write. A status
+        that stops the run goes through update_job_manifest so its side
+        effects (queue and workspace cleanup) still happen.
+
+        Returns:
+            Updated manifest dictionary
+
+        Raises:
+            JobStateError: If the manifest cannot be read or written
+        """
+        if not self._in_run_loop or new_status in RUN_STOP_STATES:
+            manifest = update_job_manifest(
+                job_dir=job_dir,
+                new_status=new_status,
+                cost_increment=cost_increment,
+                time_increment=time_increment,
+                history_entry=history_entry
+            )
+            self._remember_manifest(job_dir, manifest)
+            return manifest
+
+        manifest = self._cached_load_manifest(job_dir)
+        if apply_manifest_update(manifest, new_status=new_status, cost_increment=cost_increment,
+                                 time_increment=time_increment, history_entry=history_entry):
+            try:
+                create_job_manifest_backup(job_dir)
+            except Exception:
+                log.warning("   ⚠️  Failed to create job manifest backup")
+            save_job_manifest(job_dir, manifest)
+            self._remember_manifest(job_dir, manifest)
+        return manifest
+
     def _collect_execution_logs(self, job_dir: str, processed_response: Dict[str, Any]) -> str:
         """
         Collect execution logs and output for observer analysis.
@@ -136,129 +281,184 @@ class LogistEngine:
         if evidence_files:
             log_parts.append(f"Evidence files: {', '.join(evidence_files)}")
 
-        # Try to read recent log entries from jobHistory.json
-        history_path = os.path.join(job_dir, "jobHistory.json")
-        if os.path.exists(history_path):
-            try:
-                with open(history_path, 'r') as f:
-                    history = json.load(f)
-                    if isinstance(history, list) and history:
-                        # Get the most recent entries (last 3)
-                        recent_entries = history[-3:]
-                        for entry in recent_entries:
-                            if isinstance(entry, dict):
-                                event_type = entry.get("event", "log")
-                                summary = entry.get("summary", entry.get("response", {}).get("summary_for_supervisor", ""))
-                                action = entry.get("action", entry.get("response", {}).get("action", ""))
-                                if summary or action:
-                                    log_parts.append(f"{event_type}: {summary or action}")
-            except (json.JSONDecodeError, OSError):
-                pass  # Ignore log reading errors
+        # Try to read recent log entries from the job history
+        try:
+            # Get the most recent entries (last 3)
+            recent_entries = get_job_history(job_dir, limit=3)
+            for entry in recent_entries:
+                if isinstance(entry, dict):
+                    event_type = entry.get("event", "log")
+                    summary = entry.get("summary", entry.get("response", {}).get("summary_for_supervisor", ""))
+                    action = entry.get("action", entry.get("response", {}).get("action", ""))
+                    if summary or action:
+                        log_parts.append(f"{event_type}: {summary or action}")
+        except JobHistoryError:
+            pass  # Ignore log reading errors
 
         # Combine all log parts
         return "\n".join(log_parts)
 
     def _write_job_history_entry(self, job_dir: str, entry: dict) -> None:
-        """Write a job history entry to jobHistory.json."""
-        job_history_path = os.path.join(job_dir, "jobHistory.json")
+        """
+        Append a job history entry to the job's history journal.
 
-        # Load existing history or create empty array
-        if os.path.exists(job_history_path):
-            try:
-                with open(job_history_path, 'r') as f:
-                    history = json.load(f)
-                    if not isinstance(history, list):
-                        history = []
-            except (json.JSONDecodeError, OSError):
-                history = []
-        else:
-            history = []
-
-        # Append new entry
-        history.append(entry)
-
-        # Write back to file
+        Entries are appended one line at a time to jobHistory.ndjson and folded
+        into jobHistory.json by _compact_job_history.
+        """
         try:
-            with open(job_history_path, 'w') as f:
-                json.dump(history, f, indent=2)
-        except OSError as e:
+            append_history_entry(job_dir, entry)
+        except JobHistoryError as e:
             print(f"⚠️  Failed to write job history entry: {e}")
 
+    def _compact_job_history(self, job_dir: str) -> None:
+        """Fold the job's history journal into jobHistory.json."""
+        try:
+            compact_history_journal(job_dir)
+        except JobHistoryError as e:
+            print(f"⚠️  Failed to compact job history: {e}")
+
+    def _maybe_log_history(self, debug_mode: bool, job_dir: str, label: str, job_id: str, *,
+                           operation: str, model: str, action: str, summary: str,
+                           cost: float = 0.0, execution_time: float = 0.0,
+                           metrics: Optional[Dict[str, Any]] = None, **request_fields: Any) -> None:
+        """
+        Record and display a debug history entry, building it only in debug mode.
+
+        step_job and run_job only write jobHistory entries in debug mode; this
+        is the single gate for building, writing and displaying them.
+
+        Args:
+            debug_mode: Whether debug mode is enabled
+            job_dir: Job directory path
+            label: Operation name shown in the debug display
+            job_id: Job identifier
+            operation: Operation recorded in the entry's request
+            model: Model name recorded in the entry
+            action: Response action
+            summary: Response summary for the supervisor
+            cost: Cost of the operation
+            execution_time: Execution time in seconds
+            metrics: Response metrics
+            **request_fields: Extra fields for the entry's request
+        """
+        if not debug_mode:
+            return
+
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "model": model,
+            "cost": cost,
+            "execution_time_seconds": execution_time,
+            "request": {"operation": operation, "job_id": job_id, **request_fields},
+            "response": {
+                "action": action,
+                "summary_for_supervisor": summary,
+                "evidence_files": [],
+                "metrics": metrics or {}
+            }
+        }
+        self._write_job_history_entry(job_dir, entry)
+        self._show_debug_history_info(True, label, job_id, entry)
+
     def _show_debug_history_info(self, debug_mode: bool, operation: str, job_id: str, entry: dict) -> None:
         """Display detailed debug information when writing to jobHistory.json."""
         if not debug_mode:
             return
 
-        print(f"   📝 [DEBUG] Writing to jobHistory.json for {operation} operation:")
-        print(f"      📅 Timestamp: {entry.get('timestamp', 'unknown')}")
-        print(f"      🧠 Model: {entry.get('model', 'unknown')}")
-        print(f"      💰 Cost: ${entry.get('cost', 0):.4f}")
-        print(f"      ⏱️  Execution Time: {entry.get('execution_time_seconds', 0):.2f}s")
+        # Bind each field once; the block is rebuilt for every debug step
+        get = entry.get
+        request_info = get("request", {})
+        response_info = get("response", {})
+        metrics = response_info.get("metrics", {})
+
+        # Emit the whole block with one write instead of a print per line
+        lines = [
+            f"   📝 [DEBUG] Writing to jobHistory.json for {operation} operation:",
+            f"      📅 Timestamp: {get('timestamp', 'unknown')}",
+            f"      🧠 Model: {get('model', 'unknown')}",
+            f"      💰 Cost: ${get('cost', 0):.4f}",
+            f"      ⏱️  Execution Time: {get('execution_time_seconds', 0):.2f}s",
+        ]
+        append = lines.append
 
         # Show metrics if available
-        metrics = entry.get("response", {}).get("metrics", {})
         if metrics:
-            if "cost_usd" in metrics:
-                print(f"      💸 LLM Cost: ${metrics['cost_usd']:.4f}")
-            if "token_input" in metrics:
-                print(f"      📥 Input Tokens: {metrics['token_input']:,}")
-            if "token_output" in metrics:
-                print(f"      📤 Output Tokens: {metrics['token_output']:,}")
-            if "token_cache_read" in metrics and metrics['token_cache_read'] > 0:
-                print(f"      📚 Cached Read Tokens: {metrics['token_cache_read']:,}")
-            if "cache_hit" in metrics:
-                print(f"      🎯 Cache Hit: {'Yes' if metrics['cache_hit'] else 'No'}")
-            if "ttft_seconds" in metrics and metrics['ttft_seconds'] is not None:
-                print(f"      ⏱️  TTFT: {metrics['ttft_seconds']:.2f}s")
-            if "throughput_tokens_per_second" in metrics and metrics['throughput_tokens_per_second'] is not None:
-                print(f"      ⚡ Throughput: {metrics['throughput_tokens_per_second']:.2f} tokens/s")
-            total_tokens = metrics.get("token_input", 0) + metrics.get("token_output", 0) + metrics.get("token_cache_read", 0)
+            cost_usd = metrics.get("cost_usd")
+            token_input = metrics.get("token_input")
+            token_output = metrics.get("token_output")
+            token_cache_read = metrics.get("token_cache_read")
+            cache_hit = metrics.get("cache_hit")
+            ttft = metrics.get("ttft_seconds")
+            throughput = metrics.get("throughput_tokens_per_second")
+
+            if cost_usd is not None:
+                append(f"      💸 LLM Cost: ${cost_usd:.4f}")
+            if token_input is not None:
+                append(f"      📥 Input Tokens: {token_input:,}")
+            if token_output is not None:
+                append(f"      📤 Output Tokens: {token_output:,}")
+            if token_cache_read:
+                append(f"      📚 Cached Read Tokens: {token_cache_read:,}")
+            if cache_hit is not None:
+                append(f"      🎯 Cache Hit: {'Yes' if cache_hit else 'No'}")
+            if ttft is not None:
+                append(f"      ⏱️  TTFT: {ttft:.2f}s")
+            if throughput is not None:
+                append(f"      ⚡ Throughput: {throughput:.2f} tokens/s")
+            total_tokens = (token_input or 0) + (token_output or 0) + (token_cache_read or 0)
             if total_tokens > 0:
-                print(f"      🔢 Total Tokens (Input+Output+Cached): {total_tokens:,}")
-
-        request_info = entry.get("request", {})
-        if request_info.get("job_id"):
-            print(f"      🎯 Job ID: {request_info['job_id']}")
-        if request_info.get("phase"):
-            print(f"      📍 Phase: {request_info['phase']}")
-        if request_info.get("role"):
-            print(f"      👤 Role: {request_info['role']}")
-
-        response_info = entry.get("response", {})
-        if response_info.get("action"):
-            print(f"      🎬 Action: {response_info['action']}")
+                append(f"      🔢 Total Tokens (Input+Output+Cached): {total_tokens:,}")
+
+        job_id_value = request_info.get("job_id")
+        if job_id_value:
+            append(f"      🎯 Job ID: {job_id_value}")
+        phase = request_info.get("phase")
+        if phase:
+            append(f"      📍 Phase: {phase}")
+        role = request_info.get("role")
+        if role:
+            append(f"      👤 Role: {role}")
+
+        action = response_info.get("action")
+        if action:
+            append(f"      🎬 Action: {action}")
 
         evidence_files = response_info.get("evidence_files", [])
         if evidence_files:
-            print(f"      📁 Evidence Files: {len(evidence_files)}")
-            for i, evidence in enumerate(evidence_files[:3]):  # Show first 3
-                print(f"         • {evidence}")
+            append(f"      📁 Evidence Files: {len(evidence_files)}")
+            for evidence in evidence_files[:3]:  # Show first 3
+                append(f"         • {evidence}")
             if len(evidence_files) > 3:
-                print(f"         ... and {len(evidence_files) - 3} more")
+                append(f"         ... and {len(evidence_files) - 3} more")
 
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def step_job(self, ctx: Any, job_id: str, job_dir: str, dry_run: bool = False, model: str = "grok-code-fast-1") -> bool:
         """Execute single phase of job and pause with enhanced workspace preparation."""
+        # Look up CLI options once; step_job runs once per iteration of run_job's loop
+        obj = ctx.obj
+        debug_mode = obj.get("DEBUG", False)
+        _configure_status_log(obj)
+
         # Ensure workspace is ready (coordinated setup once per job)
-        debug_mode = ctx.obj.get("DEBUG", False)
         self.ensure_job_workspace_ready(job_dir, debug=debug_mode)
 
         # Recovery validation - check for hung processes and recover if needed
         try:
             pass  # recovery import handled in main cli
         except Exception as e:
-            print(f"⚠️  Recovery validation failed: {e}")
+            log.warning("⚠️  Recovery validation failed: %s", e)
 
         if dry_run:
             print("   → Defensive setting detected: --dry-run")
             print(f"   → Would: Simulate single phase for job '{job_id}' with mock data")
             return True
 
-        print(f"👣 [LOGIST] Executing single phase for job '{job_id}'")
+        log.info("👣 [LOGIST] Executing single phase for job '%s'", job_id)
 
         try:
             # 1. Load job manifest
-            manifest = load_job_manifest(job_dir)
+            manifest = self._cached_load_manifest(job_dir)
             current_status = manifest.get("status", "PENDING")
 
             # Placeholder for threshold checking - full implementation moved to CLI layer
@@ -267,29 +467,29 @@ class LogistEngine:
             # 3. Determine current phase
             current_phase_name = get_current_state(manifest)
             active_role = "agent"  # Simplified - no role distinction
-            print(f"   → Current Phase: {current_phase_name}")
+            log.info("   → Current Phase: %s", current_phase_name)
 
             # 4. Prepare workspace with attachments and file discovery
-            workspace_dir = os.path.join(job_dir, "workspace")
+            workspace_dir = self._job_paths(job_dir)["workspace"]
             if self.runner:
                 prep_result = self.runner.provision(job_dir, workspace_dir)
             else:
                 prep_result = workspace_utils.prepare_workspace_attachments(job_dir, workspace_dir)
             if prep_result["success"]:
                 if prep_result["attachments_copied"]:
-                    print(f"   📎 Copied {len(prep_result['attachments_copied'])} attachments to workspace")
+                    log.info("   📎 Copied %s attachments to workspace", len(prep_result['attachments_copied']))
                 if prep_result["discovered_files"]:
-                    print(f"   🔍 Discovered {len(prep_result['discovered_files'])} context files")
+                    log.info("   🔍 Discovered %s context files", len(prep_result['discovered_files']))
             else:
-                print(f"   ⚠️  Workspace preparation warning: {prep_result['error']}")
+                log.warning("   ⚠️  Workspace preparation warning: %s", prep_result['error'])
 
             # 6. Prepare outcome attachments from previous step
             outcome_prep = prepare_outcome_for_attachments(job_dir, workspace_dir)
             if outcome_prep["attachments_added"]:
-                print(f"   🏆 Prepared outcome data from previous {len(outcome_prep['attachments_added'])} steps")
+                log.info("   🏆 Prepared outcome data from previous %s steps", len(outcome_prep['attachments_added']))
 
             # 7. Assemble job context with enhanced preparation
-            context = assemble_job_context(job_dir, manifest, ctx.obj["JOBS_DIR"], enhance=ctx.obj.get("ENHANCE", False))
+            context = assemble_job_context(job_dir, manifest, obj["JOBS_DIR"], enhance=obj.get("ENHANCE", False))
             context = enhance_context_with_previous_outcome(context, job_dir)
 
             # 8. Execute LLM with Cline using discovered file arguments
@@ -313,50 +513,40 @@ class LogistEngine:
 
             response_action = processed_response.get("action")
 
-            print(f"   ✅ LLM responded with action: {response_action}")
-            print(f"   📝 Summary for Supervisor: {processed_response.get('summary_for_supervisor', 'N/A')}")
-            print(f"   ⏱️  Execution time: {execution_time:.2f} seconds")
+            log.info("   ✅ LLM responded with action: %s", response_action)
+            log.info("   📝 Summary for Supervisor: %s", processed_response.get('summary_for_supervisor', 'N/A'))
+            log.info("   ⏱️  Execution time: %.2f seconds", execution_time)
 
             # Debug: Write to jobHistory.json for step operation
-            debug_mode = ctx.obj.get("DEBUG", False)
-            if debug_mode:
-                from datetime import datetime
-                job_history_entry = {
-                    "timestamp": datetime.now().isoformat(),
-                    "model": model,
-                    "cost": processed_response.get("metrics", {}).get("cost_usd", 0.0),
-                    "execution_time_seconds": execution_time,
-                    "request": {
-                        "operation": "step",
-                        "job_id": job_id,
-                        "phase": current_phase_name,
-                        "role": active_role,
-                        "dry_run": dry_run
-                    },
-                    "response": {
-                        "action": response_action,
-                        "summary_for_supervisor": processed_response.get("summary_for_supervisor", ""),
-                        "evidence_files": [],  # Will be populated below
-                        "metrics": processed_response.get("metrics", {})
-                    }
-                }
-                self._write_job_history_entry(job_dir, job_history_entry)
-                self._show_debug_history_info(debug_mode, "step", job_id, job_history_entry)
+            metrics = processed_response.get("metrics", {})
+            self._maybe_log_history(
+                debug_mode, job_dir, "step", job_id,
+                operation="step",
+                model=model,
+                action=response_action,
+                summary=processed_response.get("summary_for_supervisor", ""),
+                cost=metrics.get("cost_usd", 0.0),
+                execution_time=execution_time,
+                metrics=metrics,
+                phase=current_phase_name,
+                role=active_role,
+                dry_run=dry_run
+            )
 
             # 9. Save outcome to latest-outcome.json
             outcome_save = save_latest_outcome(job_dir, processed_response)
             if outcome_save["success"]:
-                print("   💾 Saved LLM response to latest-outcome.json")
+                log.info("   💾 Saved LLM response to latest-outcome.json")
             else:
-                print(f"   ⚠️  Failed to save outcome: {outcome_save['error']}")
+                log.warning("   ⚠️  Failed to save outcome: %s", outcome_save['error'])
 
             # 10. Validate evidence files
             evidence_files = processed_response.get("evidence_files", [])
             if evidence_files:
                 validated_evidence = validate_evidence_files(evidence_files, workspace_dir)
-                print(f"   📁 Validated evidence files: {', '.join(validated_evidence)}")
+                log.info("   📁 Validated evidence files: %s", ', '.join(validated_evidence))
             else:
-                print("   📁 No evidence files reported.")
+                log.info("   📁 No evidence files reported.")
 
             # 11. Update job manifest
             new_status = transition_state(current_status, response_action)
@@ -365,24 +555,24 @@ class LogistEngine:
                 "role": active_role,
                 "action": response_action,
                 "summary": processed_response.get("summary_for_supervisor"),
-                "metrics": processed_response.get("metrics", {}), # Includes new cached token metrics
+                "metrics": metrics, # Includes new cached token metrics
                 "cline_task_id": processed_response.get("cline_task_id"),
                 "new_status": new_status,
                 "evidence_files": evidence_files, # Store reported evidence files
                 "file_attachments": len(file_arguments) if file_arguments else 0
             }
 
-            update_job_manifest(
-                job_dir=job_dir,
+            self._update_manifest(
+                job_dir,
                 new_status=new_status,
-                cost_increment=processed_response.get("metrics", {}).get("cost_usd", 0.0),
+                cost_increment=metrics.get("cost_usd", 0.0),
                 time_increment=execution_time,
                 history_entry=history_entry
             )
-            print(f"   🔄 Job status updated to: {new_status}")
+            log.info("   🔄 Job status updated to: %s", new_status)
 
             # 12. Observer Integration: Analyze execution results
-            if self.observer and ctx.obj.get("OBSERVER", True):
+            if self.observer and obj.get("OBSERVER", True):
                 try:
                     # Collect logs from the execution for analysis
                     log_content = self._collect_execution_logs(job_dir, processed_response)
@@ -394,16 +584,16 @@ class LogistEngine:
 
                     # Log observer insights
                     if observation["inferred_state"] and observation["inferred_state"] != current_status:
-                        print(f"   👁️  Observer suggests state: {observation['inferred_state']} "
-                              f"(confidence: {observation['confidence'].value})")
+                        log.info("   👁️  Observer suggests state: %s (confidence: %s)",
+                                 observation['inferred_state'], observation['confidence'].value)
 
                     if observation["recommendations"]:
-                        print(f"   💡 Observer recommendations: {len(observation['recommendations'])}")
+                        log.info("   💡 Observer recommendations: %s", len(observation['recommendations']))
                         for rec in observation["recommendations"][:2]:  # Show first 2
-                            print(f"      • {rec}")
+                            log.info("      • %s", rec)
 
                 except Exception as e:
-                    print(f"   ⚠️  Observer analysis failed: {e}")
+                    log.warning("   ⚠️  Observer analysis failed: %s", e)
                     # Don't fail execution for observer issues
 
             # 13. Perform git commit for evidence files and changes
@@ -420,25 +610,24 @@ class LogistEngine:
 
                 if commit_result["success"]:
                     if commit_result.get("commit_hash"):
-                        print(f"   💾 Changes committed: {commit_result['commit_hash'][:8]}")
-                        print(f"   📁 Files committed: {len(commit_result.get('files_committed', []))}")
+                        log.info("   💾 Changes committed: %s", commit_result['commit_hash'][:8])
+                        log.info("   📁 Files committed: %s", len(commit_result.get('files_committed', [])))
                     else:
-                        print("   💾 Changes harvested successfully")
+                        log.info("   💾 Changes harvested successfully")
                 else:
-                    print(f"   ⚠️  Harvest/commit failed: {commit_result['error']}")
+                    log.warning("   ⚠️  Harvest/commit failed: %s", commit_result['error'])
                     # Don't fail the step for harvest/commit issues - continue execution
 
             except Exception as e:
-                print(f"   ⚠️  Harvest/commit error: {e}")
+                log.warning("   ⚠️  Harvest/commit error: %s", e)
                 # Continue - harvest/commit failures shouldn't fail the job step
 
             return True
 
-        except (JobProcessorError, JobStateError, JobContextError, Exception) as e:
-            print(f"❌ Error during job step for '{job_id}': {e}")
-            raw_cline_output = None
-            if isinstance(e, JobProcessorError) and hasattr(e, 'full_output'):
-                raw_cline_output = e.full_output # If CLINE execution failed, this might be present
+        except (JobProcessorError, JobStateError, JobContextError) as e:
+            log.error("❌ Error during job step for '%s': %s", job_id, e)
+            # If CLINE execution failed, the JobProcessorError may carry its full output
+            raw_cline_output = getattr(e, 'full_output', None)
             handle_execution_error(job_dir, job_id, e, raw_output=raw_cline_output)
             return False
 
@@ -465,6 +654,11 @@ class LogistEngine:
                 self.sentinel.config = config
                 self.sentinel.dir_manager = self.sentinel.dir_manager.__class__(base_jobs_dir)
                 self.sentinel.lock_manager = self.sentinel.lock_manager.__class__(base_jobs_dir)
+                self.sentinel.recovery_manager = self.sentinel.recovery_manager.__class__(base_jobs_dir)
+                if self.sentinel.event_log:
+                    # Monitoring is running; move its event log to the new directory
+                    self.sentinel.event_log.close()
+                    self.sentinel.event_log = self.sentinel._open_event_log()
 
         except Exception as e:
             print(f"⚠️  Sentinel initialization failed: {e}")
@@ -547,105 +741,105 @@ class LogistEngine:
         This command orchestrates iterative worker and supervisor executions
         until the job reaches SUCCESS, CANCELED, INTERVENTION_REQUIRED, or APPROVAL_REQUIRED.
         """
+        # CLI options, looked up once for the whole run
+        obj = ctx.obj
+        debug_mode = obj.get("DEBUG", False)
+        _configure_status_log(obj)
+
         # Ensure workspace is ready (coordinated setup once per job)
-        debug_mode = ctx.obj.get("DEBUG", False)
         self.ensure_job_workspace_ready(job_dir, debug=debug_mode)
 
-        # Define terminal states where execution stops
-        TERMINAL_STATES = {"SUCCESS", "CANCELED", "INTERVENTION_REQUIRED", "APPROVAL_REQUIRED"}
+        # Pause between steps only when someone is watching the output
+        step_pause = 0.5 if sys.stdout.isatty() and not obj.get("NO_PAUSE", False) else 0.0
 
-        print("🎯 [LOGIST] Starting continuous job execution")
-        print(f"   📍 Job: {job_id}")
-        print(f"   📁 Directory: {job_dir}")
+        log.info("🎯 [LOGIST] Starting continuous job execution")
+        log.info("   📍 Job: %s", job_id)
+        log.info("   📁 Directory: %s", job_dir)
 
         # Debug: Write to jobHistory.json for run command start
-        debug_mode = ctx.obj.get("DEBUG", False)
-        if debug_mode:
-            from datetime import datetime
-            job_history_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "model": "run-command",
-                "cost": 0.0,
-                "execution_time_seconds": 0.0,
-                "request": {
-                    "operation": "run",
-                    "job_id": job_id,
-                    "description": "Starting continuous job execution loop"
-                },
-                "response": {
-                    "action": "RUN_STARTED",
-                    "summary_for_supervisor": f"Continuous execution started for job '{job_id}'",
-                    "evidence_files": [],
-                    "metrics": {}
-                }
-            }
-            self._write_job_history_entry(job_dir, job_history_entry)
-            self._show_debug_history_info(debug_mode, "run-start", job_id, job_history_entry)
+        self._maybe_log_history(
+            debug_mode, job_dir, "run-start", job_id,
+            operation="run",
+            model="run-command",
+            action="RUN_STARTED",
+            summary=f"Continuous execution started for job '{job_id}'",
+            description="Starting continuous job execution loop"
+        )
 
         try:
             # Load initial job manifest to check current status
-            manifest = load_job_manifest(job_dir)
+            manifest = self._cached_load_manifest(job_dir)
             current_status = manifest.get("status", "PENDING")
 
-            if current_status in TERMINAL_STATES:
-                print(f"⚠️  Job '{job_id}' is already in terminal state: {current_status}")
-                print("   💡 Use 'logist job step' to advance manually or 'logist job rerun' to restart")
+            if current_status in RUN_STOP_STATES:
+                log.warning("⚠️  Job '%s' is already in terminal state: %s", job_id, current_status)
+                log.warning("   💡 Use 'logist job step' to advance manually or 'logist job rerun' to restart")
                 return True  # Not an error, just already complete
 
-            print(f"   🔄 Initial Status: {current_status}")
-            print("   🔄 Beginning execution loop...\n")
+            log.info("   🔄 Initial Status: %s", current_status)
+            log.info("   🔄 Beginning execution loop...\n")
 
+            # Record steps through the cached manifest until the run stops
+            self._in_run_loop = True
             step_count = 0
             while True:
                 step_count += 1
-                print(f"▼ Step {step_count} ▼")
+                log.info("▼ Step %s ▼", step_count)
 
                 # Execute one step
                 success = self.step_job(ctx, job_id, job_dir, dry_run=False)
 
                 if not success:
-                    print(f"❌ Step {step_count} failed - stopping execution")
+                    log.error("❌ Step %s failed - stopping execution", step_count)
                     return False
 
                 # Check if we've reached a terminal state
                 try:
-                    manifest = load_job_manifest(job_dir)
+                    manifest = self._cached_load_manifest(job_dir)
                     current_status = manifest.get("status", "PENDING")
 
-                    if current_status in TERMINAL_STATES:
-                        print(f"\n🎉 [LOGIST] Job execution completed!")
-                        print(f"   📊 Final Status: {current_status}")
-                        print(f"   📈 Steps executed: {step_count}")
+                    if current_status in RUN_STOP_STATES:
+                        self._compact_job_history(job_dir)
+                        log.info("\n🎉 [LOGIST] Job execution completed!")
+                        log.info("   📊 Final Status: %s", current_status)
+                        log.info("   📈 Steps executed: %s", step_count)
 
                         if current_status == "SUCCESS":
-                            print("   ✅ Job completed successfully!")
+                            log.info("   ✅ Job completed successfully!")
                         elif current_status == "CANCELED":
-                            print("   🚫 Job was canceled")
+                            log.info("   🚫 Job was canceled")
                         elif current_status == "INTERVENTION_REQUIRED":
-                            print("   👤 Human intervention required")
-                            print("   💡 Use 'logist job step' or manual fixes, then 'logist job run' to continue")
+                            log.info("   👤 Human intervention required")
+                            log.info("   💡 Use 'logist job step' or manual fixes, then 'logist job run' to continue")
                         elif current_status == "APPROVAL_REQUIRED":
-                            print("   👍 Final approval required")
-                            print("   💡 Use appropriate commands to approve/reject")
+                            log.info("   👍 Final approval required")
+                            log.info("   💡 Use appropriate commands to approve/reject")
 
                         return True
 
                 except JobStateError as e:
-                    print(f"❌ Error checking job status after step {step_count}: {e}")
+                    log.error("❌ Error checking job status after step %s: %s", step_count, e)
                     return False
 
                 # Small delay between steps for readability
-                import time
-                time.sleep(0.5)
+                if step_pause:
+                    time.sleep(step_pause)
 
-        except (JobProcessorError, JobStateError, JobContextError, Exception) as e:
-            print(f"❌ Error during job run for '{job_id}': {e}")
+        except (JobProcessorError, JobStateError, JobContextError) as e:
+            log.error("❌ Error during job run for '%s': %s", job_id, e)
             return False
 
+        finally:
+            self._in_run_loop = False
+
     def restep_single_step(self, ctx: Any, job_id: str, job_dir: str, step_number: int, dry_run: bool = False) -> bool:
         """Re-execute a specific single step (phase) of a job for debugging purposes."""
+        # CLI options, looked up once per call
+        obj = ctx.obj
+        debug_mode = obj.get("DEBUG", False)
+        _configure_status_log(obj)
+
         # Ensure workspace is ready (coordinated setup once per job)
-        debug_mode = ctx.obj.get("DEBUG", False)
         self.ensure_job_workspace_ready(job_dir, debug=debug_mode)
 
         if dry_run:
@@ -653,11 +847,11 @@ class LogistEngine:
             print(f"   → Would: Re-execute step {step_number} for job '{job_id}' with mock data")
             return True
 
-        print(f"🔄 [LOGIST] Re-executing step {step_number} for job '{job_id}'")
+        log.info("🔄 [LOGIST] Re-executing step %s for job '%s'", step_number, job_id)
 
         try:
             # 1. Load job manifest and validate step number
-            manifest = load_job_manifest(job_dir)
+            manifest = self._cached_load_manifest(job_dir)
             phases = manifest.get("phases", [])
 
             if not phases:
@@ -669,22 +863,22 @@ class LogistEngine:
 
             target_phase = phases[step_number]
             target_phase_name = target_phase["name"]
-            print(f"   → Target Phase: {target_phase_name} (step {step_number})")
+            log.info("   → Target Phase: %s (step %s)", target_phase_name, step_number)
 
             # 2. Determine active role for this phase
             # For restep, we need to figure out which role should execute this phase
             # This logic matches the current state machine - we use a simple default
             active_role = target_phase.get("active_agent", "Worker")  # Default to Worker
-            print(f"   → Active Role: {active_role}")
+            log.info("   → Active Role: %s", active_role)
 
             # 3. Prepare manifest for this specific step execution
-            # Create a temporary manifest with current_phase set to the target phase
-            restep_manifest = manifest.copy()
-            restep_manifest["current_phase"] = target_phase_name
+            # Overlay current_phase on a shallow copy; the loaded manifest is the
+            # engine's cached copy and must not be modified
+            restep_manifest = {**manifest, "current_phase": target_phase_name}
 
             # 4. Assemble job context for the target phase
-            workspace_path = os.path.join(job_dir, "workspace")
-            context = assemble_job_context(job_dir, restep_manifest, ctx.obj["JOBS_DIR"], enhance=False)
+            workspace_path = self._job_paths(job_dir)["workspace"]
+            context = assemble_job_context(job_dir, restep_manifest, obj["JOBS_DIR"], enhance=False)
 
             # 6. Execute LLM with Cline
             processed_response, execution_time = execute_llm_with_cline(
@@ -695,17 +889,17 @@ class LogistEngine:
 
             response_action = processed_response.get("action")
 
-            print(f"   ✅ LLM responded with action: {response_action}")
-            print(f"   📝 Summary for Supervisor: {processed_response.get('summary_for_supervisor', 'N/A')}")
-            print(f"   ⏱️  Execution time: {execution_time:.2f} seconds")
+            log.info("   ✅ LLM responded with action: %s", response_action)
+            log.info("   📝 Summary for Supervisor: %s", processed_response.get('summary_for_supervisor', 'N/A'))
+            log.info("   ⏱️  Execution time: %.2f seconds", execution_time)
 
             # 7. Validate evidence files
             evidence_files = processed_response.get("evidence_files", [])
             if evidence_files:
                 validated_evidence = validate_evidence_files(evidence_files, workspace_path)
-                print(f"   📁 Validated evidence files: {', '.join(validated_evidence)}")
+                log.info("   📁 Validated evidence files: %s", ', '.join(validated_evidence))
             else:
-                print("   📁 No evidence files reported.")
+                log.info("   📁 No evidence files reported.")
 
             # 8. Update job manifest with step-specific history
             # For restep, we don't change the overall job status, just record the restep action
@@ -723,23 +917,31 @@ class LogistEngine:
                 "evidence_files": evidence_files
             }
 
-            # Update metrics and add history entry, but preserve overall status
-            update_job_manifest(
-                job_dir=job_dir,
-                # new_status unchanged - restep doesn't affect overall job status
+            # Update metrics and add history entry, but preserve overall status.
+            # Status never changes here, so the cached manifest is updated and
+            # written once instead of re-read through update_job_manifest
+            try:
+                create_job_manifest_backup(job_dir)
+            except Exception:
+                log.warning("   ⚠️  Failed to create job manifest backup")
+            apply_manifest_update(
+                manifest,
                 cost_increment=processed_response.get("metrics", {}).get("cost_usd", 0.0),
                 time_increment=execution_time,
                 history_entry=history_entry
             )
-            print(f"   🔄 Restep completed for phase '{target_phase_name}' (step {step_number})")
-            print(f"   📊 Job status remains: {current_status}")
+            save_job_manifest(job_dir, manifest)
+            self._remember_manifest(job_dir, manifest)
+            log.info("   🔄 Restep completed for phase '%s' (step %s)", target_phase_name, step_number)
+            log.info("   📊 Job status remains: %s", current_status)
             return True
 
-        except (JobProcessorError, JobStateError, JobContextError, Exception) as e:
-            print(f"❌ Error during job restep for '{job_id}' step {step_number}: {e}")
-            raw_cline_output = None
-            if isinstance(e, JobProcessorError) and hasattr(e, 'full_output'):
-                raw_cline_output = e.full_output # If CLINE execution failed, this might be present
+        except (JobProcessorError, JobStateError, JobContextError) as e:
+            # The cached manifest may have been modified without being saved
+            self._manifest_cache.pop(job_dir, None)
+            log.error("❌ Error during job restep for '%s' step %s: %s", job_id, step_number, e)
+            # If CLINE execution failed, the JobProcessorError may carry its full output
+            raw_cline_output = getattr(e, 'full_output', None)
             handle_execution_error(job_dir, job_id, e, raw_output=raw_cline_output)
             return False
 
@@ -763,7 +965,7 @@ class LogistEngine:
 
         try:
             # 1. Load and validate job manifest
-            manifest = load_job_manifest(job_dir)
+            manifest = self._cached_load_manifest(job_dir)
             phases = manifest.get("phases", [])
 
             if not phases:
@@ -786,6 +988,8 @@ class LogistEngine:
             # 3. Calculate metrics reset
             # For restep, we keep all metrics since we're staying within the same run
             # (unlike rerun which resets metrics to zero)
+            # A copy, not a reference: the manifest stays cached and later steps
+            # update its metrics in place, which would rewrite this snapshot
             metrics_before = manifest.get("metrics", {}).copy()
 
             # 4. Restore job state to checkpoint
@@ -793,7 +997,6 @@ class LogistEngine:
             # Status remains unchanged for restep - we're just rewinding position
 
             # 5. Record restep event in history
-            from datetime import datetime
             history_entry = {
                 "timestamp": datetime.now().isoformat(),
                 "event": "RESTEP",
@@ -811,9 +1014,8 @@ class LogistEngine:
             manifest["history"].append(history_entry)
 
             # 6. Save updated manifest
-            manifest_path = os.path.join(job_dir, "job_manifest.json")
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            save_job_manifest(job_dir, manifest)
+            self._remember_manifest(job_dir, manifest)
 
             print(f"   ✅ Job '{job_id}' successfully rewound to checkpoint")
             print(f"   📍 Current phase: {target_phase_name} (step {step_number})")
@@ -823,5 +1025,7 @@ class LogistEngine:
             return True
 
         except (JobStateError, OSError, KeyError) as e:
+            # The cached manifest may have been modified without being saved
+            self._manifest_cache.pop(job_dir, None)
             print(f"❌ Error during job restep for '{job_id}': {e}")
             return False
\ No newline at end of file
@@ -5,11 +5,14 @@ This module provides sophisticated error classification, recovery strategies,
 and escalation logic to ensure robust job execution with appropriate human intervention.
 """
 
+import itertools
 import json
 import re
+import secrets
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import time
 
 
@@ -30,7 +33,7 @@ class ErrorCategory(Enum):
     SYSTEM = "system"               # File system, permissions
 
 
-@dataclass
+@dataclass(frozen=True)
 class ErrorClassification:
     """Complete error classification with handling instructions."""
     severity: ErrorSeverity
@@ -58,16 +61,263 @@ class ErrorClassification:
         }
 
 
+# Phrases looked for in subprocess output, one named group per error kind.
+# A single finditer pass reports every kind present; callers apply precedence.
+# Matching ignores case so large outputs never need a lowercased copy.
+_SUBPROCESS_PATTERNS = re.compile(
+    r"(?P<auth>api key|authentication)"
+    r"|(?P<quota>quota exceeded|rate limit)"
+    r"|(?P<network>network|connection)",
+    re.IGNORECASE
+)
+
+# Phrases looked for in system error messages
+_SYSTEM_PATTERNS = re.compile(
+    r"(?P<permission>permission denied|access denied)"
+    r"|(?P<missing>no such file|file not found)"
+    r"|(?P<disk>disk)"
+    r"|(?P<full>full|space)",
+    re.IGNORECASE
+)
+
+
+# Subprocess outputs whose error kinds ErrorClassifier remembers
+OUTPUT_KINDS_CACHE_SIZE = 256
+
+
+def _matched_kinds(pattern: "re.Pattern[str]", *texts: str) -> set:
+    """Return the names of the pattern groups that match anywhere in the texts."""
+    return {match.lastgroup for text in texts for match in pattern.finditer(text)}
+
+
+# Fixed classifications; each classified error is a copy with its own
+# correlation_id (and, where it varies, description or user_message)
+_CLINE_TIMEOUT = ErrorClassification(
+    severity=ErrorSeverity.TRANSIENT,
+    category=ErrorCategory.EXECUTION,
+    description="CLINE execution timed out",
+    user_message="LLM execution timed out. This is usually temporary.",
+    can_retry=True,
+    max_retries=2,
+    intervention_required=False,
+    suggested_action="Automatic retry with increased timeout"
+)
+
+_API_AUTH_FAILED = ErrorClassification(
+    severity=ErrorSeverity.FATAL,
+    category=ErrorCategory.CONFIGURATION,
+    description="API authentication failed",
+    user_message="API key or authentication configuration error.",
+    can_retry=False,
+    max_retries=0,
+    intervention_required=True,
+    suggested_action="Check API keys and authentication setup"
+)
+
+_API_QUOTA_EXCEEDED = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.RESOURCE,
+    description="API quota or rate limit exceeded",
+    user_message="API quota exceeded. Please wait or check billing.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Wait for quota reset or upgrade plan"
+)
+
+_NETWORK_FAILURE = ErrorClassification(
+    severity=ErrorSeverity.TRANSIENT,
+    category=ErrorCategory.NETWORK,
+    description="Network connectivity issue",
+    user_message="Network connection failed. This is usually temporary.",
+    can_retry=True,
+    max_retries=3,
+    intervention_required=False,
+    suggested_action="Automatic retry with exponential backoff"
+)
+
+_CLINE_FAILED = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.EXECUTION,
+    description="CLINE execution failed",
+    user_message="LLM execution failed. Please check the error details.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Review error output and job configuration"
+)
+
+_CLINE_FILE_ERROR = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.SYSTEM,
+    description="File system error in CLINE execution",
+    user_message="File system error occurred during execution.",
+    can_retry=False,
+    max_retries=0,
+    intervention_required=True,
+    suggested_action="Check file permissions and workspace setup"
+)
+
+_SUBPROCESS_SUCCESS = ErrorClassification(
+    severity=ErrorSeverity.TRANSIENT,
+    category=ErrorCategory.EXECUTION,
+    description="Successful execution",
+    user_message="No error occurred",
+    can_retry=False,
+    max_retries=0,
+    intervention_required=False,
+    suggested_action="Continue normal operation"
+)
+
+_UNKNOWN_EXIT_CODE = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.EXECUTION,
+    description="Unknown subprocess exit code",
+    user_message="Unexpected error occurred.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Review error output and contact support if needed"
+)
+
+_MALFORMED_JSON = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.VALIDATION,
+    description="LLM returned malformed JSON",
+    user_message="The LLM response contained invalid JSON format.",
+    can_retry=True,
+    max_retries=2,
+    intervention_required=True,
+    suggested_action="LLM may need better JSON formatting instructions"
+)
+
+_SCHEMA_INVALID = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.VALIDATION,
+    description="LLM response failed schema validation",
+    user_message="The LLM response didn't match expected format.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Review response format requirements with LLM"
+)
+
+_JSON_ERROR = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.VALIDATION,
+    description="JSON processing error",
+    user_message="Error processing structured data from LLM response.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Check LLM response format and schema requirements"
+)
+
+_OPERATION_TIMEOUT = ErrorClassification(
+    severity=ErrorSeverity.TRANSIENT,
+    category=ErrorCategory.EXECUTION,
+    description="Operation timed out",
+    user_message="Operation timed out. This is usually temporary.",
+    can_retry=True,
+    max_retries=2,
+    intervention_required=False,
+    suggested_action="Automatic retry with longer timeout"
+)
+
+_PERMISSION_DENIED = ErrorClassification(
+    severity=ErrorSeverity.FATAL,
+    category=ErrorCategory.SYSTEM,
+    description="Permission denied",
+    user_message="File system permissions prevent operation.",
+    can_retry=False,
+    max_retries=0,
+    intervention_required=True,
+    suggested_action="Check file permissions and user access rights"
+)
+
+_FILE_MISSING = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.SYSTEM,
+    description="Required file missing",
+    user_message="Required file or directory is missing.",
+    can_retry=False,
+    max_retries=0,
+    intervention_required=True,
+    suggested_action="Verify file paths and recreate missing files"
+)
+
+_DISK_FULL = ErrorClassification(
+    severity=ErrorSeverity.FATAL,
+    category=ErrorCategory.RESOURCE,
+    description="Disk space exhausted",
+    user_message="No disk space available for operation.",
+    can_retry=False,
+    max_retries=0,
+    intervention_required=True,
+    suggested_action="Free up disk space and retry"
+)
+
+_SYSTEM_ERROR = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.SYSTEM,
+    description="System error",
+    user_message="System-level error occurred during operation.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Check system resources and configuration"
+)
+
+_UNHANDLED_ERROR = ErrorClassification(
+    severity=ErrorSeverity.RECOVERABLE,
+    category=ErrorCategory.EXECUTION,
+    description="Unhandled error",
+    user_message="An unexpected error occurred.",
+    can_retry=True,
+    max_retries=1,
+    intervention_required=True,
+    suggested_action="Review error details and retry operation"
+)
+
+
 class ErrorClassifier:
     """Classifies errors and provides recovery strategies."""
 
     def __init__(self):
         self.correlation_counter = 0
+        # Random per classifier, so IDs from different processes do not collide
+        self._correlation_prefix = secrets.token_hex(4)
+        # next() on a count is atomic, so threads sharing a classifier get distinct IDs
+        self._correlation_ids = itertools.count(1)
+        # Error kinds found in recent subprocess outputs, least recently used first
+        self._output_kinds: "OrderedDict[Tuple[int, int, int, int], frozenset]" = OrderedDict()
 
     def _generate_correlation_id(self) -> str:
         """Generate unique correlation ID for error tracking."""
-        import uuid
-        return f"error_{uuid.uuid4().hex[:8]}"
+        return f"error_{self._correlation_prefix}{next(self._correlation_ids):08x}"
+
+    def _classified(self, template: ErrorClassification, **changes: Any) -> ErrorClassification:
+        """Copy a fixed classification with a fresh correlation ID and any changed fields."""
+        return replace(template, correlation_id=self._generate_correlation_id(), **changes)
+
+    def _subprocess_output_kinds(self, stdout: str, stderr: str) -> frozenset:
+        """
+        Return the error kinds found in subprocess output.
+
+        Retried commands tend to fail with the same output, so results are
+        remembered by the lengths and hashes of both streams.
+        """
+        key = (len(stdout), len(stderr), hash(stdout), hash(stderr))
+        kinds = self._output_kinds.get(key)
+        if kinds is not None:
+            self._output_kinds.move_to_end(key)
+            return kinds
+
+        kinds = frozenset(_matched_kinds(_SUBPROCESS_PATTERNS, stdout, stderr))
+        self._output_kinds[key] = kinds
+        if len(self._output_kinds) > OUTPUT_KINDS_CACHE_SIZE:
+            self._output_kinds.popitem(last=False)
+        return kinds
 
     def classify_subprocess_error(self, returncode: int, stderr: str, stdout: str) -> ErrorClassification:
         """
@@ -81,115 +331,39 @@ class ErrorClassifier:
         Returns:
             ErrorClassification with handling instructions
         """
-        correlation_id = self._generate_correlation_id()
-        combined_output = (stdout + stderr).lower()
-
         # CLINE-specific exit codes and error patterns
         if returncode == 124:  # timeout
-            return ErrorClassification(
-                severity=ErrorSeverity.TRANSIENT,
-                category=ErrorCategory.EXECUTION,
-                description="CLINE execution timed out",
-                user_message="LLM execution timed out. This is usually temporary.",
-                can_retry=True,
-                max_retries=2,
-                intervention_required=False,
-                suggested_action="Automatic retry with increased timeout",
-                correlation_id=correlation_id
-            )
+            return self._classified(_CLINE_TIMEOUT)
 
         if returncode == 1:  # General error
             # Check for specific CLINE error patterns
-            if "api key" in combined_output or "authentication" in combined_output:
-                return ErrorClassification(
-                    severity=ErrorSeverity.FATAL,
-                    category=ErrorCategory.CONFIGURATION,
-                    description="API authentication failed",
-                    user_message="API key or authentication configuration error.",
-                    can_retry=False,
-                    max_retries=0,
-                    intervention_required=True,
-                    suggested_action="Check API keys and authentication setup",
-                    correlation_id=correlation_id
-                )
-
-            if "quota exceeded" in combined_output or "rate limit" in combined_output:
-                return ErrorClassification(
-                    severity=ErrorSeverity.RECOVERABLE,
-                    category=ErrorCategory.RESOURCE,
-                    description="API quota or rate limit exceeded",
-                    user_message="API quota exceeded. Please wait or check billing.",
-                    can_retry=True,
-                    max_retries=1,
-                    intervention_required=True,
-                    suggested_action="Wait for quota reset or upgrade plan",
-                    correlation_id=correlation_id
-                )
-
-            if "network" in combined_output or "connection" in combined_output:
-                return ErrorClassification(
-                    severity=ErrorSeverity.TRANSIENT,
-                    category=ErrorCategory.NETWORK,
-                    description="Network connectivity issue",
-                    user_message="Network connection failed. This is usually temporary.",
-                    can_retry=True,
-                    max_retries=3,
-                    intervention_required=False,
-                    suggested_action="Automatic retry with exponential backoff",
-                    correlation_id=correlation_id
-                )
+            kinds = self._subprocess_output_kinds(stdout, stderr)
+            if "auth" in kinds:
+                return self._classified(_API_AUTH_FAILED)
+
+            if "quota" in kinds:
+                return self._classified(_API_QUOTA_EXCEEDED)
+
+            if "network" in kinds:
+                return self._classified(_NETWORK_FAILURE)
 
             # Default CLINE error
-            return ErrorClassification(
-                severity=ErrorSeverity.RECOVERABLE,
-                category=ErrorCategory.EXECUTION,
-                description=f"CLINE execution failed with code {returncode}",
-                user_message=f"LLM execution failed. Please check the error details.",
-                can_retry=True,
-                max_retries=1,
-                intervention_required=True,
-                suggested_action="Review error output and job configuration",
-                correlation_id=correlation_id
+            return self._classified(
+                _CLINE_FAILED, description=f"CLINE execution failed with code {returncode}"
             )
 
         if returncode == 2:  # File/directory errors
-            return ErrorClassification(
-                severity=ErrorSeverity.RECOVERABLE,
-                category=ErrorCategory.SYSTEM,
-                description="File system error in CLINE execution",
-                user_message="File system error occurred during execution.",
-                can_retry=False,
-                max_retries=0,
-                intervention_required=True,
-                suggested_action="Check file permissions and workspace setup",
-                correlation_id=correlation_id
-            )
+            return self._classified(_CLINE_FILE_ERROR)
 
         # Success case
         if returncode == 0:
-            return ErrorClassification(
-                severity=ErrorSeverity.TRANSIENT,
-                category=ErrorCategory.EXECUTION,
-                description="Successful execution",
-                user_message="No error occurred",
-                can_retry=False,
-                max_retries=0,
-                intervention_required=False,
-                suggested_action="Continue normal operation",
-                correlation_id=correlation_id
-            )
+            return self._classified(_SUBPROCESS_SUCCESS)
 
         # Unknown exit code
-        return ErrorClassification(
-            severity=ErrorSeverity.RECOVERABLE,
-            category=ErrorCategory.EXECUTION,
+        return self._classified(
+            _UNKNOWN_EXIT_CODE,
             description=f"Unknown subprocess exit code: {returncode}",
-            user_message=f"Unexpected error occurred (exit code {returncode}).",
-            can_retry=True,
-            max_retries=1,
-            intervention_required=True,
-            suggested_action="Review error output and contact support if needed",
-            correlation_id=correlation_id
+            user_message=f"Unexpected error occurred (exit code {returncode})."
         )
 
     def classify_json_error(self, error: Exception, raw_content: str) -> ErrorClassification:
@@ -203,50 +377,18 @@ class ErrorClassifier:
         Returns:
             ErrorClassification with handling instructions
         """
-        correlation_id = self._generate_correlation_id()
         error_str = str(error).lower()
-        content_preview = raw_content[:200] if raw_content else ""
 
         if "json" in error_str and ("decode" in error_str or "parse" in error_str):
             # JSON parsing error from LLM
-            return ErrorClassification(
-                severity=ErrorSeverity.RECOVERABLE,
-                category=ErrorCategory.VALIDATION,
-                description="LLM returned malformed JSON",
-                user_message="The LLM response contained invalid JSON format.",
-                can_retry=True,
-                max_retries=2,
-                intervention_required=True,
-                suggested_action="LLM may need better JSON formatting instructions",
-                correlation_id=correlation_id
-            )
+            return self._classified(_MALFORMED_JSON)
 
         if "schema" in error_str or "validation" in error_str:
             # Schema validation error
-            return ErrorClassification(
-                severity=ErrorSeverity.RECOVERABLE,
-                category=ErrorCategory.VALIDATION,
-                description="LLM response failed schema validation",
-                user_message="The LLM response didn't match expected format.",
-                can_retry=True,
-                max_retries=1,
-                intervention_required=True,
-                suggested_action="Review response format requirements with LLM",
-                correlation_id=correlation_id
-            )
+            return self._classified(_SCHEMA_INVALID)
 
         # Generic JSON error
-        return ErrorClassification(
-            severity=ErrorSeverity.RECOVERABLE,
-            category=ErrorCategory.VALIDATION,
-            description=f"JSON processing error: {str(error)}",
-            user_message="Error processing structured data from LLM response.",
-            can_retry=True,
-            max_retries=1,
-            intervention_required=True,
-            suggested_action="Check LLM response format and schema requirements",
-            correlation_id=correlation_id
-        )
+        return self._classified(_JSON_ERROR, description=f"JSON processing error: {str(error)}")
 
     def classify_timeout_error(self, timeout_seconds: int, operation: str) -> ErrorClassification:
         """
@@ -259,18 +401,8 @@ class ErrorClassifier:
         Returns:
             ErrorClassification with handling instructions
         """
-        correlation_id = self._generate_correlation_id()
-
-        return ErrorClassification(
-            severity=ErrorSeverity.TRANSIENT,
-            category=ErrorCategory.EXECUTION,
-            description=f"{operation} timed out after {timeout_seconds} seconds",
-            user_message=f"Operation timed out. This is usually temporary.",
-            can_retry=True,
-            max_retries=2,
-            intervention_required=False,
-            suggested_action="Automatic retry with longer timeout",
-            correlation_id=correlation_id
+        return self._classified(
+            _OPERATION_TIMEOUT, description=f"{operation} timed out after {timeout_seconds} seconds"
         )
 
     def classify_system_error(self, error: Exception, operation: str) -> ErrorClassification:
@@ -284,60 +416,19 @@ class ErrorClassifier:
         Returns:
             ErrorClassification with handling instructions
         """
-        correlation_id = self._generate_correlation_id()
-        error_str = str(error).lower()
+        kinds = _matched_kinds(_SYSTEM_PATTERNS, str(error))
 
-        if "permission denied" in error_str or "access denied" in error_str:
-            return ErrorClassification(
-                severity=ErrorSeverity.FATAL,
-                category=ErrorCategory.SYSTEM,
-                description=f"Permission denied during {operation}",
-                user_message="File system permissions prevent operation.",
-                can_retry=False,
-                max_retries=0,
-                intervention_required=True,
-                suggested_action="Check file permissions and user access rights",
-                correlation_id=correlation_id
-            )
+        if "permission" in kinds:
+            return self._classified(_PERMISSION_DENIED, description=f"Permission denied during {operation}")
 
-        if "no such file" in error_str or "file not found" in error_str:
-            return ErrorClassification(
-                severity=ErrorSeverity.RECOVERABLE,
-                category=ErrorCategory.SYSTEM,
-                description=f"Required file missing during {operation}",
-                user_message="Required file or directory is missing.",
-                can_retry=False,
-                max_retries=0,
-                intervention_required=True,
-                suggested_action="Verify file paths and recreate missing files",
-                correlation_id=correlation_id
-            )
+        if "missing" in kinds:
+            return self._classified(_FILE_MISSING, description=f"Required file missing during {operation}")
 
-        if "disk" in error_str and ("full" in error_str or "space" in error_str):
-            return ErrorClassification(
-                severity=ErrorSeverity.FATAL,
-                category=ErrorCategory.RESOURCE,
-                description="Disk space exhausted",
-                user_message="No disk space available for operation.",
-                can_retry=False,
-                max_retries=0,
-                intervention_required=True,
-                suggested_action="Free up disk space and retry",
-                correlation_id=correlation_id
-            )
+        if "disk" in kinds and "full" in kinds:
+            return self._classified(_DISK_FULL)
 
         # Generic system error
-        return ErrorClassification(
-            severity=ErrorSeverity.RECOVERABLE,
-            category=ErrorCategory.SYSTEM,
-            description=f"System error during {operation}: {str(error)}",
-            user_message="System-level error occurred during operation.",
-            can_retry=True,
-            max_retries=1,
-            intervention_required=True,
-            suggested_action="Check system resources and configuration",
-            correlation_id=correlation_id
-        )
+        return self._classified(_SYSTEM_ERROR, description=f"System error during {operation}: {str(error)}")
 
 
 # Global error classifier instance
@@ -377,18 +468,7 @@ def classify_error(error: Exception, context: Dict[str, Any]) -> ErrorClassifica
 
     else:
         # Generic error classification
-        correlation_id = error_classifier._generate_correlation_id()
-        return ErrorClassification(
-            severity=ErrorSeverity.RECOVERABLE,
-            category=ErrorCategory.EXECUTION,
-            description=f"Unhandled error: {str(error)}",
-            user_message="An unexpected error occurred.",
-            can_retry=True,
-            max_retries=1,
-            intervention_required=True,
-            suggested_action="Review error details and retry operation",
-            correlation_id=correlation_id
-        )
+        return error_classifier._classified(_UNHANDLED_ERROR, description=f"Unhandled error: {str(error)}")
 
 
 def should_retry_error(classification: ErrorClassification, attempt_count: int) -> bool:
@@ -408,6 +488,20 @@ def should_retry_error(classification: ErrorClassification, attempt_count: int)
     return attempt_count < classification.max_retries
 
 
+def _default_retry_delay(attempt_count: int) -> float:
+    """Default short delay."""
+    return 1.0
+
+
+# Retry delay by error category, given the number of previous attempts
+_RETRY_DELAYS = {
+    # Exponential backoff for network errors
+    ErrorCategory.NETWORK: lambda attempt_count: 2.0 ** attempt_count,
+    # Longer delay for resource/quota issues
+    ErrorCategory.RESOURCE: lambda attempt_count: 30.0 * (attempt_count + 1),
+}
+
+
 def get_retry_delay(classification: ErrorClassification, attempt_count: int) -> float:
     """
     Calculate delay before retry based on error classification and attempt count.
@@ -419,18 +513,7 @@ def get_retry_delay(classification: ErrorClassification, attempt_count: int) ->
     Returns:
         Delay in seconds before retry
     """
-    if classification.category == ErrorCategory.NETWORK:
-        # Exponential backoff for network errors
-        base_delay = 1.0
-        return base_delay * (2 ** attempt_count)
-
-    elif classification.category == ErrorCategory.RESOURCE:
-        # Longer delay for resource/quota issues
-        return 30.0 * (attempt_count + 1)
-
-    else:
-        # Default short delay
-        return 1.0
+    return _RETRY_DELAYS.get(classification.category, _default_retry_delay)(attempt_count)
 
 
 def get_new_job_status(classification: ErrorClassification) -> str:
@@ -87,6 +87,8 @@ class ErrorLogger:
             Correlation ID for tracking this error
         """
         correlation_id = classification.correlation_id
+        # Classifications are frozen; one dict serves the log entry and the tracking record
+        classification_dict = classification.to_dict()
 
         # Create comprehensive log entry
         log_entry = {
@@ -96,7 +98,7 @@ class ErrorLogger:
             "job_dir": job_dir,
             "error_type": type(error).__name__,
             "error_message": str(error),
-            "classification": classification.to_dict(),
+            "classification": classification_dict,
             "context": context or {},
             "system_info": self._get_system_info()
         }
@@ -108,7 +110,7 @@ class ErrorLogger:
         self.correlation_tracking[correlation_id] = {
             "job_id": job_id,
             "timestamp": log_entry["timestamp"],
-            "classification": classification.to_dict(),
+            "classification": classification_dict,
             "resolved": False,
             "retry_count": 0,
             "last_retry": None
@@ -1,12 +1,56 @@
 # logist/job_context.py
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, TextIO, Tuple
+
+from . import workspace_utils
+from .job_processor import load_previous_outcome
+
+# Optional fast JSON for prompt bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Instructions file text by path, with the (mtime_ns, size) it was read at
+_instructions_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+# Manifest keys the enhanced context already carries in other forms
+# (job_history_summary, all_phases), left out of its manifest projection
+_SUMMARIZED_MANIFEST_KEYS = frozenset(("history", "phases"))
+
+# Builds a prompt's pieces from (context, pretty)
+PromptFormatter = Callable[[Dict[str, Any], bool], List[str]]
 
 class JobContextError(Exception):
     """Custom exception for job context related errors."""
     pass
 
+def _read_instructions(path: str) -> Optional[str]:
+    """
+    Reads an instructions file, reusing the last read until its mtime or size changes.
+
+    Returns:
+        The file text, or None if the file cannot be stat'ed.
+
+    Raises:
+        OSError: If the file exists but cannot be read.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _instructions_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    _instructions_cache[path] = (signature, text)
+    return text
+
 def assemble_job_context(
     job_dir: str,
     job_manifest: Dict[str, Any],
@@ -25,84 +69,96 @@ def assemble_job_context(
     Returns:
         A dictionary containing the complete job context.
     """
-    # Import workspace_utils for context assembly
-    from . import workspace_utils
-
     workspace_path = os.path.join(job_dir, "workspace")
 
-    # 1. Job Manifest information
-    job_id = job_manifest.get("job_id", "unknown")
-    current_phase_name = job_manifest.get("current_phase")
+    # 1. Job Manifest information (read once, shared by both context shapes)
+    manifest_get = job_manifest.get
+    job_id = manifest_get("job_id", "unknown")
+    description = manifest_get("description", "A Logist job.")
+    status = manifest_get("status", "PENDING")
+    current_phase_name = manifest_get("current_phase")
+
+    # 2. Workspace Context (needed by both context shapes)
+    workspace_files_summary = workspace_utils.get_workspace_files_summary(job_dir)
+
+    if not enhance:
+        # Minimal context - only file references and basic information.
+        # Returned before anything below runs, so no git call or file read is wasted on it.
+        return {
+            "job_id": job_id,
+            "description": description,
+            "status": status,
+            "current_phase": current_phase_name,
+            "workspace_files": workspace_files_summary  # Keep this for file discovery
+        }
 
     # Get current phase specification
     current_phase_spec = None
-    phases = job_manifest.get("phases", [])
+    phases = manifest_get("phases", [])
     if current_phase_name and phases:
         current_phase_spec = next((p for p in phases if p.get("name") == current_phase_name), None)
 
-    # 2. System Configuration
-    # Load system.md (always included for general instructions)
+    # 3. System Configuration
     system_role_path = os.path.join(jobs_dir, "system.md")
-    system_instructions = ""
-    if os.path.exists(system_role_path):
-        try:
-            with open(system_role_path, 'r') as f:
-                system_instructions = f.read()
-        except OSError:
-            system_instructions = "# System Instructions\n\nUnable to load system instructions."
+    try:
+        system_instructions = _read_instructions(system_role_path) or ""
+    except OSError:
+        system_instructions = "# System Instructions\n\nUnable to load system instructions."
 
-    # 3. Workspace Context
-    workspace_files_summary = workspace_utils.get_workspace_files_summary(job_dir)
     workspace_git_status = workspace_utils.get_workspace_git_status(job_dir)
 
     # 4. Job History and Metrics
-    history = job_manifest.get("history", [])
-    metrics = job_manifest.get("metrics", {"cumulative_cost": 0, "cumulative_time_seconds": 0})
-
-    # Summarize history (last 5 entries for context brevity)
-    history_summary = "No history yet."
-    if history:
-        recent_history = history[-5:]
-        history_entries = []
-        for entry in recent_history:
-            role = entry.get("role", "unknown")
-            action = entry.get("action", "unknown")
-            summary = entry.get("summary", "No summary")
-            history_entries.append(f"- {role}: {action} - {summary}")
-        history_summary = "\n".join(history_entries)
+    history = manifest_get("history", [])
+    metrics = manifest_get("metrics", {"cumulative_cost": 0, "cumulative_time_seconds": 0})
+
+    # Summarize history (last 5 entries for context brevity), walking them
+    # by index rather than copying them out
+    recent_history = (history[i] for i in range(max(len(history) - 5, 0), len(history)))
+    history_summary = "\n".join(
+        f"- {entry.get('role', 'unknown')}: {entry.get('action', 'unknown')} - {entry.get('summary', 'No summary')}"
+        for entry in recent_history
+    ) or "No history yet."
 
     # Summarize metrics
-    metrics_summary = f"Total cost: ${metrics.get('cumulative_cost', 0):.4f}, Total time: {metrics.get('cumulative_time_seconds', 0):.2f}s"
+    metrics_get = metrics.get
+    cumulative_cost = float(metrics_get("cumulative_cost", 0.0))
+    cumulative_time = float(metrics_get("cumulative_time_seconds", 0.0))
+    metrics_summary = f"Total cost: ${cumulative_cost:.4f}, Total time: {cumulative_time:.2f}s"
 
-    # 5. Assemble context based on enhance flag
-    if not enhance:
-        # Minimal context - only file references and basic information
-        context = {
-            "job_id": job_id,
-            "description": job_manifest.get("description", "A Logist job."),
-            "status": job_manifest.get("status", "PENDING"),
-            "current_phase": current_phase_name,
-            "workspace_files": workspace_files_summary  # Keep this for file discovery
-        }
-    else:
-        # Enhanced context - include all available information
-        context = {
-            "job_id": job_id,
-            "description": job_manifest.get("description", "A Logist job."),
-            "status": job_manifest.get("status", "PENDING"),
-            "current_phase": current_phase_name,
-            "phase_specification": current_phase_spec,
-            "system_instructions": system_instructions,
-            "workspace_files": workspace_files_summary,
-            "workspace_git_status": workspace_git_status,
-            "job_history_summary": history_summary,
-            "job_metrics_summary": metrics_summary,
-            "all_phases": phases,
-            "manifest_version": job_manifest  # Include full manifest for complete context
+    # 5. Enhanced context - include all available information
+    context = {
+        "job_id": job_id,
+        "description": description,
+        "status": status,
+        "current_phase": current_phase_name,
+        "phase_specification": current_phase_spec,
+        "system_instructions": system_instructions,
+        "workspace_files": workspace_files_summary,
+        "workspace_git_status": workspace_git_status,
+        "job_history_summary": history_summary,
+        "job_metrics_summary": metrics_summary,
+        "all_phases": phases,
+        # Rest of the manifest, without the parts already summarized above
+        "manifest_version": {
+            key: value for key, value in job_manifest.items() if key not in _SUMMARIZED_MANIFEST_KEYS
         }
+    }
 
     return context
-def format_llm_prompt(context: Dict[str, Any], format_type: str = "human-readable") -> str:
+
+def _dumps_prompt_json(obj: Any, pretty: bool = False) -> str:
+    """Serialize prompt JSON compactly, or indented by two spaces when pretty; orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass  # Huge ints, unsupported types, ...; let stdlib decide
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+def format_llm_prompt(context: Dict[str, Any], format_type: str = "human-readable", pretty: bool = False) -> str:
     """
     Formats the job context into a prompt for the LLM.
     This is a placeholder implementation.
@@ -110,13 +166,24 @@ def format_llm_prompt(context: Dict[str, Any], format_type: str = "human-readabl
     Args:
         context: The job context dictionary.
         format_type: The desired output format (e.g., "human-readable", "json").
+        pretty: Indent embedded JSON for reading while debugging; compact otherwise.
 
     Returns:
         A formatted string representing the LLM prompt.
     """
-    if format_type == "human-readable":
-        prompt = f"""
-Job ID: {context.get('job_id')}
+    return "".join(_llm_prompt_parts(context, format_type, pretty))
+
+def _llm_prompt_parts(context: Dict[str, Any], format_type: str, pretty: bool = False) -> List[str]:
+    """Returns the pieces a prompt is made of, in order, so they can be joined or written out one by one."""
+    try:
+        formatter = _FORMATTERS[format_type]
+    except KeyError:
+        raise ValueError(f"Unsupported format type: {format_type}") from None
+    return formatter(context, pretty)
+
+def _human_readable_parts(context: Dict[str, Any], pretty: bool) -> List[str]:
+    """Prompt pieces for the "human-readable" format."""
+    header = f"""Job ID: {context.get('job_id')}
 Current Phase: {context.get('current_phase')}
 Job Description: {context.get('description')}
 
@@ -125,14 +192,45 @@ Instructions:
 
 ---
 Additional Context:
-{json.dumps(context.get('workspace_files', {}), indent=2)}
 """
-        return prompt.strip()
-    elif format_type == "json-files":
-        # Placeholder for JSON file based prompt format
-        return json.dumps(context, indent=2)
-    else:
-        raise ValueError(f"Unsupported format type: {format_type}")
+    return [header, _dumps_prompt_json(context.get('workspace_files', {}), pretty)]
+
+def _json_files_parts(context: Dict[str, Any], pretty: bool) -> List[str]:
+    """Prompt pieces for the "json-files" format."""
+    # Placeholder for JSON file based prompt format
+    return [_dumps_prompt_json(context, pretty)]
+
+# Prompt formats by name
+_FORMATTERS: Dict[str, PromptFormatter] = {
+    "human-readable": _human_readable_parts,
+    "json-files": _json_files_parts,
+}
+
+def register_llm_prompt_format(format_type: str, formatter: PromptFormatter) -> None:
+    """
+    Registers a prompt format for format_llm_prompt and write_llm_prompt.
+
+    Args:
+        format_type: Name the format is requested by; replaces any existing one.
+        formatter: Called with (context, pretty); returns the prompt as a list of strings.
+    """
+    _FORMATTERS[format_type] = formatter
+
+def write_llm_prompt(fp: TextIO, context: Dict[str, Any], format_type: str = "human-readable", pretty: bool = False) -> None:
+    """
+    Writes the prompt format_llm_prompt would return straight to a text file.
+
+    The embedded JSON is written as its own piece rather than first being
+    copied into one prompt string, so only one copy of it is held at a time.
+
+    Args:
+        fp: Writable text file object.
+        context: The job context dictionary.
+        format_type: The desired output format (e.g., "human-readable", "json").
+        pretty: Indent embedded JSON for reading while debugging; compact otherwise.
+    """
+    for part in _llm_prompt_parts(context, format_type, pretty):
+        fp.write(part)
 
 
 def enhance_context_with_previous_outcome(context: Dict[str, Any], job_dir: str) -> Dict[str, Any]:
@@ -146,9 +244,6 @@ def enhance_context_with_previous_outcome(context: Dict[str, Any], job_dir: str)
     Returns:
         Enhanced context dictionary
     """
-    # Import the function from job_processor
-    from .job_processor import load_previous_outcome
-
     previous_outcome = load_previous_outcome(job_dir)
     if previous_outcome is None:
         return context  # No enhancement needed
@@ -1,8 +1,35 @@
 import json
 import os
-from typing import Dict, Any
+import functools
+import threading
+from typing import BinaryIO, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+# Optional fast JSON for history journal lines
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Append-only journal of history entries not yet folded into jobHistory.json
+HISTORY_JOURNAL_FILENAME = "jobHistory.ndjson"
+
+# The journal is renamed to this while it is being folded into jobHistory.json
+COMPACTING_JOURNAL_SUFFIX = ".compacting"
+
+# Line added to a set-aside journal, followed by the signature of the
+# jobHistory.json its entries are being spliced into
+_SPLICE_MARKER = b"#splicing-onto "
+
+# Read size used when copying jobHistory.json ahead of appended entries
+HISTORY_COPY_CHUNK = 1 << 20
+
+
+@functools.lru_cache(maxsize=128)
+def _history_paths(job_dir: str) -> Tuple[str, str]:
+    """Returns the (jobHistory.json, journal) paths for a job directory."""
+    return os.path.join(job_dir, "jobHistory.json"), os.path.join(job_dir, HISTORY_JOURNAL_FILENAME)
+
 
 class JobHistoryError(Exception):
     """Custom exception for job history related errors."""
@@ -32,18 +59,6 @@ def record_interaction(
     Raises:
         JobHistoryError: If there's an issue writing to the history file.
     """
-    history_file = os.path.join(job_dir, "jobHistory.json")
-
-    # Load existing history or create new
-    if os.path.exists(history_file):
-        try:
-            with open(history_file, 'r') as f:
-                history = json.load(f)
-        except json.JSONDecodeError as e:
-            raise JobHistoryError(f"Invalid JSON in job history file {history_file}: {e}")
-    else:
-        history = []
-
     # Create new interaction record
     interaction = {
         "timestamp": datetime.now().isoformat(),
@@ -55,48 +70,322 @@ def record_interaction(
         "is_simulated": is_simulated
     }
 
-    # Append and save
-    history.append(interaction)
+    # Journaled like every other entry, so entries keep the order they were written in
+    append_history_entry(job_dir, interaction)
+
+
+def append_history_entry(job_dir: str, entry: Dict[str, Any]) -> None:
+    """
+    Appends one entry to the job's history journal without rewriting jobHistory.json.
+
+    Args:
+        job_dir: The absolute path to the job's directory.
+        entry: History entry to append.
+
+    Raises:
+        JobHistoryError: If the entry cannot be serialized or written.
+    """
+    journal_file = _history_paths(job_dir)[1]
 
     try:
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2)
-    except (OSError, TypeError) as e:
-        raise JobHistoryError(f"Failed to write job history to {history_file}: {e}")
+        line = orjson.dumps(entry) if orjson is not None else None
+    except TypeError:
+        line = None  # Non-string keys, huge ints, ...; let stdlib decide
 
+    try:
+        if line is None:
+            line = json.dumps(entry).encode("utf-8")
+        with open(journal_file, 'ab') as f:
+            f.write(line + b"\n")
+    except (OSError, TypeError, ValueError) as e:
+        raise JobHistoryError(f"Failed to append to job history journal {journal_file}: {e}")
 
-def get_job_history(job_dir: str, limit: int = None) -> list:
+
+def read_history_journal(job_dir: str) -> list:
     """
-    Retrieves the job's execution history.
+    Reads the entries appended to the job's history journal.
+
+    Lines that cannot be parsed (such as a write torn by a crash) are skipped.
 
     Args:
         job_dir: The absolute path to the job's directory.
-        limit: Maximum number of interactions to return (most recent first).
 
     Returns:
-        List of interaction records.
+        List of journal entries, oldest first.
 
     Raises:
-        JobHistoryError: If there's an issue reading the history file.
+        JobHistoryError: If the journal exists but cannot be read.
+    """
+    return _read_journal_file(_history_paths(job_dir)[1])
+
+
+def _read_journal_file(journal_file: str) -> list:
+    """Reads the entries of one journal file, skipping unparseable lines; [] if it is missing."""
+    return _load_journal_file(journal_file)[0]
+
+
+def _load_journal_file(journal_file: str) -> Tuple[list, Optional[bytes]]:
+    """
+    Reads one journal file.
+
+    Returns:
+        The entries, skipping unparseable lines, and the jobHistory.json
+        signature from its splice marker, or None if it has none.
+        ([], None) if the file is missing.
+    """
+    try:
+        with open(journal_file, 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return [], None
+    except OSError as e:
+        raise JobHistoryError(f"Failed to read job history journal {journal_file}: {e}")
+
+    entries = []
+    marker = None
+    for line in lines:
+        if not line.strip():
+            continue
+        if line.startswith(_SPLICE_MARKER):
+            marker = line[len(_SPLICE_MARKER):]
+            continue
+        try:
+            entries.append(_parse_journal_line(line))
+        except ValueError:
+            continue
+    return entries, marker
+
+
+def _parse_journal_line(line: bytes) -> Any:
+    """Parse one journal line, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # orjson is stricter (NaN, huge ints); let stdlib decide
+    return json.loads(line)
+
+
+def compact_history_journal(job_dir: str) -> int:
     """
-    history_file = os.path.join(job_dir, "jobHistory.json")
+    Folds the history journal into jobHistory.json and removes the journal.
+
+    The journal is first renamed aside, so entries appended meanwhile start a
+    new journal. Before its entries are spliced in, the set-aside journal is
+    marked with the signature of the jobHistory.json they are being added to,
+    and it is removed afterwards. If a crash leaves it behind, the next
+    compaction splices it in only if jobHistory.json still has that
+    signature, so no entry is lost or written twice.
+
+    Args:
+        job_dir: The absolute path to the job's directory.
+
+    Returns:
+        Number of journal entries moved into jobHistory.json.
+
+    Raises:
+        JobHistoryError: If either history file cannot be read or written.
+    """
+    journal_file = _history_paths(job_dir)[1]
+    compacting_file = journal_file + COMPACTING_JOURNAL_SUFFIX
+
+    # Left over from a compaction that did not finish
+    moved = 0
+    if os.path.exists(compacting_file):
+        moved += _fold_journal_file(job_dir, compacting_file)
+
+    try:
+        os.rename(journal_file, compacting_file)
+    except FileNotFoundError:
+        return moved
+    except OSError as e:
+        raise JobHistoryError(f"Failed to set aside job history journal {journal_file}: {e}")
+
+    return moved + _fold_journal_file(job_dir, compacting_file)
+
+
+def _fold_journal_file(job_dir: str, compacting_file: str) -> int:
+    """Splices a set-aside journal's entries into jobHistory.json unless already done, then removes it."""
+    history_file = _history_paths(job_dir)[0]
+    entries, marker = _load_journal_file(compacting_file)
+    signature = _history_signature(history_file)
+
+    if marker is None:
+        if entries:
+            try:
+                with open(compacting_file, 'ab') as f:
+                    f.write(b"\n" + _SPLICE_MARKER + signature + b"\n")
+            except OSError as e:
+                raise JobHistoryError(f"Failed to mark job history journal {compacting_file}: {e}")
+    elif marker != signature:
+        entries = []  # jobHistory.json was replaced since marking: already spliced
 
-    if not os.path.exists(history_file):
+    if entries:
+        _append_to_history_file(job_dir, entries)
+
+    try:
+        os.remove(compacting_file)
+    except OSError as e:
+        raise JobHistoryError(f"Failed to remove job history journal {compacting_file}: {e}")
+
+    return len(entries)
+
+
+def _unspliced_entries(job_dir: str, compacting_file: str) -> list:
+    """Returns the entries of a set-aside journal that are not yet in jobHistory.json."""
+    entries, marker = _load_journal_file(compacting_file)
+    if marker is not None and marker != _history_signature(_history_paths(job_dir)[0]):
         return []
+    return entries
+
+
+def _history_signature(history_file: str) -> bytes:
+    """
+    Identifies the current jobHistory.json by inode, size and mtime.
 
+    Every write replaces the file, so any splice changes the signature.
+    """
     try:
-        with open(history_file, 'r') as f:
-            history = json.load(f)
+        st = os.stat(history_file)
+    except FileNotFoundError:
+        return b"missing"
+    except OSError as e:
+        raise JobHistoryError(f"Failed to stat job history file {history_file}: {e}")
+    return f"{st.st_ino} {st.st_size} {st.st_mtime_ns}".encode("ascii")
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize as json.dump(indent=2) lays it out, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Non-string keys, huge ints, ...; let stdlib decide
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _append_to_history_file(job_dir: str, entries: list) -> None:
+    """
+    Appends entries to the jobHistory.json array without re-serializing it.
+
+    The closing bracket is located from the end of the file; the bytes before
+    it are copied as they are and the new entries follow, formatted as
+    json.dump(indent=2) would. Files whose tail does not look like a JSON
+    array are loaded and rewritten in full instead. Either way the result is
+    written to a temporary file and moved over jobHistory.json with
+    os.replace, so a crash or full disk never leaves a partial file.
+
+    Raises:
+        JobHistoryError: If the file cannot be read or written.
+    """
+    history_file = _history_paths(job_dir)[0]
+    tmp_path = f"{history_file}.tmp.{os.getpid()}.{threading.get_ident()}"
+
+    try:
+        body = b",\n".join(
+            b"  " + _dumps_indented(entry).replace(b"\n", b"\n  ") for entry in entries
+        )
+    except (TypeError, ValueError) as e:
+        raise JobHistoryError(f"Failed to write job history to {history_file}: {e}")
+
+    try:
+        try:
+            with open(history_file, 'rb') as src:
+                head = src.read(64).lstrip()
+                end = src.seek(0, os.SEEK_END)
+                tail_start = max(0, end - 4096)
+                src.seek(tail_start)
+                tail = src.read().rstrip()
+                before = tail[:-1].rstrip()
+
+                if head.startswith(b"[") and tail.endswith(b"]") and before:
+                    src.seek(0)
+                    with open(tmp_path, 'wb') as dst:
+                        _copy_bytes(src, dst, tail_start + len(before))
+                        dst.write((b"\n" if before.endswith(b"[") else b",\n") + body + b"\n]")
+                    os.replace(tmp_path, history_file)
+                    return
+        except FileNotFoundError:
+            pass
+
+        # No usable array tail: load what is there (or nothing) and rewrite
+        history = _load_history_file(job_dir)
+        history.extend(entries)
+        data = _dumps_indented(history)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, history_file)
+    except (OSError, TypeError, ValueError) as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise JobHistoryError(f"Failed to write job history to {history_file}: {e}")
+
+
+def _copy_bytes(src: BinaryIO, dst: BinaryIO, length: int) -> None:
+    """Copies the next length bytes of src to dst, a chunk at a time."""
+    while length > 0:
+        chunk = src.read(min(length, HISTORY_COPY_CHUNK))
+        if not chunk:
+            raise OSError("job history file shrank while being copied")
+        dst.write(chunk)
+        length -= len(chunk)
+
 
-        if limit:
-            return history[-limit:]
-        return history
+def _load_history_file(job_dir: str) -> list:
+    """
+    Loads the compacted jobHistory.json array, or an empty list if there is none.
+
+    A file holding some other JSON value is treated as empty, as the engine
+    always has, and is replaced by the next write.
+
+    Raises:
+        JobHistoryError: If the file cannot be read or is not valid JSON.
+    """
+    history_file = _history_paths(job_dir)[0]
 
+    try:
+        with open(history_file, 'rb') as f:
+            history = json.load(f)
+    except FileNotFoundError:
+        return []
     except json.JSONDecodeError as e:
         raise JobHistoryError(f"Invalid JSON in job history file {history_file}: {e}")
     except OSError as e:
         raise JobHistoryError(f"Failed to read job history from {history_file}: {e}")
 
+    if not isinstance(history, list):
+        return []
+    return history
+
+
+def get_job_history(job_dir: str, limit: int = None) -> list:
+    """
+    Retrieves the job's execution history, including entries still in the journal.
+
+    Args:
+        job_dir: The absolute path to the job's directory.
+        limit: Maximum number of interactions to return (most recent first).
+
+    Returns:
+        List of interaction records.
+
+    Raises:
+        JobHistoryError: If there's an issue reading the history file.
+    """
+    history = _load_history_file(job_dir)
+
+    # Entries of a compaction still in progress (or cut short), then those
+    # appended since it started
+    journal_file = _history_paths(job_dir)[1]
+    history.extend(_unspliced_entries(job_dir, journal_file + COMPACTING_JOURNAL_SUFFIX))
+    history.extend(read_history_journal(job_dir))
+
+    if limit:
+        return history[-limit:]
+    return history
+
 
 def get_history_stats(job_dir: str) -> Dict[str, Any]:
     """
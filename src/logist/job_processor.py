@@ -1,10 +1,47 @@
+import functools
 import json
 import os
+import re
+import stat
+from datetime import datetime
 from typing import Dict, Any, List, Optional
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from logist.job_state import JobStateError
 
+# Optional fast JSON for CLINE task files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fenced ```json block an LLM wraps its response in
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+# Task ID as CLINE prints it, and a bare UUID to fall back to
+_TASK_ID_RE = re.compile(r'Task created: (.*?)\n')
+_UUID_RE = re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b')
+
+# Schema every LLM response must satisfy
+_LLM_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action": {"type": "string", "enum": ["COMPLETED", "STUCK", "RETRY"]},
+        "evidence_files": {"type": "array", "items": {"type": "string"}},
+        "summary_for_supervisor": {"type": "string", "maxLength": 1000},
+        "job_manifest_url": {"type": "string", "format": "uri"}
+    },
+    "required": ["action", "evidence_files", "summary_for_supervisor"],
+    "additionalProperties": False
+}
+
+# Checked against its metaschema and built once, the same validator class
+# jsonschema.validate() would pick for the schema
+_llm_response_validator_cls = validator_for(_LLM_RESPONSE_SCHEMA)
+_llm_response_validator_cls.check_schema(_LLM_RESPONSE_SCHEMA)
+_LLM_RESPONSE_VALIDATOR = _llm_response_validator_cls(_LLM_RESPONSE_SCHEMA)
+
 
 class JobProcessorError(Exception):
     """Custom exception for job processing related errors."""
@@ -21,20 +58,11 @@ def validate_llm_response(response: Dict[str, Any]) -> None:
     Raises:
         JobProcessorError: If validation fails.
     """
-    schema = {
-        "type": "object",
-        "properties": {
-            "action": {"type": "string", "enum": ["COMPLETED", "STUCK", "RETRY"]},
-            "evidence_files": {"type": "array", "items": {"type": "string"}},
-            "summary_for_supervisor": {"type": "string", "maxLength": 1000},
-            "job_manifest_url": {"type": "string", "format": "uri"}
-        },
-        "required": ["action", "evidence_files", "summary_for_supervisor"],
-        "additionalProperties": False
-    }
-
     try:
-        validate(instance=response, schema=schema)
+        # Report the most relevant error, as jsonschema.validate() does
+        error = best_match(_LLM_RESPONSE_VALIDATOR.iter_errors(response))
+        if error is not None:
+            raise error
     except ValidationError as e:
         raise JobProcessorError(f"LLM response validation failed: {e.message}")
     except Exception as e:
@@ -54,12 +82,25 @@ def parse_llm_response(llm_output: str) -> Dict[str, Any]:
     Raises:
         JobProcessorError: If parsing fails.
     """
-    import re
+    # Output that is nothing but the response object parses directly,
+    # without searching it for a fenced block or braces
+    stripped = llm_output.strip()
+    if stripped.startswith('{'):
+        try:
+            response = json.loads(stripped)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(response, dict):
+                try:
+                    validate_llm_response(response)
+                    return response
+                except JobProcessorError:
+                    pass  # Let the extraction below have its say
 
     # Try to extract JSON from the LLM output
     # Look for JSON blocks in the output (common pattern LLMs use)
-    json_pattern = r'```json\s*(.*?)\s*```'
-    json_match = re.search(json_pattern, llm_output, re.DOTALL)
+    json_match = _JSON_BLOCK_RE.search(llm_output)
 
     if json_match:
         json_str = json_match.group(1)
@@ -83,6 +124,71 @@ def parse_llm_response(llm_output: str) -> Dict[str, Any]:
     return response
 
 
+@functools.lru_cache(maxsize=1)
+def _cline_tasks_dir() -> str:
+    """Returns the directory CLINE stores tasks in (~/.cline/data/tasks), resolved once."""
+    return os.path.join(os.path.expanduser("~"), ".cline", "data", "tasks")
+
+
+@functools.lru_cache(maxsize=1)
+def _prompt_tmp_dir() -> Optional[str]:
+    """Returns a memory-backed directory for prompt files (/dev/shm) if writable, else None for the default."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK):
+        return "/dev/shm"
+    return None
+
+
+def _load_json_file(path: str) -> Any:
+    """Reads and parses a JSON file in one pass, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # orjson is stricter (NaN, huge ints); let stdlib decide
+    return json.loads(data)
+
+
+def _message_text(content: Any) -> Optional[str]:
+    """Returns a message's text: the string itself, or its text blocks joined."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            block["text"] for block in content
+            if isinstance(block, dict) and block.get("type") == "text" and isinstance(block.get("text"), str)
+        )
+    return None
+
+
+def find_llm_response_in_conversation(conversation_history: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Finds the most recent valid LLM response in a CLINE conversation.
+
+    Only assistant messages are considered, newest first; messages whose
+    text has no "{" are skipped without being parsed.
+
+    Args:
+        conversation_history: Messages from api_conversation_history.json.
+
+    Returns:
+        The parsed and validated response, or None if no message holds one.
+    """
+    for message in reversed(conversation_history):
+        if not isinstance(message, dict) or message.get("role") != "assistant":
+            continue
+        text = _message_text(message.get("content"))
+        if not text or '{' not in text:
+            continue
+        try:
+            return parse_llm_response(text)
+        except JobProcessorError:
+            # Continue searching if this message doesn't contain valid JSON
+            continue
+    return None
+
+
 def execute_llm_with_cline(
     context: Dict[str, Any],
     model: str = "grok-code-fast-1",
@@ -110,19 +216,17 @@ def execute_llm_with_cline(
     import subprocess
     import time
     import tempfile
-    from datetime import datetime
 
     start_time = time.time()
+    prompt_file = None
 
     try:
 
-        # Format the context as a human-readable prompt
-        from logist.job_context import format_llm_prompt
-        prompt = format_llm_prompt(context, "human-readable")
-
-        # Create a temporary file with the prompt
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(prompt)
+        # Write the context as a human-readable prompt into a temporary file
+        # (imported here: job_context imports this module at load time)
+        from logist.job_context import write_llm_prompt
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, dir=_prompt_tmp_dir()) as f:
+            write_llm_prompt(f, context, "human-readable")
             prompt_file = f.name
 
         # Prepare CLINE command
@@ -198,58 +302,44 @@ def execute_llm_with_cline(
         full_cline_output = process.stdout + process.stderr
 
         # Extract task ID from CLINE output
-        task_id_match = re.search(r'Task created: (.*?)\n', full_cline_output)
+        task_id_match = _TASK_ID_RE.search(full_cline_output)
         if not task_id_match:
             # Fallback for when CLINE output changes or task ID is not explicitly printed.
             # This is a heuristic and might need adjustment if CLINE's output format is inconsistent.
             # A more robust solution might involve 'cline task list' and checking timestamps.
-            task_id_match = re.search(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', full_cline_output)
+            task_id_match = _UUID_RE.search(full_cline_output)
             if not task_id_match:
                  raise JobProcessorError("Could not extract CLINE task ID from output.")
 
-        task_id = task_id_match.group(1).strip() if task_id_match.group(1).strip() else task_id_match.group(0).strip()
+        # The UUID fallback has no group; use the whole match for it
+        task_id_groups = task_id_match.groups()
+        task_id = task_id_groups[0].strip() if task_id_groups and task_id_groups[0].strip() else task_id_match.group(0).strip()
         
         # Determine the CLINE task directory
-        # Assuming CLINE stores tasks in ~/.cline/data/tasks/
-        cline_data_dir = os.path.join(os.path.expanduser("~"), ".cline", "data")
-        task_dir = os.path.join(cline_data_dir, "tasks", task_id)
-
-        if not os.path.isdir(task_dir):
-            raise JobProcessorError(f"CLINE task directory not found: {task_dir}")
+        task_dir = os.path.join(_cline_tasks_dir(), task_id)
 
         api_conversation_history_path = os.path.join(task_dir, "api_conversation_history.json")
         metadata_path = os.path.join(task_dir, "metadata.json")
 
-        if not os.path.exists(api_conversation_history_path):
+        # Open the task files directly; only a missing one costs a further
+        # stat, to tell a missing task directory from a missing file
+        try:
+            conversation_history = _load_json_file(api_conversation_history_path)
+        except FileNotFoundError:
+            if not os.path.isdir(task_dir):
+                raise JobProcessorError(f"CLINE task directory not found: {task_dir}")
             raise JobProcessorError(f"api_conversation_history.json not found in {task_dir}")
-        if not os.path.exists(metadata_path):
+        try:
+            metadata = _load_json_file(metadata_path)
+        except FileNotFoundError:
             raise JobProcessorError(f"metadata.json not found in {task_dir}")
 
         # Extract JSON response from api_conversation_history.json
-        with open(api_conversation_history_path, 'r') as f:
-            conversation_history = json.load(f)
-
-        llm_response_json = None
-        # Iterate in reverse chronological order
-        for message in reversed(conversation_history):
-            if "content" in message:
-                try:
-                    # Use existing parse_llm_response to extract and validate JSON from content
-                    # Note: parse_llm_response expects a string, so we pass message["content"]
-                    parsed_candidate = parse_llm_response(message["content"])
-                    llm_response_json = parsed_candidate
-                    break # Found the first valid JSON
-                except JobProcessorError:
-                    # Continue searching if this message doesn't contain valid JSON
-                    continue
-
+        llm_response_json = find_llm_response_in_conversation(conversation_history)
         if llm_response_json is None:
             raise JobProcessorError("No valid LLM response JSON found in conversation history.")
 
         # Extract metrics from metadata.json
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-
         metrics = {
             "token_input": metadata.get("metrics", {}).get("token_counts", {}).get("input", 0),
             "token_output": metadata.get("metrics", {}).get("token_counts", {}).get("output", 0),
@@ -284,11 +374,11 @@ def execute_llm_with_cline(
         raise JobProcessorError(f"LLM execution error: {str(e)}")
     finally:
         # Clean up temporary file
-        try:
-            if 'prompt_file' in locals():
+        if prompt_file is not None:
+            try:
                 os.unlink(prompt_file)
-        except:
-            pass
+            except OSError:
+                pass
 
 
 def validate_evidence_files(evidence_files: List[str], workspace_dir: str) -> List[str]:
@@ -311,16 +401,23 @@ def validate_evidence_files(evidence_files: List[str], workspace_dir: str) -> Li
         # Make path relative to workspace and resolve it
         full_path = os.path.join(workspace_dir, file_path.lstrip('/'))
 
-        # Check if file exists
-        if not os.path.exists(full_path):
+        # Check if file exists, with one stat per candidate path
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            st = None
             # Try without stripping leading slash if the original had it
-            if file_path.startswith('/') and os.path.exists(os.path.join(workspace_dir, file_path[1:])):
-                full_path = os.path.join(workspace_dir, file_path[1:])
+            if file_path.startswith('/'):
+                try:
+                    st = os.stat(os.path.join(workspace_dir, file_path[1:]))
+                    full_path = os.path.join(workspace_dir, file_path[1:])
+                except OSError:
+                    pass
 
-        if not os.path.exists(full_path):
+        if st is None:
             raise JobProcessorError(f"Evidence file not found: {file_path}")
 
-        if not os.path.isfile(full_path):
+        if not stat.S_ISREG(st.st_mode):
             raise JobProcessorError(f"Evidence path is not a file: {file_path}")
 
         # Convert to relative path for storage
@@ -354,7 +451,6 @@ def process_simulated_response(
         JobProcessorError: If processing fails.
     """
     import click
-    from datetime import datetime
     from logist.job_state import load_job_manifest, transition_state, update_job_manifest
     # Note: Git commit for simulated responses is a placeholder
     # In production, workspace operations go through the runner interface
@@ -497,7 +593,6 @@ def handle_execution_error(job_dir: str, job_id: str, error: Exception, raw_outp
     """
     from logist.job_state import update_job_manifest, transition_state_on_error, load_job_manifest
     from logist.error_classification import classify_error, should_retry_error, get_retry_delay
-    from datetime import datetime
     import time
     import click # For logging to console
 
@@ -667,14 +762,11 @@ def load_previous_outcome(job_dir: str) -> Optional[Dict[str, Any]]:
     """
     outcome_file = os.path.join(job_dir, "latest-outcome.json")
 
-    if not os.path.exists(outcome_file):
-        return None
-
     try:
         with open(outcome_file, 'r') as f:
             return json.load(f)
     except (json.JSONDecodeError, OSError):
-        return None
+        return None  # Missing (FileNotFoundError) or unreadable
 
 
 def prepare_outcome_for_attachments(job_dir: str, workspace_dir: str) -> Dict[str, Any]:
@@ -1,7 +1,29 @@
 import json
 import os
+import functools
+import hashlib
+import threading
+from datetime import datetime
 from typing import Dict, Any, Tuple
 
+# Optional fast JSON parsing for manifest reads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Last manifest written per path: (content digest, st_mtime_ns, st_size)
+_saved_manifests: Dict[str, Tuple[bytes, int, int]] = {}
+
+# Write buffer for manifests streamed by the stdlib encoder
+MANIFEST_WRITE_BUFFER = 64 * 1024
+
+@functools.lru_cache(maxsize=128)
+def _manifest_path(job_dir: str) -> str:
+    """Returns the manifest path for a job directory; joined once per directory."""
+    return os.path.join(job_dir, "job_manifest.json")
+
+
 class JobStateError(Exception):
     """Custom exception for job state related errors."""
     pass
@@ -73,19 +95,96 @@ def load_job_manifest(job_dir: str) -> Dict[str, Any]:
     Raises:
         JobStateError: If the manifest file is not found or is invalid.
     """
-    manifest_path = os.path.join(job_dir, "job_manifest.json")
-    if not os.path.exists(manifest_path):
-        raise JobStateError(f"Job manifest not found at: {manifest_path}")
-        
+    manifest_path = _manifest_path(job_dir)
     try:
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
-        return manifest
+        if orjson is None:
+            with open(manifest_path, 'r') as f:
+                return json.load(f)
+
+        with open(manifest_path, 'rb') as f:
+            data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, huge ints); let stdlib decide
+            return json.loads(data)
+    except FileNotFoundError:
+        raise JobStateError(f"Job manifest not found at: {manifest_path}")
     except json.JSONDecodeError as e:
         raise JobStateError(f"Invalid job manifest JSON in {manifest_path}: {e}")
     except OSError as e:
         raise JobStateError(f"Error reading job manifest file {manifest_path}: {e}")
 
+def _saved_unchanged(manifest_path: str, digest: bytes) -> bool:
+    """True if digest is what was last written to manifest_path and the file is untouched since."""
+    saved = _saved_manifests.get(manifest_path)
+    if saved is None or saved[0] != digest:
+        return False
+    try:
+        st = os.stat(manifest_path)
+    except OSError:
+        return False  # Gone; write it again
+    return (st.st_mtime_ns, st.st_size) == saved[1:]
+
+def save_job_manifest(job_dir: str, manifest: Dict[str, Any]) -> None:
+    """
+    Atomically writes a job manifest as 2-space indented JSON.
+
+    The manifest is written to a temporary file next to job_manifest.json and
+    moved over it with os.replace, so readers never see a partial file. The
+    temporary name is unique per thread, so the sentinel thread and the
+    engine never write into each other's file. Saving the same content that
+    was last written, while the file is untouched since, does not write.
+    Without orjson the JSON is streamed to the file in chunks rather than
+    built as one string.
+
+    Args:
+        job_dir: The absolute path to the job's directory.
+        manifest: Manifest dictionary to write.
+
+    Raises:
+        JobStateError: If the manifest cannot be written.
+    """
+    manifest_path = _manifest_path(job_dir)
+    tmp_path = f"{manifest_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Non-string keys, huge ints, ...; let stdlib decide
+
+    try:
+        if data is not None:
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if _saved_unchanged(manifest_path, digest):
+                return
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        else:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(tmp_path, 'wb', buffering=MANIFEST_WRITE_BUFFER) as f:
+                for chunk in json.JSONEncoder(indent=2).iterencode(manifest):
+                    chunk = chunk.encode("utf-8")
+                    hasher.update(chunk)
+                    f.write(chunk)
+            digest = hasher.digest()
+            if _saved_unchanged(manifest_path, digest):
+                os.remove(tmp_path)
+                return
+
+        os.replace(tmp_path, manifest_path)
+        st = os.stat(manifest_path)
+        _saved_manifests[manifest_path] = (digest, st.st_mtime_ns, st.st_size)
+    except (OSError, TypeError, ValueError) as e:
+        _saved_manifests.pop(manifest_path, None)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise JobStateError(f"Failed to write updated manifest to {manifest_path}: {e}")
+
 def get_current_state(manifest: Dict[str, Any]) -> str:
     """
     Determines the current phase based on the job manifest.
@@ -452,46 +551,30 @@ def validate_error_transition(current_status: str, target_status: str) -> bool:
     return True  # For now, be permissive with error transitions
 
 
-def update_job_manifest(
-    job_dir: str,
+def apply_manifest_update(
+    manifest: Dict[str, Any],
     new_status: str = None,
     new_phase: str = None,
     cost_increment: float = 0.0,
     time_increment: float = 0.0,
-    history_entry: Dict[str, Any] = None,
-    skip_backup: bool = False
-) -> Dict[str, Any]:
+    history_entry: Dict[str, Any] = None
+) -> bool:
     """
-    Updates the job manifest with new state and metrics.
+    Applies a state and metrics update to an in-memory job manifest.
 
     Args:
-        job_dir: The absolute path to the job's directory.
+        manifest: Job manifest dictionary, modified in place.
         new_status: New status string to set.
         new_phase: New phase to advance to.
         cost_increment: Amount to add to cumulative cost.
         time_increment: Time in seconds to add to cumulative time.
         history_entry: History entry to append (dict with appropriate fields).
-        skip_backup: If True, skip creating a backup before changes (dangerous!).
 
     Returns:
-        Updated manifest dictionary.
-
-    Raises:
-        JobStateError: If update fails.
+        True if the manifest was modified.
     """
-    manifest = load_job_manifest(job_dir)
     modified = False
 
-    # Create backup before making any changes (unless explicitly skipped)
-    if not skip_backup and (new_status or new_phase or cost_increment > 0 or time_increment > 0 or history_entry):
-        try:
-            from logist.recovery import create_job_manifest_backup
-            create_job_manifest_backup(job_dir)
-        except Exception:
-            # Log warning but don't fail - backup is nice but not critical
-            import sys
-            print("Warning: Failed to create job manifest backup", file=sys.stderr)
-
     # Update status
     if new_status is not None:
         manifest["status"] = new_status
@@ -517,19 +600,63 @@ def update_job_manifest(
             manifest["history"] = []
         # Add timestamp if not present
         if "timestamp" not in history_entry:
-            from datetime import datetime
             history_entry["timestamp"] = datetime.now().isoformat()
         manifest["history"].append(history_entry)
         modified = True
 
+    return modified
+
+def update_job_manifest(
+    job_dir: str,
+    new_status: str = None,
+    new_phase: str = None,
+    cost_increment: float = 0.0,
+    time_increment: float = 0.0,
+    history_entry: Dict[str, Any] = None,
+    skip_backup: bool = False
+) -> Dict[str, Any]:
+    """
+    Updates the job manifest with new state and metrics.
+
+    Args:
+        job_dir: The absolute path to the job's directory.
+        new_status: New status string to set.
+        new_phase: New phase to advance to.
+        cost_increment: Amount to add to cumulative cost.
+        time_increment: Time in seconds to add to cumulative time.
+        history_entry: History entry to append (dict with appropriate fields).
+        skip_backup: If True, skip creating a backup before changes (dangerous!).
+
+    Returns:
+        Updated manifest dictionary.
+
+    Raises:
+        JobStateError: If update fails.
+    """
+    manifest = load_job_manifest(job_dir)
+
+    # Create backup before making any changes (unless explicitly skipped)
+    if not skip_backup and (new_status or new_phase or cost_increment > 0 or time_increment > 0 or history_entry):
+        try:
+            from logist.recovery import create_job_manifest_backup
+            create_job_manifest_backup(job_dir)
+        except Exception:
+            # Log warning but don't fail - backup is nice but not critical
+            import sys
+            print("Warning: Failed to create job manifest backup", file=sys.stderr)
+
+    modified = apply_manifest_update(
+        manifest,
+        new_status=new_status,
+        new_phase=new_phase,
+        cost_increment=cost_increment,
+        time_increment=time_increment,
+        history_entry=history_entry
+    )
+
     # Save only if modified
     if modified:
-        manifest_path = os.path.join(job_dir, "job_manifest.json")
-        try:
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
-        except OSError as e:
-            raise JobStateError(f"Failed to write updated manifest to {manifest_path}: {e}")
+        save_job_manifest(job_dir, manifest)
 
     # Queue cleanup: remove jobs from queue when transitioning to terminal states
     if new_status is not None and new_status in [JobStates.SUCCESS, JobStates.CANCELED]:
@@ -540,10 +667,13 @@ def update_job_manifest(
                 jobs_dir = os.path.dirname(job_dir)
                 jobs_index_path = os.path.join(jobs_dir, "jobs_index.json")
 
-                if os.path.exists(jobs_index_path):
+                try:
                     with open(jobs_index_path, 'r') as f:
                         jobs_index = json.load(f)
+                except FileNotFoundError:
+                    jobs_index = None
 
+                if jobs_index is not None:
                     queue = jobs_index.get("queue", [])
                     if job_id in queue:
                         queue.remove(job_id)
@@ -580,9 +710,8 @@ def update_job_manifest(
                             }
                             manifest["history"].append(cleanup_entry)
                             # Save cleanup event (without triggering another cleanup cycle)
-                            with open(manifest_path, 'w') as f:
-                                json.dump(manifest, f, indent=2)
-                        except OSError as cleanup_error:
+                            save_job_manifest(job_dir, manifest)
+                        except (OSError, JobStateError) as cleanup_error:
                             # Cleanup failed, log but don't fail the status update
                             import sys
                             print(f"Warning: Workspace cleanup failed for {job_dir}: {cleanup_error}", file=sys.stderr)
@@ -218,7 +218,6 @@ def perform_automatic_recovery(job_dir: str, recovery_action: str) -> Dict[str,
         manifest = load_job_manifest(job_dir)
 
         from logist.job_state import update_job_manifest
-        from datetime import datetime
 
         # Create recovery history entry
         recovery_entry = {
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 from logist import workspace_utils
-from logist.job_state import JobStateError, load_job_manifest, get_current_state, update_job_manifest, transition_state, JobStates
+from logist.job_state import JobStateError, load_job_manifest, save_job_manifest, get_current_state, update_job_manifest, transition_state, JobStates
 
 
 class JobManagerService:
@@ -622,8 +622,7 @@ class JobManagerService:
             # Save the complete updated manifest
             manifest_path = os.path.join(job_dir, "job_manifest.json")
             print(f"[DEBUG {datetime.now().strftime('%H:%M:%S.%f')}] Writing job manifest in activate_job: {manifest_path}")
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            save_job_manifest(job_dir, manifest)
             print(f"[DEBUG {datetime.now().strftime('%H:%M:%S.%f')}] Job manifest written in activate_job: {manifest_path}")
 
             # Load/update jobs index to add job to queue
@@ -8,6 +8,9 @@ from typing import List, Dict, Any, Optional
 
 import click
 
+# Key workspace file text by path, with the (mtime_ns, size) it was read at
+_key_file_cache: Dict[str, tuple] = {}
+
 def find_git_root(cwd=None):
     """Find the root directory of the Git repository from the current working directory."""
     if cwd is None:
@@ -370,12 +373,23 @@ def get_workspace_files_summary(job_dir: str) -> Dict[str, Any]:
     files_to_read = ["README.md", "pyproject.toml", "requirements.txt", "logist/cli.py"] # Example files
     for f_name in files_to_read:
         file_path = os.path.join(workspace_dir, f_name)
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r') as f:
-                    summary["important_files"][f_name] = f.read()
-            except Exception as e:
-                summary["important_files"][f_name] = f"Could not read file: {e}"
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        # Unchanged files are taken from the previous summary instead of re-read
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _key_file_cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            summary["important_files"][f_name] = cached[1]
+            continue
+        try:
+            with open(file_path, 'r') as f:
+                content = f.read()
+            _key_file_cache[file_path] = (signature, content)
+            summary["important_files"][f_name] = content
+        except Exception as e:
+            summary["important_files"][f_name] = f"Could not read file: {e}"
 
     return summary
 
@@ -478,7 +492,6 @@ def perform_git_commit(
         Exception: If Git operations fail.
     """
     import subprocess
-    from datetime import datetime
 
     workspace_dir = os.path.join(job_dir, "workspace")
     result = {
@@ -906,7 +919,6 @@ def backup_workspace_before_cleanup(job_dir: str, backup_dir: Optional[str] = No
 
         # Create archive of workspace
         import tarfile
-        from datetime import datetime
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_archive = os.path.join(backup_dir, f"workspace_backup_{timestamp}.tar.gz")
@@ -1124,6 +1136,34 @@ def collect_attachment_files(job_dir: str) -> List[str]:
     return attachment_files
 
 
+def copy_file_if_changed(src: str, dest: str) -> bool:
+    """
+    Copies a file with its metadata unless dest already matches it.
+
+    copy2 preserves the modification time, so a destination with the same
+    mtime and size as the source is taken to be an earlier copy of it.
+
+    Args:
+        src: Source file path
+        dest: Destination file path
+
+    Returns:
+        True if the file was copied, False if dest was already up to date
+    """
+    src_stat = os.stat(src)
+    try:
+        dest_stat = os.stat(dest)
+    except FileNotFoundError:
+        dest_stat = None
+
+    if (dest_stat is not None and dest_stat.st_mtime_ns == src_stat.st_mtime_ns
+            and dest_stat.st_size == src_stat.st_size):
+        return False
+
+    shutil.copy2(src, dest)
+    return True
+
+
 def prepare_workspace_attachments(job_dir: str, workspace_dir: str) -> Dict[str, Any]:
     """
     Prepares attachments and discovered files for workspace execution.
@@ -1160,8 +1200,8 @@ def prepare_workspace_attachments(job_dir: str, workspace_dir: str) -> Dict[str,
             # Ensure destination directory exists
             os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
-            # Copy the file
-            shutil.copy2(attachment, dest_path)
+            # Copy the file unless an earlier step already did
+            copy_file_if_changed(attachment, dest_path)
 
         # Discover files for --file arguments
         discovered_files = discover_file_arguments(job_dir)
@@ -4,6 +4,7 @@ Unit tests for LogistEngine (Core Engine)
 Tests the core job execution engine functionality.
 """
 
+import io
 import json
 import os
 import shutil
@@ -11,7 +12,9 @@ import tempfile
 import unittest
 from unittest.mock import patch, MagicMock, call
 
+from logist import core_engine
 from logist.core_engine import LogistEngine
+from logist.job_history import JobHistoryError, get_job_history, record_interaction
 from logist.job_state import JobStates
 from logist.runners.mock import MockRunner
 
@@ -98,13 +101,276 @@ class TestLogistEngine(unittest.TestCase):
 
         self.engine._write_job_history_entry(self.job_dir, entry)
 
-        with open(history_file, 'r') as f:
-            history = json.load(f)
+        history = get_job_history(self.job_dir)
 
         self.assertEqual(len(history), 2)
         self.assertEqual(history[0]["old_entry"], "value")
         self.assertEqual(history[1]["model"], "new-model")
 
+    def test_write_job_history_appends_to_journal(self):
+        """Entries are journaled without rewriting jobHistory.json, then compacted."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        entry = {"model": "m", "note": "naïve"}
+
+        with patch('logist.job_history.orjson', None):
+            self.engine._write_job_history_entry(self.job_dir, entry)
+        self.engine._write_job_history_entry(self.job_dir, entry)
+
+        self.assertFalse(os.path.exists(history_file))
+        self.assertEqual(get_job_history(self.job_dir), [entry, entry])
+
+        self.engine._compact_job_history(self.job_dir)
+
+        self.assertFalse(os.path.exists(os.path.join(self.job_dir, "jobHistory.ndjson")))
+        with open(history_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [entry, entry])
+
+    def test_compact_job_history_appends_to_existing_array(self):
+        """Compaction splices entries onto the existing array as json.dump would write it."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        with open(history_file, 'w') as f:
+            json.dump([{"old_entry": "value"}], f, indent=2)
+
+        self.engine._write_job_history_entry(self.job_dir, {"new": ["entry"]})
+        self.engine._compact_job_history(self.job_dir)
+
+        with open(history_file, 'r') as f:
+            content = f.read()
+        expected = [{"old_entry": "value"}, {"new": ["entry"]}]
+        self.assertEqual(content, json.dumps(expected, indent=2))
+
+    def test_recorded_interactions_keep_write_order(self):
+        """Interactions and engine entries come back in the order they were written."""
+        self.engine._write_job_history_entry(self.job_dir, {"n": 1})
+        record_interaction(self.job_dir, {"prompt": "p"}, {"action": "COMPLETED"}, 1.0, "m", 0.1)
+        self.engine._write_job_history_entry(self.job_dir, {"n": 3})
+
+        history = get_job_history(self.job_dir)
+        self.assertEqual(history[0], {"n": 1})
+        self.assertEqual(history[1]["request"], {"prompt": "p"})
+        self.assertEqual(history[2], {"n": 3})
+
+    def test_compaction_finishes_interrupted_compaction(self):
+        """A journal set aside by a compaction that stopped before writing is folded in first."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        with open(history_file, 'w') as f:
+            json.dump([{"n": 1}], f, indent=2)
+        with open(os.path.join(self.job_dir, "jobHistory.ndjson.compacting"), 'w') as f:
+            f.write('{"n": 2}\n')
+        self.engine._write_job_history_entry(self.job_dir, {"n": 3})
+
+        self.assertEqual(get_job_history(self.job_dir), [{"n": 1}, {"n": 2}, {"n": 3}])
+
+        self.engine._compact_job_history(self.job_dir)
+
+        self.assertFalse(os.path.exists(os.path.join(self.job_dir, "jobHistory.ndjson.compacting")))
+        with open(history_file, 'r') as f:
+            self.assertEqual(json.load(f), [{"n": 1}, {"n": 2}, {"n": 3}])
+
+    def test_compaction_does_not_repeat_written_entries(self):
+        """A compaction that stopped after writing jobHistory.json is not written twice."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        with open(history_file, 'w') as f:
+            json.dump([{"n": 1}], f, indent=2)
+        self.engine._write_job_history_entry(self.job_dir, {"n": 2})
+
+        real_remove = os.remove
+
+        def remove(path):
+            if path.endswith(".compacting"):
+                raise OSError("interrupted")
+            real_remove(path)
+
+        with patch('logist.job_history.os.remove', side_effect=remove), \
+                patch('sys.stdout', new_callable=io.StringIO):
+            self.engine._compact_job_history(self.job_dir)
+
+        self.assertEqual(get_job_history(self.job_dir), [{"n": 1}, {"n": 2}])
+
+        self.engine._compact_job_history(self.job_dir)
+
+        self.assertFalse(os.path.exists(os.path.join(self.job_dir, "jobHistory.ndjson.compacting")))
+        with open(history_file, 'r') as f:
+            self.assertEqual(json.load(f), [{"n": 1}, {"n": 2}])
+
+    def test_compaction_keeps_entries_equal_to_history_tail(self):
+        """Set-aside entries identical to the last ones in jobHistory.json are still added."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        with open(history_file, 'w') as f:
+            json.dump([{"n": 1}], f, indent=2)
+        self.engine._write_job_history_entry(self.job_dir, {"n": 1})
+
+        with patch('logist.job_history._append_to_history_file', side_effect=JobHistoryError("disk full")), \
+                patch('sys.stdout', new_callable=io.StringIO):
+            self.engine._compact_job_history(self.job_dir)
+
+        self.assertEqual(get_job_history(self.job_dir), [{"n": 1}, {"n": 1}])
+
+        self.engine._compact_job_history(self.job_dir)
+
+        with open(history_file, 'r') as f:
+            self.assertEqual(json.load(f), [{"n": 1}, {"n": 1}])
+
+    def test_failed_compaction_leaves_history_intact(self):
+        """A write that fails partway leaves jobHistory.json as it was."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        with open(history_file, 'w') as f:
+            json.dump([{"n": 1}], f, indent=2)
+        self.engine._write_job_history_entry(self.job_dir, {"n": 2})
+
+        with patch('logist.job_history.os.replace', side_effect=OSError("No space left on device")), \
+                patch('sys.stdout', new_callable=io.StringIO):
+            self.engine._compact_job_history(self.job_dir)
+
+        with open(history_file, 'r') as f:
+            self.assertEqual(json.load(f), [{"n": 1}])
+        self.assertEqual(get_job_history(self.job_dir), [{"n": 1}, {"n": 2}])
+        self.assertFalse([name for name in os.listdir(self.job_dir) if ".tmp." in name])
+
+    def test_non_list_history_file_is_replaced(self):
+        """A jobHistory.json holding something other than a list reads as empty and is replaced."""
+        history_file = os.path.join(self.job_dir, "jobHistory.json")
+        with open(history_file, 'w') as f:
+            json.dump({"not": "a list"}, f)
+
+        self.assertEqual(get_job_history(self.job_dir), [])
+
+        self.engine._write_job_history_entry(self.job_dir, {"n": 1})
+        self.engine._compact_job_history(self.job_dir)
+
+        with open(history_file, 'r') as f:
+            self.assertEqual(json.load(f), [{"n": 1}])
+
+    def test_history_journal_skips_torn_line(self):
+        """A partially written last line does not hide earlier entries."""
+        self.engine._write_job_history_entry(self.job_dir, {"n": 1})
+        with open(os.path.join(self.job_dir, "jobHistory.ndjson"), 'ab') as f:
+            f.write(b'{"n": 2')
+
+        self.assertEqual(get_job_history(self.job_dir), [{"n": 1}])
+
+    def test_maybe_log_history_only_in_debug_mode(self):
+        """Debug history entries are neither built nor written outside debug mode."""
+        kwargs = dict(operation="step", model="m", action="COMPLETED", summary="done", phase="p")
+
+        with patch('logist.core_engine.datetime') as mock_datetime:
+            self.engine._maybe_log_history(False, self.job_dir, "step", "test-job", **kwargs)
+            mock_datetime.now.assert_not_called()
+        self.assertEqual(get_job_history(self.job_dir), [])
+
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.engine._maybe_log_history(True, self.job_dir, "step", "test-job", **kwargs)
+        entry, = get_job_history(self.job_dir)
+        self.assertEqual(entry["request"], {"operation": "step", "job_id": "test-job", "phase": "p"})
+        self.assertEqual(entry["response"]["action"], "COMPLETED")
+
+    def test_cached_load_manifest_reloads_only_on_change(self):
+        """The manifest is parsed once until the file changes on disk."""
+        with patch('logist.core_engine.load_job_manifest',
+                   wraps=core_engine.load_job_manifest) as load:
+            first = self.engine._cached_load_manifest(self.job_dir)
+            self.assertIs(self.engine._cached_load_manifest(self.job_dir), first)
+            self.assertEqual(load.call_count, 1)
+
+            self.manifest["status"] = "RUNNING"
+            with open(self.manifest_path, 'w') as f:
+                json.dump(self.manifest, f)
+            os.utime(self.manifest_path, ns=(0, 1))
+
+            self.assertEqual(self.engine._cached_load_manifest(self.job_dir)["status"], "RUNNING")
+            self.assertEqual(load.call_count, 2)
+
+    def _disk_manifest(self):
+        with open(self.manifest_path, 'r') as f:
+            return json.load(f)
+
+    def test_run_loop_writes_every_step(self):
+        """Step updates inside run_job reach the disk as each step finishes."""
+        self.engine._in_run_loop = True
+
+        self.engine._update_manifest(self.job_dir, JobStates.RUNNING, 0.5, 1.0, {"step": 1})
+        manifest = self._disk_manifest()
+        self.assertEqual(manifest["status"], JobStates.RUNNING)
+        self.assertEqual([entry["step"] for entry in manifest["history"]], [1])
+        self.assertEqual(manifest["metrics"]["cumulative_cost"], 0.5)
+
+    def test_run_loop_keeps_other_writers_changes(self):
+        """A step applied after someone else rewrote the manifest keeps both changes."""
+        self.engine._in_run_loop = True
+        self.engine._update_manifest(self.job_dir, JobStates.RUNNING, 0.5, 1.0, {"step": 1})
+
+        external = self._disk_manifest()
+        external["history"].append({"event": "EXTERNAL"})
+        with open(self.manifest_path, 'w') as f:
+            json.dump(external, f)
+        os.utime(self.manifest_path, ns=(0, 1))
+
+        self.engine._update_manifest(self.job_dir, JobStates.RUNNING, 0.5, 1.0, {"step": 2})
+        manifest = self._disk_manifest()
+        self.assertEqual([entry.get("step", entry.get("event")) for entry in manifest["history"]],
+                         [1, "EXTERNAL", 2])
+        self.assertEqual(manifest["metrics"]["cumulative_cost"], 1.0)
+
+    def test_run_loop_writes_stop_state_immediately(self):
+        """A status that stops the run is saved through update_job_manifest."""
+        self.engine._in_run_loop = True
+
+        self.engine._update_manifest(self.job_dir, JobStates.RUNNING, 0.0, 1.0, {"step": 1})
+        self.engine._update_manifest(self.job_dir, JobStates.INTERVENTION_REQUIRED, 0.0, 1.0, {"step": 2})
+
+        manifest = self._disk_manifest()
+        self.assertEqual(manifest["status"], JobStates.INTERVENTION_REQUIRED)
+        self.assertEqual([entry["step"] for entry in manifest["history"]], [1, 2])
+
+    def test_status_log_level_follows_terminal_and_quiet(self):
+        """Progress messages are only shown on a terminal without --quiet, or with --debug."""
+        tty = io.StringIO()
+        tty.isatty = lambda: True
+
+        with patch('sys.stdout', tty):
+            core_engine._configure_status_log({})
+            core_engine.log.info("progress %s", 1)
+            core_engine._configure_status_log({"QUIET": True})
+            core_engine.log.info("progress %s", 2)
+            core_engine.log.warning("warning %s", 3)
+        self.assertEqual(tty.getvalue(), "progress 1\nwarning 3\n")
+
+        with patch('sys.stdout', new_callable=io.StringIO) as piped:
+            core_engine._configure_status_log({})
+            core_engine.log.info("hidden")
+            core_engine._configure_status_log({"DEBUG": True})
+            core_engine.log.info("shown")
+        self.assertEqual(piped.getvalue(), "shown\n")
+
+    def test_restep_single_step_updates_cached_manifest(self):
+        """A restep records its history and metrics without re-reading the manifest."""
+        ctx = MagicMock(obj={"JOBS_DIR": self.test_dir})
+        response = {"action": "COMPLETED", "summary_for_supervisor": "redo", "metrics": {"cost_usd": 0.25}}
+
+        with patch('logist.core_engine.execute_llm_with_cline', return_value=(response, 2.0)), \
+                patch('logist.core_engine.update_job_manifest') as update, \
+                patch.object(self.engine, 'ensure_job_workspace_ready'):
+            self.assertTrue(self.engine.restep_single_step(ctx, "test-job", self.job_dir, 0))
+
+        update.assert_not_called()
+        manifest = self._disk_manifest()
+        self.assertEqual(manifest["status"], "PENDING")
+        self.assertEqual(manifest["metrics"]["cumulative_cost"], 0.25)
+        self.assertEqual([entry["event"] for entry in manifest["history"]], ["RESTEP"])
+
+    def test_restep_job_snapshots_metrics(self):
+        """The RESTEP entry keeps the metrics as they were, even after later steps."""
+        ctx = MagicMock(obj={"JOBS_DIR": self.test_dir})
+        with patch('sys.stdout', new_callable=io.StringIO):
+            self.assertTrue(self.engine.restep_job(ctx, "test-job", self.job_dir, 0))
+
+        self.engine._in_run_loop = True
+        self.engine._update_manifest(self.job_dir, JobStates.RUNNING, 1.0, 1.0, {"step": 1})
+
+        restep, step = self._disk_manifest()["history"]
+        self.assertEqual(restep["metrics_before_restep"]["cumulative_cost"], 0.0)
+        self.assertEqual(step["step"], 1)
+
     @unittest.skip("Disabled due to datetime import issue - will be re-enabled in later phase")
     @patch('logist.core_engine.datetime')
     def test_write_job_history_write_error(self, mock_datetime):
@@ -120,7 +386,6 @@ class TestLogistEngine(unittest.TestCase):
             # Should not raise exception, but handle error gracefully
             self.engine._write_job_history_entry(self.job_dir, entry)
 
-    @unittest.skip("Disabled due to datetime import issue - will be re-enabled in later phase")
     @patch('logist.core_engine.datetime')
     def test_show_debug_history_info(self, mock_datetime):
         """Test debug history info display."""
@@ -156,18 +421,17 @@ class TestLogistEngine(unittest.TestCase):
         }
 
         # Test with debug=True - should print debug info
-        with patch('builtins.print') as mock_print:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
             self.engine._show_debug_history_info(True, "test", "test-job", entry)
 
-            # Verify debug prints were called (check some key calls)
-            mock_print.assert_any_call("   📝 [DEBUG] Writing to jobHistory.json for test operation:")
+            # Verify debug output was written (check some key lines)
+            self.assertIn("   📝 [DEBUG] Writing to jobHistory.json for test operation:\n", stdout.getvalue())
 
         # Test with debug=False - should not print
-        with patch('builtins.print') as mock_print:
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
             self.engine._show_debug_history_info(False, "test", "test-job", entry)
-            mock_print.assert_not_called()
+            self.assertEqual(stdout.getvalue(), "")
 
-    @unittest.skip("Disabled due to datetime import issue - will be re-enabled in later phase")
     @patch('logist.core_engine.datetime')
     def test_show_debug_history_info_minimal_metrics(self, mock_datetime):
         """Test debug info with minimal metrics."""
@@ -0,0 +1,171 @@
+"""
+Unit tests for JobRecoveryManager (core recovery)
+
+Tests crash detection, consistency validation and recovery helpers.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from logist.core import recovery as recovery_module
+from logist.core.job_directory import JobDirectoryManager
+from logist.core.locking import FileLock
+from logist.core.recovery import JobRecoveryManager
+
+
+class TestJobRecoveryManager(unittest.TestCase):
+    """Test cases for JobRecoveryManager functionality."""
+
+    def setUp(self):
+        """Set up a jobs directory with jobs in a few different states."""
+        self.jobs_dir = tempfile.mkdtemp()
+        dir_manager = JobDirectoryManager(self.jobs_dir)
+        dir_manager.ensure_base_structure()
+
+        for job_id, status in [("running-job", "RUNNING"), ("done-job", "SUCCESS")]:
+            job_dir = dir_manager.create_job_directory(job_id, {})
+            self._set_status(job_dir, status)
+
+        self.manager = JobRecoveryManager(self.jobs_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.jobs_dir)
+
+    def _set_status(self, job_dir, status):
+        manifest_path = os.path.join(job_dir, "job_manifest.json")
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        manifest["status"] = status
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+
+    def test_detect_crashed_jobs(self):
+        """Unlocked jobs that should be locked are reported, repeatedly."""
+        for _ in range(2):
+            crashed = self.manager.detect_crashed_jobs()
+            self.assertEqual([job["job_id"] for job in crashed], ["running-job"])
+            self.assertEqual(crashed[0]["reason"], "lock_available_but_should_be_locked")
+
+    def test_detect_crashed_jobs_ignores_lock_file_mtime(self):
+        """A recently touched but unheld lock file does not hide a crashed job."""
+        open(os.path.join(self.jobs_dir, "running-job", ".lock"), 'w').close()
+
+        crashed = self.manager.detect_crashed_jobs()
+        self.assertEqual([job["job_id"] for job in crashed], ["running-job"])
+
+    def test_detect_crashed_jobs_skips_held_lock(self):
+        """A job whose lock is held elsewhere is treated as alive without waiting for it."""
+        holder = FileLock(os.path.join(self.jobs_dir, "running-job", ".lock"))
+        holder.acquire()
+        try:
+            with patch('logist.core.locking.time.sleep') as sleep:
+                self.assertEqual(self.manager.detect_crashed_jobs(), [])
+            sleep.assert_not_called()
+        finally:
+            holder.release()
+
+    def test_should_job_be_locked_cached_by_manifest_mtime(self):
+        """Lock state is cached until the manifest changes."""
+        job_dir = os.path.join(self.jobs_dir, "running-job")
+
+        with patch('logist.core.recovery.load_job_manifest',
+                   wraps=recovery_module.load_job_manifest) as read_manifest:
+            self.assertTrue(self.manager._should_job_be_locked("running-job"))
+            self.assertTrue(self.manager._should_job_be_locked("running-job"))
+            self.assertEqual(read_manifest.call_count, 1)
+
+            self._set_status(job_dir, "PENDING")
+            os.utime(os.path.join(job_dir, "job_manifest.json"), ns=(0, 1))
+            self.assertFalse(self.manager._should_job_be_locked("running-job"))
+            self.assertEqual(read_manifest.call_count, 2)
+
+    def test_removed_job_directory_is_noticed(self):
+        """A job directory removed after a lookup is reported missing on the next one."""
+        self.assertEqual(self.manager.reattach_to_running_job("done-job", process_check=False)["status"], "SUCCESS")
+
+        shutil.rmtree(os.path.join(self.jobs_dir, "done-job"))
+        errors = self.manager.reattach_to_running_job("done-job", process_check=False)["errors"]
+        self.assertEqual(errors, ["reattachment_check_failed: Job directory not found: done-job"])
+
+    def test_manifest_with_nan_is_readable(self):
+        """Manifests the state loader accepts (NaN metrics) do not break recovery checks."""
+        job_dir = os.path.join(self.jobs_dir, "running-job")
+        manifest_path = os.path.join(job_dir, "job_manifest.json")
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        manifest["metrics"] = {"cumulative_cost": float("nan")}
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+
+        self.assertTrue(self.manager._should_job_be_locked("running-job"))
+
+    def test_generate_consistency_recommendations(self):
+        """Issues map to deduplicated recommendations by kind."""
+        recommendations = self.manager._generate_consistency_recommendations([
+            "missing_required_field: job_id",
+            "missing_required_field: metrics",
+            "old_temp_files: 2 files older than 1 hour",
+        ])
+
+        self.assertEqual(recommendations, [
+            "run_job_validation_and_repair",
+            "cleanup_temporary_files",
+        ])
+
+    def test_generate_consistency_recommendations_fallback(self):
+        """Unknown issues fall back to a full recovery recommendation."""
+        recommendations = self.manager._generate_consistency_recommendations(["cannot_check_temp_files"])
+        self.assertEqual(recommendations, ["run_full_job_recovery"])
+
+    def test_check_orphaned_resources_old_temp_files(self):
+        """Temp files older than an hour are reported."""
+        temp_dir = os.path.join(self.jobs_dir, "running-job", "temp")
+        os.makedirs(temp_dir)
+        old_file = os.path.join(temp_dir, "stale.tmp")
+        open(old_file, 'w').close()
+        os.utime(old_file, (0, 0))
+        hidden_dir = os.path.join(temp_dir, ".cache")
+        os.makedirs(hidden_dir)
+        os.utime(hidden_dir, (0, 0))
+        open(os.path.join(temp_dir, "fresh.tmp"), 'w').close()
+
+        issues = self.manager._check_orphaned_resources("running-job", {})
+
+        # Hidden entries count too, as they did with the glob-based scan
+        self.assertEqual(issues, ["old_temp_files: 2 files older than 1 hour"])
+
+    def test_check_orphaned_resources_no_temp_dir(self):
+        """A job without a temp directory has no orphaned resources."""
+        self.assertEqual(self.manager._check_orphaned_resources("running-job", {}), [])
+
+    def test_recovery_status_report_skips_terminal_jobs(self):
+        """Terminal jobs are not validated or flagged for recovery."""
+        report = self.manager.get_recovery_status_report()
+
+        self.assertEqual(report["recovery_needed"], ["running-job"])
+        self.assertEqual(report["system_health"], "needs_attention")
+        self.assertFalse(report["scan_truncated"])
+
+    def test_recovery_status_report_stops_once_critical(self):
+        """Scanning stops as soon as most jobs provably need recovery."""
+        dir_manager = JobDirectoryManager(self.jobs_dir)
+        for job_id in ("broken-1", "broken-2", "broken-3"):
+            job_dir = dir_manager.create_job_directory(job_id, {})
+            self._set_status(job_dir, "BOGUS")
+
+        with patch.object(self.manager, 'validate_job_consistency',
+                          wraps=self.manager.validate_job_consistency) as validate:
+            report = self.manager.get_recovery_status_report()
+
+        self.assertEqual(report["system_health"], "critical")
+        self.assertTrue(report["scan_truncated"])
+        self.assertEqual(validate.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
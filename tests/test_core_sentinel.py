@@ -0,0 +1,283 @@
+"""
+Unit tests for ExecutionSentinel (core sentinel)
+
+Tests hang detection, manifest caching and intervention throttling.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from logist.core import sentinel as sentinel_module
+from logist.core.job_directory import JobDirectoryManager
+from logist.core.sentinel import (
+    EVENT_HANG, EVENT_LOG_FILENAME, ExecutionSentinel, HangSeverity, SentinelConfig, SentinelEventLog, job_id_hash
+)
+from logist.job_state import JobStateError
+
+
+class TestExecutionSentinel(unittest.TestCase):
+    """Test cases for ExecutionSentinel functionality."""
+
+    def setUp(self):
+        """Set up a jobs directory with one running job."""
+        self.jobs_dir = tempfile.mkdtemp()
+        dir_manager = JobDirectoryManager(self.jobs_dir)
+        dir_manager.ensure_base_structure()
+        self.job_dir = dir_manager.create_job_directory("running-job", {})
+        self._set_status("RUNNING")
+
+        self.config = SentinelConfig(auto_intervene=False, enable_resource_monitoring=False)
+        self.sentinel = ExecutionSentinel(self.jobs_dir, self.config)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.sentinel.stop_monitoring()
+        shutil.rmtree(self.jobs_dir)
+
+    def _set_status(self, status):
+        manifest_path = os.path.join(self.job_dir, "job_manifest.json")
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        manifest["status"] = status
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+
+    def test_cached_manifest_reloads_only_on_change(self):
+        """Unchanged manifests are parsed once; rewrites are picked up."""
+        with patch('logist.core.sentinel.load_job_manifest',
+                   wraps=sentinel_module.load_job_manifest) as load:
+            self.assertEqual(self.sentinel._cached_manifest("running-job")["status"], "RUNNING")
+            self.assertEqual(self.sentinel._cached_manifest("running-job")["status"], "RUNNING")
+            self.assertEqual(load.call_count, 1)
+
+            self._set_status("PENDING")
+            os.utime(os.path.join(self.job_dir, "job_manifest.json"), ns=(0, 1))
+            self.assertEqual(self.sentinel._cached_manifest("running-job")["status"], "PENDING")
+            self.assertEqual(load.call_count, 2)
+
+    def test_job_directory_is_resolved_on_every_lookup(self):
+        """A job directory moved to a new jobs directory is found there on the next lookup."""
+        self.assertEqual(self.sentinel._cached_manifest("running-job")["status"], "RUNNING")
+
+        new_jobs_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, new_jobs_dir)
+        shutil.move(self.job_dir, os.path.join(new_jobs_dir, "running-job"))
+        self.sentinel.dir_manager = JobDirectoryManager(new_jobs_dir)
+
+        self.assertEqual(self.sentinel._cached_manifest("running-job")["job_id"], "running-job")
+
+        shutil.rmtree(os.path.join(new_jobs_dir, "running-job"))
+        with self.assertRaisesRegex(JobStateError, "Job directory not found"):
+            self.sentinel._cached_manifest("running-job")
+
+    def test_cpu_sample_is_non_blocking_delta(self):
+        """CPU usage is computed from successive samples without sleeping."""
+        process = MagicMock(pid=1234)
+        process.cpu_times.return_value = MagicMock(user=1.0, system=0.0)
+
+        with patch('logist.core.sentinel.time.monotonic', side_effect=[10.0, 12.0]):
+            self.assertIsNone(self.sentinel._sample_cpu_percent("running-job", process))
+            process.cpu_times.return_value = MagicMock(user=2.0, system=1.0)
+            self.assertEqual(self.sentinel._sample_cpu_percent("running-job", process), 100.0)
+
+    def test_refresh_active_jobs_parses_only_changed_manifests(self):
+        """Refreshes skip unchanged manifests and treat rewrites as activity."""
+        self.sentinel._refresh_active_jobs()
+        self.assertEqual(self.sentinel.active_jobs, {"running-job"})
+        self.sentinel.last_activity["running-job"] = 0.0
+
+        with patch('logist.core.sentinel.load_job_manifest',
+                   wraps=sentinel_module.load_job_manifest) as load:
+            self.sentinel._refresh_active_jobs()
+            self.assertEqual(load.call_count, 0)
+            self.assertEqual(self.sentinel.last_activity["running-job"], 0.0)
+
+            self._set_status("SUCCESS")
+            os.utime(os.path.join(self.job_dir, "job_manifest.json"), ns=(0, 1))
+            self.sentinel._refresh_active_jobs()
+            self.assertEqual(load.call_count, 1)
+            self.assertEqual(self.sentinel.active_jobs, set())
+
+    def test_status_change_schedules_deadline_for_new_status(self):
+        """A status change reschedules the job with the new status's timeout."""
+        config = SentinelConfig(auto_intervene=False, enable_resource_monitoring=False,
+                                worker_timeout=1800, supervisor_timeout=900, critical_timeout=3600)
+        sentinel = ExecutionSentinel(self.jobs_dir, config)
+        sentinel._refresh_active_jobs()
+
+        self._set_status("REVIEWING")
+        os.utime(os.path.join(self.job_dir, "job_manifest.json"), ns=(0, 1))
+        sentinel._refresh_active_jobs()
+
+        stamp = sentinel.last_activity["running-job"]
+        live = [deadline for deadline, entry_stamp, job_id in sentinel._deadline_heap
+                if job_id == "running-job" and entry_stamp == stamp]
+        self.assertEqual(live, [stamp + 900])
+
+    def test_monitoring_cycle_checks_only_due_jobs(self):
+        """Jobs are only checked once their earliest timeout deadline passes."""
+        self.sentinel.add_job("running-job")
+
+        with patch.object(self.sentinel, 'check_job_timeout', return_value=None) as check:
+            self.sentinel._perform_monitoring_cycle()
+            check.assert_not_called()
+
+            self.sentinel.last_activity["running-job"] = time.monotonic() - 10 ** 6
+            self.sentinel._push_deadline("running-job")
+            self.sentinel._perform_monitoring_cycle()
+            check.assert_called_once_with("running-job", self.sentinel._cached_manifest("running-job"))
+
+    def test_monitoring_cycle_loads_manifest_once(self):
+        """Timeout check and intervention share the manifest loaded by the cycle."""
+        sentinel = ExecutionSentinel(self.jobs_dir, SentinelConfig(auto_intervene=True))
+        sentinel.add_job("running-job")
+        sentinel.last_activity["running-job"] = time.monotonic() - 10 ** 6
+        sentinel._push_deadline("running-job")
+
+        with patch.object(sentinel, '_cached_manifest', wraps=sentinel._cached_manifest) as cached, \
+                patch.object(sentinel, 'intervene_in_hung_job',
+                             return_value={"intervention_performed": False}) as intervene:
+            sentinel._perform_monitoring_cycle()
+
+        self.assertEqual(cached.call_count, 1)
+        hang, manifest = intervene.call_args[0]
+        self.assertEqual(manifest["status"], "RUNNING")
+        self.assertEqual(set(hang.metadata), {"job_status", "timeout_threshold"})
+
+    def test_hung_job_detected_every_cycle(self):
+        """A hung job stays scheduled until its activity changes."""
+        self.sentinel.add_job("running-job")
+        self.sentinel.last_activity["running-job"] = time.monotonic() - 10 ** 6
+        self.sentinel._push_deadline("running-job")
+
+        self.sentinel._perform_monitoring_cycle()
+        self.sentinel._perform_monitoring_cycle()
+
+        self.assertEqual(len(self.sentinel.hang_detections), 2)
+
+        self.sentinel.update_activity("running-job")
+        self.sentinel._perform_monitoring_cycle()
+        self.assertEqual(len(self.sentinel.hang_detections), 2)
+
+    def test_hang_history_is_bounded(self):
+        """Only the most recent hangs are kept, but all are counted."""
+        sentinel = ExecutionSentinel(self.jobs_dir, SentinelConfig(auto_intervene=False, max_hang_history=3))
+        sentinel.add_job("running-job")
+        sentinel.last_activity["running-job"] = time.monotonic() - 10 ** 6
+        sentinel._push_deadline("running-job")
+
+        for _ in range(5):
+            sentinel._perform_monitoring_cycle()
+
+        self.assertEqual(len(sentinel.hang_detections), 3)
+        self.assertEqual(len(sentinel.get_recent_hangs(2)), 2)
+        report = sentinel.get_status_report()
+        self.assertEqual(report["hangs_detected"], 5)
+        self.assertEqual(len(report["recent_hangs"]), 3)
+
+    def test_intervention_limit_uses_sliding_window(self):
+        """The hourly limit frees up again once old interventions age out."""
+        sentinel = ExecutionSentinel(self.jobs_dir, SentinelConfig(max_interventions_per_hour=2))
+        now = time.monotonic()
+
+        sentinel._intervention_times.extend([now - 10, now - 5])
+        sentinel.intervention_count = 2
+        self.assertFalse(sentinel._can_intervene())
+
+        sentinel._intervention_times.clear()
+        sentinel._intervention_times.extend([now - 4000, now - 5])
+        self.assertTrue(sentinel._can_intervene())
+        self.assertEqual(len(sentinel._intervention_times), 1)
+
+    def test_calculate_hang_severity(self):
+        """Severity boundaries fall on the configured ratio cutoffs."""
+        cases = [(100, HangSeverity.LOW), (149, HangSeverity.LOW), (150, HangSeverity.MEDIUM),
+                 (200, HangSeverity.HIGH), (299, HangSeverity.HIGH), (300, HangSeverity.CRITICAL)]
+        for actual, severity in cases:
+            self.assertEqual(self.sentinel._calculate_hang_severity(actual, 100), severity)
+
+
+    def test_hangs_are_persisted_to_event_log(self):
+        """Hang detections survive into a new sentinel on the same directory."""
+        self.sentinel.add_job("running-job")
+        self.sentinel.last_activity["running-job"] = time.monotonic() - 10 ** 6
+        self.sentinel._push_deadline("running-job")
+        self.sentinel.event_log = self.sentinel._open_event_log()
+        self.sentinel._perform_monitoring_cycle()
+        self.sentinel.event_log.close()
+
+        log = SentinelEventLog(os.path.join(self.jobs_dir, EVENT_LOG_FILENAME), self.config.event_log_records)
+        events = log.read()
+        log.close()
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["job_hash"], job_id_hash("running-job"))
+        self.assertEqual(events[0]["kind"], EVENT_HANG)
+        self.assertEqual(events[0]["severity"], "critical")
+
+
+    def test_event_log_is_opened_by_monitoring(self):
+        """A sentinel that never monitors leaves no event log behind."""
+        path = os.path.join(self.jobs_dir, EVENT_LOG_FILENAME)
+        self.assertIsNone(self.sentinel.event_log)
+        self.assertFalse(os.path.exists(path))
+
+        self.sentinel.start_monitoring()
+        self.assertIsNotNone(self.sentinel.event_log)
+        self.assertTrue(os.path.exists(path))
+
+        self.sentinel.stop_monitoring()
+        self.assertIsNone(self.sentinel.event_log)
+
+
+class TestSentinelEventLog(unittest.TestCase):
+    """Test cases for the memory-mapped sentinel event ring."""
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.log_dir, "sentinel.events")
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir)
+
+    def test_ring_keeps_newest_records(self):
+        """Once full, the oldest records are overwritten."""
+        log = SentinelEventLog(self.path, capacity=3)
+        for duration in range(5):
+            log.append(EVENT_HANG, "job", HangSeverity.LOW, float(duration))
+        log.close()
+
+        reopened = SentinelEventLog(self.path, capacity=3)
+        self.assertEqual([e["duration"] for e in reopened.read()], [2.0, 3.0, 4.0])
+        reopened.close()
+
+    def test_shared_log_keeps_every_writers_records(self):
+        """Logs opened on the same file append after each other's records."""
+        first = SentinelEventLog(self.path, capacity=8)
+        second = SentinelEventLog(self.path, capacity=8)
+        first.append(EVENT_HANG, "job", HangSeverity.LOW, 1.0)
+        second.append(EVENT_HANG, "job", HangSeverity.LOW, 2.0)
+        first.append(EVENT_HANG, "job", HangSeverity.LOW, 3.0)
+
+        self.assertEqual([e["duration"] for e in second.read()], [1.0, 2.0, 3.0])
+        first.close()
+        second.close()
+
+    def test_capacity_change_resets_log(self):
+        """A log opened with a different capacity starts empty."""
+        log = SentinelEventLog(self.path, capacity=3)
+        log.append(EVENT_HANG, "job", HangSeverity.LOW, 1.0)
+        log.close()
+
+        resized = SentinelEventLog(self.path, capacity=5)
+        self.assertEqual(resized.read(), [])
+        resized.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit tests for ErrorClassifier (error classification)
+
+Tests subprocess and system error classification.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from logist import error_classification
+from logist.error_classification import (
+    ErrorCategory, ErrorClassifier, ErrorSeverity, get_retry_delay, should_retry_error
+)
+
+
+class TestErrorClassifier(unittest.TestCase):
+    """Test cases for ErrorClassifier functionality."""
+
+    def setUp(self):
+        self.classifier = ErrorClassifier()
+
+    def test_subprocess_error_precedence(self):
+        """Authentication outranks quota, which outranks network, wherever they appear."""
+        cases = [
+            ("connection reset\nRate Limit hit\nbad API key", ErrorCategory.CONFIGURATION),
+            ("connection reset, quota exceeded", ErrorCategory.RESOURCE),
+            ("Network unreachable", ErrorCategory.NETWORK),
+            ("something else", ErrorCategory.EXECUTION),
+        ]
+        for stderr, category in cases:
+            classification = self.classifier.classify_subprocess_error(1, stderr, "")
+            self.assertEqual(classification.category, category, stderr)
+
+        from_stdout = self.classifier.classify_subprocess_error(1, "", "Authentication failed")
+        self.assertEqual(from_stdout.category, ErrorCategory.CONFIGURATION)
+
+    def test_subprocess_exit_codes(self):
+        """Exit codes other than 1 are classified without looking at the output."""
+        self.assertEqual(self.classifier.classify_subprocess_error(124, "api key", "").category,
+                         ErrorCategory.EXECUTION)
+        self.assertEqual(self.classifier.classify_subprocess_error(2, "", "").category,
+                         ErrorCategory.SYSTEM)
+
+    def test_repeated_output_is_scanned_once(self):
+        """Identical output is classified from the remembered scan, with a new correlation ID."""
+        with patch('logist.error_classification._matched_kinds',
+                   wraps=error_classification._matched_kinds) as scan:
+            first = self.classifier.classify_subprocess_error(1, "rate limit", "")
+            second = self.classifier.classify_subprocess_error(1, "rate " + "limit", "")
+            self.classifier.classify_subprocess_error(1, "", "rate limit")
+
+        self.assertEqual(scan.call_count, 2)
+        self.assertEqual(second.category, ErrorCategory.RESOURCE)
+        self.assertNotEqual(first.correlation_id, second.correlation_id)
+
+    def test_correlation_ids_are_unique(self):
+        """Correlation IDs differ per error and per classifier."""
+        ids = {self.classifier.classify_timeout_error(5, "op").correlation_id for _ in range(100)}
+        self.assertEqual(len(ids), 100)
+        self.assertNotIn(ErrorClassifier()._generate_correlation_id(), ids)
+
+    def test_correlation_ids_are_unique_across_threads(self):
+        """Threads sharing a classifier never get the same correlation ID."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: self.classifier._generate_correlation_id(), range(2000)))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_system_error_disk_needs_both_words(self):
+        """Disk exhaustion needs "disk" together with "full" or "space"."""
+        full = self.classifier.classify_system_error(OSError("No space left on Disk"), "write")
+        self.assertEqual(full.category, ErrorCategory.RESOURCE)
+        self.assertEqual(full.severity, ErrorSeverity.FATAL)
+
+        other = self.classifier.classify_system_error(OSError("disk quota"), "write")
+        self.assertEqual(other.category, ErrorCategory.SYSTEM)
+
+        denied = self.classifier.classify_system_error(OSError("Permission denied: disk full"), "write")
+        self.assertEqual(denied.description, "Permission denied during write")
+
+
+    def test_retry_delays_by_category(self):
+        """Network errors back off exponentially, resource errors linearly, others stay short."""
+        network = self.classifier.classify_subprocess_error(1, "connection refused", "")
+        quota = self.classifier.classify_subprocess_error(1, "rate limit", "")
+        other = self.classifier.classify_system_error(OSError("boom"), "write")
+
+        self.assertEqual([get_retry_delay(network, n) for n in range(4)], [1.0, 2.0, 4.0, 8.0])
+        self.assertEqual(get_retry_delay(network, -1), 0.5)
+        self.assertEqual(get_retry_delay(network, 1.5), 2.0 ** 1.5)
+        self.assertEqual([get_retry_delay(quota, n) for n in range(3)], [30.0, 60.0, 90.0])
+        self.assertEqual([get_retry_delay(other, n) for n in range(3)], [1.0, 1.0, 1.0])
+
+        self.assertTrue(should_retry_error(network, 2))
+        self.assertFalse(should_retry_error(network, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,13 +3,16 @@
 Tests for Logist job context assembly functionality.
 """
 
+import io
 import json
 import os
 import pytest
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from logist.job_context import assemble_job_context
+from logist import job_context
+from logist.job_context import assemble_job_context, format_llm_prompt, write_llm_prompt
 
 
 class TestJobContextAssembly:
@@ -143,6 +146,11 @@ class TestJobContextAssembly:
         assert context["system_instructions"] == expected_instructions
         assert context["job_metrics_summary"] == "Total cost: $2.5000, Total time: 30.00s"
 
+        # The manifest projection leaves out what is already summarized
+        assert context["manifest_version"]["job_id"] == "test-job"
+        assert "history" not in context["manifest_version"]
+        assert "phases" not in context["manifest_version"]
+
     def test_context_assembly_with_missing_job_manifest(self):
         """Test context assembly handles missing job manifest gracefully."""
         # Use minimal manifest
@@ -185,4 +193,135 @@ class TestJobContextAssembly:
 
         # Should still have workspace_files field, even if empty
         assert "workspace_files" in context
-        assert isinstance(context["workspace_files"], dict)
\ No newline at end of file
+        assert isinstance(context["workspace_files"], dict)
+
+    def test_system_instructions_reread_only_on_change(self):
+        """system.md is read once until it changes on disk."""
+        system_md = self.jobs_dir / "system.md"
+        system_md.write_text("v1")
+        manifest = {"job_id": "test-job"}
+
+        def instructions():
+            return assemble_job_context(str(self.job_dir), manifest, str(self.jobs_dir), enhance=True)["system_instructions"]
+
+        with patch('logist.job_context.open', create=True, side_effect=open) as opened:
+            assert instructions() == "v1"
+            assert instructions() == "v1"
+            assert opened.call_count == 1
+
+            system_md.write_text("version 2")
+            assert instructions() == "version 2"
+            assert opened.call_count == 2
+
+    def test_history_summary_keeps_last_five_in_order(self):
+        """Only the five most recent history entries are summarized, oldest first."""
+        manifest = {
+            "job_id": "test-job",
+            "history": [{"role": "Worker", "action": f"A{i}", "summary": f"s{i}"} for i in range(7)],
+        }
+
+        context = assemble_job_context(str(self.job_dir), manifest, str(self.jobs_dir), enhance=True)
+
+        assert context["job_history_summary"] == "\n".join(f"- Worker: A{i} - s{i}" for i in range(2, 7))
+
+    def test_format_llm_prompt_renders_used_fields(self):
+        """The human-readable prompt reflects the fields it uses; unknown formats raise."""
+        context = {"job_id": "test-job", "workspace_files": {"files": ["a.py"]}}
+
+        prompt = format_llm_prompt(context)
+        assert prompt.startswith("Job ID: test-job\n")
+        assert "No system instructions available." in prompt
+        assert "b.py" in format_llm_prompt({**context, "workspace_files": {"files": ["b.py"]}})
+
+        with pytest.raises(ValueError):
+            format_llm_prompt(context, "xml")
+
+    def test_format_llm_prompt_compact_unless_pretty(self):
+        """Embedded JSON is compact by default and indented only when asked."""
+        context = {"job_id": "test-job", "workspace_files": {"files": ["a.py"]}}
+
+        assert '{"files":["a.py"]}' in format_llm_prompt(context)
+        assert '{\n  "files": [\n    "a.py"\n  ]\n}' in format_llm_prompt(context, pretty=True)
+        assert format_llm_prompt(context, "json-files", pretty=True).startswith('{\n  "job_id"')
+
+    def test_minimal_context_skips_enhanced_work(self):
+        """The minimal context neither runs git nor reads system.md."""
+        (self.jobs_dir / "system.md").write_text("instructions")
+        manifest = {"job_id": "test-job", "history": [{"role": "Worker"}]}
+
+        with patch('logist.job_context.workspace_utils.get_workspace_git_status') as git_status, \
+                patch('logist.job_context._read_instructions') as read:
+            context = assemble_job_context(str(self.job_dir), manifest, str(self.jobs_dir), enhance=False)
+
+        git_status.assert_not_called()
+        read.assert_not_called()
+        assert set(context) == {"job_id", "description", "status", "current_phase", "workspace_files"}
+
+    def test_workspace_key_files_reread_only_on_change(self):
+        """Key workspace files are read once until they change on disk."""
+        workspace_dir = self.job_dir / "workspace"
+        workspace_dir.mkdir()
+        readme = workspace_dir / "README.md"
+        readme.write_text("v1")
+        manifest = {"job_id": "test-job"}
+
+        def key_files():
+            return assemble_job_context(str(self.job_dir), manifest, str(self.jobs_dir))["workspace_files"]["important_files"]
+
+        with patch('logist.job_context.workspace_utils.verify_workspace_exists', return_value=True), \
+                patch('logist.workspace_utils.open', create=True, side_effect=open) as opened:
+            assert key_files() == {"README.md": "v1"}
+            assert key_files() == {"README.md": "v1"}
+            assert opened.call_count == 1
+
+            readme.write_text("version 2")
+            assert key_files() == {"README.md": "version 2"}
+            assert opened.call_count == 2
+
+    def test_write_llm_prompt_matches_format_llm_prompt(self):
+        """Writing a prompt produces the same text format_llm_prompt returns."""
+        context = {"job_id": "test-job", "description": "Test", "workspace_files": {"files": ["a.py"]}}
+
+        for format_type in ("human-readable", "json-files"):
+            for pretty in (False, True):
+                out = io.StringIO()
+                write_llm_prompt(out, context, format_type, pretty=pretty)
+                assert out.getvalue() == format_llm_prompt(context, format_type, pretty=pretty)
+
+    def test_phase_spec_lookup_follows_in_place_edits(self):
+        """The current phase spec reflects edits made to the phase list in place."""
+        phases = [{"name": "build"}, {"name": "test"}]
+        manifest = {"job_id": "test-job", "current_phase": "test", "phases": phases}
+
+        def phase_spec():
+            return assemble_job_context(str(self.job_dir), manifest, str(self.jobs_dir), enhance=True)["phase_specification"]
+
+        assert phase_spec() is phases[1]
+
+        phases[1] = {"name": "test", "retries": 1}
+        assert phase_spec() is phases[1]
+
+        phases[1]["name"] = "verify"
+        assert phase_spec() is None
+
+    def test_outcome_written_elsewhere_is_seen_at_once(self):
+        """An outcome that appears after a lookup found none is picked up by the next one."""
+        from logist.job_context import enhance_context_with_previous_outcome
+
+        assert enhance_context_with_previous_outcome({}, str(self.job_dir)) == {}
+
+        (self.job_dir / "latest-outcome.json").write_text('{"action": "COMPLETED"}')
+        context = enhance_context_with_previous_outcome({}, str(self.job_dir))
+        assert context["previous_outcome"]["action"] == "COMPLETED"
+
+    def test_registered_prompt_format(self):
+        """Registered formats are used by both prompt entry points."""
+        job_context.register_llm_prompt_format(
+            "id-only", lambda context, pretty: ["id=", str(context.get("job_id"))])
+        try:
+            assert format_llm_prompt({"job_id": "test-job"}, "id-only") == "id=test-job"
+            out = io.StringIO()
+            write_llm_prompt(out, {"job_id": "other"}, "id-only")
+            assert out.getvalue() == "id=other"
+        finally:
+            del job_context._FORMATTERS["id-only"]
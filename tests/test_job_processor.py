@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for Logist LLM response parsing, validation and CLINE execution helpers.
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from logist import job_processor
+from logist.job_processor import (
+    JobProcessorError, execute_llm_with_cline, find_llm_response_in_conversation, parse_llm_response, validate_evidence_files,
+    validate_llm_response
+)
+
+
+VALID_RESPONSE = {
+    "action": "COMPLETED",
+    "evidence_files": ["out.txt"],
+    "summary_for_supervisor": "Done",
+}
+
+
+class TestLLMResponseValidation:
+    """Test LLM response schema validation."""
+
+    def test_valid_response_passes(self):
+        """A response with the required fields validates."""
+        validate_llm_response(VALID_RESPONSE)
+
+    def test_invalid_responses_are_reported(self):
+        """Missing fields, bad enums and extra keys are rejected with the schema message."""
+        with pytest.raises(JobProcessorError, match="'action' is a required property"):
+            validate_llm_response({"evidence_files": [], "summary_for_supervisor": ""})
+        with pytest.raises(JobProcessorError, match="'DONE' is not one of"):
+            validate_llm_response({**VALID_RESPONSE, "action": "DONE"})
+        with pytest.raises(JobProcessorError, match="Additional properties"):
+            validate_llm_response({**VALID_RESPONSE, "extra": 1})
+
+
+class TestLLMResponseParsing:
+    """Test extraction of the JSON response from LLM output."""
+
+    def test_fenced_block_is_preferred(self):
+        """A ```json block is used even when other braces surround it."""
+        output = "Plan: {draft}\n```json\n" + json.dumps(VALID_RESPONSE) + "\n```\nbye {}"
+        assert parse_llm_response(output) == VALID_RESPONSE
+
+    def test_bare_object_is_found(self):
+        """Without a fenced block, the outermost braces are parsed."""
+        assert parse_llm_response("Result: " + json.dumps(VALID_RESPONSE) + " end") == VALID_RESPONSE
+
+    def test_clean_output_is_parsed_without_searching(self):
+        """Output that is only the response object skips the fenced-block search."""
+        with patch('logist.job_processor._JSON_BLOCK_RE') as block_re:
+            assert parse_llm_response("\n" + json.dumps(VALID_RESPONSE) + "\n") == VALID_RESPONSE
+        block_re.search.assert_not_called()
+
+    def test_missing_json_is_reported(self):
+        """Output without any JSON object raises."""
+        with pytest.raises(JobProcessorError, match="Could not find valid JSON"):
+            parse_llm_response("no json here")
+
+
+class TestConversationSearch:
+    """Test locating the final response in a CLINE conversation."""
+
+    def test_latest_assistant_response_wins(self):
+        """Only assistant messages count, newest first, including text blocks."""
+        older = {**VALID_RESPONSE, "summary_for_supervisor": "older"}
+        history = [
+            {"role": "assistant", "content": json.dumps(older)},
+            {"role": "assistant", "content": [
+                {"type": "tool_use", "input": {"text": "{}"}},
+                {"type": "text", "text": "```json\n" + json.dumps(VALID_RESPONSE) + "\n```"},
+            ]},
+            {"role": "user", "content": json.dumps({**VALID_RESPONSE, "summary_for_supervisor": "user"})},
+            {"role": "assistant", "content": "All done, no JSON here."},
+        ]
+
+        assert find_llm_response_in_conversation(history) == VALID_RESPONSE
+        assert find_llm_response_in_conversation(history[:1]) == older
+        assert find_llm_response_in_conversation(history[2:]) is None
+
+    def test_task_files_load_with_stdlib_fallback(self, tmp_path):
+        """CLINE task files parse through the fast path and fall back for NaN."""
+        metadata = tmp_path / "metadata.json"
+        metadata.write_text('{"metrics": {"cost_usd": 0.5}}')
+        assert job_processor._load_json_file(str(metadata)) == {"metrics": {"cost_usd": 0.5}}
+
+        metadata.write_text('{"metrics": {"cost_usd": NaN}}')
+        assert job_processor._load_json_file(str(metadata))["metrics"]["cost_usd"] != 0.0
+
+
+class TestEvidenceFiles:
+    """Test evidence file validation."""
+
+    def test_evidence_files_resolve_inside_workspace(self, tmp_path):
+        """Existing files are returned relative to the workspace; others raise."""
+        (tmp_path / "out.txt").write_text("ok")
+        (tmp_path / "reports").mkdir()
+
+        assert validate_evidence_files(["out.txt", "/out.txt"], str(tmp_path)) == ["out.txt", "out.txt"]
+        with pytest.raises(JobProcessorError, match="Evidence file not found: missing.txt"):
+            validate_evidence_files(["missing.txt"], str(tmp_path))
+        with pytest.raises(JobProcessorError, match="Evidence path is not a file: reports"):
+            validate_evidence_files(["reports"], str(tmp_path))
+
+
+class TestClineExecution:
+    """Test CLINE execution plumbing that runs without CLINE."""
+
+    def test_dry_run_removes_prompt_file(self, tmp_path):
+        """The temporary prompt file is written and cleaned up."""
+        with patch('logist.job_processor._prompt_tmp_dir', return_value=str(tmp_path)):
+            response, execution_time = execute_llm_with_cline({"job_id": "test-job"}, dry_run=True)
+
+        assert response["action"] == "COMPLETED"
+        assert execution_time == 0.0
+        assert list(tmp_path.iterdir()) == []
@@ -5,12 +5,15 @@ This module tests the enhanced state machine with DRAFT/PENDING/SUSPENDED states
 including transition validation, invalid transition blocking, and lifecycle management.
 """
 
+import json
+import threading
+
 import pytest
 from unittest.mock import patch, MagicMock
 
 from logist.job_state import (
     JobStates, JobStateError, transition_state, validate_state_transition,
-    load_job_manifest, update_job_manifest
+    load_job_manifest, save_job_manifest, update_job_manifest
 )
 from logist.services.job_manager import JobManagerService
 
@@ -377,4 +380,97 @@ class TestStateMachineErrorHandling:
         with pytest.raises(JobStateError) as exc_info:
             validate_state_transition(JobStates.DRAFT, JobStates.RUNNING)
 
-        assert "DRAFT jobs can only transition to" in str(exc_info.value)
\ No newline at end of file
+        assert "DRAFT jobs can only transition to" in str(exc_info.value)
+
+
+class TestManifestLoading:
+    """Test loading job manifests from disk."""
+
+    def test_load_manifest_accepts_nan(self, tmp_path):
+        """Manifests the fast parser rejects still load via stdlib json."""
+        (tmp_path / "job_manifest.json").write_text('{"status": "PENDING", "metrics": {"cost": NaN}}')
+
+        manifest = load_job_manifest(str(tmp_path))
+
+        assert manifest["status"] == "PENDING"
+        assert manifest["metrics"]["cost"] != manifest["metrics"]["cost"]
+
+    def test_load_manifest_invalid_json(self, tmp_path):
+        """Invalid JSON raises JobStateError with or without orjson."""
+        (tmp_path / "job_manifest.json").write_text("{not json")
+
+        with pytest.raises(JobStateError, match="Invalid job manifest JSON"):
+            load_job_manifest(str(tmp_path))
+        with patch('logist.job_state.orjson', None):
+            with pytest.raises(JobStateError, match="Invalid job manifest JSON"):
+                load_job_manifest(str(tmp_path))
+
+    def test_save_manifest_round_trip(self, tmp_path):
+        """Saved manifests load back unchanged and leave no temp file behind."""
+        manifest = {"status": "RUNNING", "history": [{"event": "é"}]}
+
+        save_job_manifest(str(tmp_path), manifest)
+        assert load_job_manifest(str(tmp_path)) == manifest
+        with patch('logist.job_state.orjson', None):
+            save_job_manifest(str(tmp_path), manifest)
+        assert load_job_manifest(str(tmp_path)) == manifest
+
+        assert [p.name for p in tmp_path.iterdir()] == ["job_manifest.json"]
+
+    def test_save_manifest_failure_keeps_original(self, tmp_path):
+        """A failed write leaves the previous manifest intact."""
+        save_job_manifest(str(tmp_path), {"status": "PENDING"})
+
+        with patch('logist.job_state.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(JobStateError, match="Failed to write updated manifest"):
+                save_job_manifest(str(tmp_path), {"status": "RUNNING"})
+
+        assert load_job_manifest(str(tmp_path)) == {"status": "PENDING"}
+        assert [p.name for p in tmp_path.iterdir()] == ["job_manifest.json"]
+
+    def test_save_manifest_skips_unchanged_content(self, tmp_path):
+        """Re-saving identical content does not rewrite the file unless it changed on disk."""
+        manifest_path = tmp_path / "job_manifest.json"
+        save_job_manifest(str(tmp_path), {"status": "PENDING"})
+
+        with patch('logist.job_state.os.replace') as replace:
+            save_job_manifest(str(tmp_path), {"status": "PENDING"})
+        replace.assert_not_called()
+
+        manifest_path.write_text('{"status": "CANCELED"}')
+        save_job_manifest(str(tmp_path), {"status": "PENDING"})
+        assert load_job_manifest(str(tmp_path)) == {"status": "PENDING"}
+
+    def test_save_manifest_streams_without_orjson(self, tmp_path):
+        """The streamed stdlib output matches json.dumps and still skips unchanged saves."""
+        manifest = {"status": "RUNNING", "history": [{"event": "é", "n": i} for i in range(3)]}
+
+        with patch('logist.job_state.orjson', None):
+            save_job_manifest(str(tmp_path), manifest)
+            with patch('logist.job_state.os.replace') as replace:
+                save_job_manifest(str(tmp_path), manifest)
+            replace.assert_not_called()
+
+        assert (tmp_path / "job_manifest.json").read_text() == json.dumps(manifest, indent=2)
+        assert [p.name for p in tmp_path.iterdir()] == ["job_manifest.json"]
+
+    def test_save_manifest_concurrent_threads(self, tmp_path):
+        """Writers on different threads never replace each other's temp file."""
+        errors = []
+
+        def writer(n):
+            try:
+                for i in range(50):
+                    save_job_manifest(str(tmp_path), {"status": "RUNNING", "writer": n, "i": i})
+            except JobStateError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert load_job_manifest(str(tmp_path))["i"] == 49
+        assert [p.name for p in tmp_path.iterdir()] == ["job_manifest.json"]